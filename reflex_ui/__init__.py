@@ -24,6 +24,7 @@ _REFLEX_UI_MAPPING = {
     "components.base.select": ["select"],
     "components.base.skeleton": ["skeleton"],
     "components.base.slider": ["slider"],
+    "components.base.suspense": ["suspense"],
     "components.base.switch": ["switch"],
     "components.base.tabs": ["tabs"],
     "components.base.textarea": ["textarea"],
@@ -40,6 +41,7 @@ _SUBMOD_ATTRS = {
     "components.icons.hugeicon": ["hi", "icon"],
     "components.icons.simple_icon": ["simple_icon"],
     "components.icons.others": ["spinner", "select_arrow", "arrow_svg"],
+    "utils.collection": ["batched_collection"],
     "utils.twmerge": ["cn"],
 }
 
@@ -26,6 +26,7 @@ from .components.base.scroll_area import scroll_area
 from .components.base.select import select
 from .components.base.skeleton import skeleton
 from .components.base.slider import slider
+from .components.base.suspense import suspense
 from .components.base.switch import switch
 from .components.base.tabs import tabs
 from .components.base.textarea import textarea
@@ -36,6 +37,7 @@ from .components.base.tooltip import tooltip
 from .components.icons.hugeicon import hi, icon
 from .components.icons.others import arrow_svg, select_arrow, spinner
 from .components.icons.simple_icon import simple_icon
+from .utils.collection import batched_collection
 from .utils.twmerge import cn
 
 _REFLEX_UI_MAPPING = {
@@ -60,6 +62,7 @@ _REFLEX_UI_MAPPING = {
     "components.base.select": ["select"],
     "components.base.skeleton": ["skeleton"],
     "components.base.slider": ["slider"],
+    "components.base.suspense": ["suspense"],
     "components.base.switch": ["switch"],
     "components.base.tabs": ["tabs"],
     "components.base.textarea": ["textarea"],
@@ -75,6 +78,7 @@ _SUBMOD_ATTRS = {
     "components.icons.hugeicon": ["hi", "icon"],
     "components.icons.simple_icon": ["simple_icon"],
     "components.icons.others": ["spinner", "select_arrow", "arrow_svg"],
+    "utils.collection": ["batched_collection"],
     "utils.twmerge": ["cn"],
 }
 
@@ -84,6 +88,7 @@ __all__ = [
     "avatar",
     "badge",
     "base",
+    "batched_collection",
     "button",
     "card",
     "checkbox",
@@ -109,6 +114,7 @@ __all__ = [
     "skeleton",
     "slider",
     "spinner",
+    "suspense",
     "switch",
     "tabs",
     "textarea",
@@ -4,6 +4,8 @@ import os
 
 import reflex as rx
 
+from reflex_ui.blocks.scripts import SCRIPT_REGISTRY_SCRIPT, run_once
+
 DEFAULT_CAL_FORM = os.getenv(
     "DEFAULT_CAL_FORM", "forms/f87bd9b2-b339-4915-b4d4-0098e2db4394"
 )
@@ -45,16 +47,23 @@ class CalcomPopupEmbed(rx.Fragment):
             "@calcom/embed-react@1.5.3": rx.ImportVar("getCalApi"),
         }
 
+    def add_custom_code(self) -> list[str]:
+        """Add the script registry runtime.
+
+        Returns:
+            The registry runtime code
+        """
+        return [SCRIPT_REGISTRY_SCRIPT]
+
     def add_hooks(self) -> list[str | rx.Var[object]]:
         """Add React hooks for Cal.com API initialization.
 
+        The API is initialized once per page, however many embeds are mounted.
+
         Returns:
             List of hook code strings to initialize Cal.com
         """
-        return [
-            """
-useEffect(() => {
-  (async function () {
+        initialize = """async () => {
     const cal = await getCalApi({ namespace: "talk" });
     cal("ui", {
       hideEventTypeDetails: false,
@@ -63,8 +72,12 @@ useEffect(() => {
         branding: { brandColor: "#6F56CF" },
       },
     });
-  })();
-}, []);
+  }"""
+        return [
+            f"""
+useEffect(() => {{
+  {run_once("calcom:talk", initialize)}.catch((error) => console.error(error));
+}}, []);
 """,
         ]
 
@@ -13,61 +13,23 @@ from reflex.experimental.client_state import ClientStateVar
 from reflex.vars.base import get_unique_variable_name
 
 import reflex_ui as ui
+from reflex_ui.blocks.email_validation import (
+    PERSONAL_EMAIL_PROVIDERS,
+    check_if_company_email,
+    company_email_validator,
+)
 from reflex_ui.blocks.telemetry.posthog import track_demo_form_posthog_submission
+from reflex_ui.utils.metrics import instrument
 
 demo_form_error_message = ClientStateVar.create("demo_form_error_message", "")
 demo_form_open_cs = ClientStateVar.create("demo_form_open", False)
 
-PERSONAL_EMAIL_PROVIDERS = r"^(?!.*@(gmail|outlook|hotmail|yahoo|icloud|aol|protonmail|mail|yandex|zoho|live|msn|me|mac|googlemail)\.com$|.*@(yahoo|outlook|hotmail)\.co\.uk$|.*@yahoo\.ca$|.*@yahoo\.co\.in$|.*@proton\.me$).*$"
-
 
 def get_element_value(element_id: str) -> str:
     """Get the value of an element by ID."""
     return f"document.getElementById('{element_id}')?.value"
 
 
-def check_if_company_email(email: str) -> bool:
-    """Check if an email address is from a company domain (not a personal email provider).
-
-    Args:
-        email: The email address to check
-
-    Returns:
-        True if it's likely a company email, False if it's from a personal provider
-    """
-    if not email or "@" not in email:
-        return False
-
-    domain = email.split("@")[-1].lower()
-
-    # List of common personal email providers
-    personal_domains = {
-        "gmail.com",
-        "outlook.com",
-        "hotmail.com",
-        "yahoo.com",
-        "icloud.com",
-        "aol.com",
-        "protonmail.com",
-        "proton.me",
-        "mail.com",
-        "yandex.com",
-        "zoho.com",
-        "live.com",
-        "msn.com",
-        "me.com",
-        "mac.com",
-        "googlemail.com",
-        "yahoo.co.uk",
-        "yahoo.ca",
-        "yahoo.co.in",
-        "outlook.co.uk",
-        "hotmail.co.uk",
-    }
-
-    return domain not in personal_domains and ".edu" not in domain
-
-
 def check_if_default_value_is_selected(value: str) -> bool:
     """Check if the default value is selected."""
     return bool(value.strip())
@@ -77,24 +39,15 @@ class DemoFormStateUI(rx.State):
     """State for handling demo form submissions and validation."""
 
     @rx.event
-    def validate_email(self, email: str):
-        """Validate the email address."""
-        if not check_if_company_email(email):
-            yield [
-                demo_form_error_message.push(
-                    "Please enter a valid company email - gmails, aol, me, etc are not allowed"
-                ),
-            ]
-        else:
-            yield demo_form_error_message.push("")
-
-    @rx.event
+    @instrument
     def track_demo_form_posthog(self, form_data: dict[str, Any]):
         """Send demo form fields to PostHog (identify + capture) in the browser.
 
         Returns:
             Event that runs PostHog identify and capture in the browser.
         """
+        if not check_if_company_email(form_data.get("email", "")):
+            return demo_form_error_message.push(company_email_validator.error_message)
         return track_demo_form_posthog_submission(form_data)
 
 
@@ -281,7 +234,9 @@ def demo_form(id_prefix: str = "", **props) -> rx.Component:
             True,
             PERSONAL_EMAIL_PROVIDERS,
             id=email_id,
-            on_blur=DemoFormStateUI.validate_email(rx.Var(get_element_value(email_id))),
+            on_blur=company_email_validator.validate_on_client(
+                get_element_value(email_id), demo_form_error_message
+            ),
         ),
         rx.el.div(
             input_field("Job title", "CTO", "job_title", "text", True),
@@ -341,7 +296,12 @@ def demo_form(id_prefix: str = "", **props) -> rx.Component:
         ),
         on_submit=[
             DemoFormStateUI.track_demo_form_posthog,
-            rx.call_function(demo_form_open_cs.set_value(False)),
+            # Keep the dialog open with the error when the email is rejected.
+            *company_email_validator.gate_on_client(
+                get_element_value(email_id),
+                [rx.call_function(demo_form_open_cs.set_value(False))],
+                demo_form_error_message,
+            ),
         ],
         data_default_form_id="965991",
         **props,
@@ -0,0 +1,151 @@
+"""Company email validation shared by the demo and intro forms.
+
+The same validator definition is checked on the server and compiled to a
+client-side JavaScript function, so blur validation never needs a backend
+round trip while submissions are still re-validated on the server.
+"""
+
+import dataclasses
+import json
+import re
+
+import reflex as rx
+from reflex.experimental.client_state import ClientStateVar
+
+
+@dataclasses.dataclass(frozen=True)
+class EmailDomainValidator:
+    """Rejects email addresses from a set of blocked domains."""
+
+    # Domains that are rejected exactly, e.g. "gmail.com".
+    blocked_domains: frozenset[str]
+
+    # Substrings that reject any domain containing them, e.g. ".edu".
+    blocked_substrings: tuple[str, ...] = ()
+
+    # Message shown when an email is rejected.
+    error_message: str = "Please enter a valid email"
+
+    def check(self, email: str) -> bool:
+        """Check an email address on the server.
+
+        Args:
+            email: The email address to check
+
+        Returns:
+            True if the email is accepted, False otherwise
+        """
+        if not email or "@" not in email:
+            return False
+
+        domain = email.split("@")[-1].lower()
+        return domain not in self.blocked_domains and not any(
+            blocked in domain for blocked in self.blocked_substrings
+        )
+
+    @property
+    def pattern(self) -> str:
+        """The HTML input pattern rejecting blocked emails."""
+        domains = "|".join(re.escape(domain) for domain in sorted(self.blocked_domains))
+        alternatives = [
+            f"({domains})$",
+            *(f"[^@]*{re.escape(blocked)}" for blocked in self.blocked_substrings),
+        ]
+        return f"^(?!.*@({'|'.join(alternatives)})).*$"
+
+    @property
+    def js_check(self) -> str:
+        """The JavaScript function equivalent to `check`."""
+        return f"""((email) => {{
+  if (!email || !email.includes("@")) return false;
+  const domain = email.split("@").pop().toLowerCase();
+  return !{json.dumps(sorted(self.blocked_domains))}.includes(domain) && !{json.dumps(list(self.blocked_substrings))}.some((blocked) => domain.includes(blocked));
+}})"""
+
+    def validate_on_client(
+        self, value: str | rx.Var, error_message: ClientStateVar
+    ) -> rx.event.EventSpec:
+        """Validate an email in the browser and set the error message client state.
+
+        Args:
+            value: JavaScript expression evaluating to the email to check
+            error_message: Client state holding the error message
+
+        Returns:
+            Event that validates the email without a backend round trip.
+        """
+        return rx.call_function(
+            error_message.set_value(
+                rx.Var(
+                    f"({self.js_check}({value!s}) ? '' : {json.dumps(self.error_message)})"
+                )
+            )
+        )
+
+    def gate_on_client(
+        self,
+        value: str | rx.Var,
+        events: list[rx.event.EventSpec],
+        error_message: ClientStateVar,
+    ) -> list[rx.event.EventSpec | rx.Var]:
+        """Run events only if an email is accepted in the browser.
+
+        Args:
+            value: JavaScript expression evaluating to the email to check
+            events: Events taking no arguments, run in order if the email is accepted
+            error_message: Client state holding the error message
+
+        Returns:
+            Events setting the error message, then the gated events.
+        """
+        accepted = rx.Var(f"{self.js_check}({value!s})")
+        skipped = rx.call_function(rx.Var("() => null"))
+        return [
+            self.validate_on_client(value, error_message),
+            *(rx.cond(accepted, event, skipped) for event in events),
+        ]
+
+
+company_email_validator = EmailDomainValidator(
+    blocked_domains=frozenset(
+        {
+            "gmail.com",
+            "outlook.com",
+            "hotmail.com",
+            "yahoo.com",
+            "icloud.com",
+            "aol.com",
+            "protonmail.com",
+            "proton.me",
+            "mail.com",
+            "yandex.com",
+            "zoho.com",
+            "live.com",
+            "msn.com",
+            "me.com",
+            "mac.com",
+            "googlemail.com",
+            "yahoo.co.uk",
+            "yahoo.ca",
+            "yahoo.co.in",
+            "outlook.co.uk",
+            "hotmail.co.uk",
+        }
+    ),
+    blocked_substrings=(".edu",),
+    error_message="Please enter a valid company email - gmails, aol, me, etc are not allowed",
+)
+
+PERSONAL_EMAIL_PROVIDERS = company_email_validator.pattern
+
+
+def check_if_company_email(email: str) -> bool:
+    """Check if an email address is from a company domain (not a personal email provider).
+
+    Args:
+        email: The email address to check
+
+    Returns:
+        True if it's likely a company email, False if it's from a personal provider
+    """
+    return company_email_validator.check(email)
@@ -6,65 +6,58 @@ This module provides a comprehensive intro form that validates company emails.
 from typing import Any
 
 import reflex as rx
-from reflex.event import EventType, IndividualEventType
+from reflex.event import (
+    EventHandler,
+    EventSpec,
+    EventType,
+    IndividualEventType,
+    call_event_fn,
+    call_event_handler,
+)
 from reflex.experimental.client_state import ClientStateVar
 from reflex.vars.base import get_unique_variable_name
 
 import reflex_ui as ui
+from reflex_ui.blocks.email_validation import (
+    PERSONAL_EMAIL_PROVIDERS,
+    check_if_company_email,
+    company_email_validator,
+)
 from reflex_ui.blocks.telemetry.posthog import track_intro_form_posthog_submission
+from reflex_ui.utils.metrics import instrument
 
 intro_form_error_message = ClientStateVar.create("intro_form_error_message", "")
 intro_form_open_cs = ClientStateVar.create("intro_form_open", False)
 is_submitting_intro_form_cs = ClientStateVar.create("is_submitting_intro_form", False)
 
-PERSONAL_EMAIL_PROVIDERS = r"^(?!.*@(gmail|outlook|hotmail|yahoo|icloud|aol|protonmail|mail|yandex|zoho|live|msn|me|mac|googlemail)\.com$|.*@(yahoo|outlook|hotmail)\.co\.uk$|.*@yahoo\.ca$|.*@yahoo\.co\.in$|.*@proton\.me$).*$"
-
 
 def get_element_value(element_id: str) -> str:
     """Get the value of an element by ID."""
     return f"document.getElementById('{element_id}')?.value"
 
 
-def check_if_company_email(email: str) -> bool:
-    """Check if an email address is from a company domain (not a personal email provider).
+def _bind_form_data(
+    event: IndividualEventType[dict[str, Any]], element_id: str
+) -> list[rx.event.EventSpec]:
+    """Bind a submit handler to the data of the form holding an element.
 
     Args:
-        email: The email address to check
+        event: The submit handler, taking the form data.
+        element_id: The ID of an element of the form.
 
     Returns:
-        True if it's likely a company email, False if it's from a personal provider
+        Events taking no arguments.
     """
-    if not email or "@" not in email:
-        return False
-
-    domain = email.split("@")[-1].lower()
-
-    # List of common personal email providers
-    personal_domains = {
-        "gmail.com",
-        "outlook.com",
-        "hotmail.com",
-        "yahoo.com",
-        "icloud.com",
-        "aol.com",
-        "protonmail.com",
-        "proton.me",
-        "mail.com",
-        "yandex.com",
-        "zoho.com",
-        "live.com",
-        "msn.com",
-        "me.com",
-        "mac.com",
-        "googlemail.com",
-        "yahoo.co.uk",
-        "yahoo.ca",
-        "yahoo.co.in",
-        "outlook.co.uk",
-        "hotmail.co.uk",
-    }
-
-    return domain not in personal_domains and ".edu" not in domain
+    form_data = rx.Var(
+        f"Object.fromEntries(new FormData(document.getElementById('{element_id}')?.form).entries())"
+    ).to(dict)
+
+    def spec() -> tuple[rx.Var[dict]]:
+        return (form_data,)
+
+    if isinstance(event, EventHandler | EventSpec):
+        return [call_event_handler(event, spec)]
+    return list(call_event_fn(event, spec))  # pyright: ignore [reportArgumentType]
 
 
 def check_if_default_value_is_selected(value: str) -> bool:
@@ -76,24 +69,15 @@ class IntroFormStateUI(rx.State):
     """State for handling intro form submissions and validation."""
 
     @rx.event
-    def validate_email(self, email: str):
-        """Validate the email address."""
-        if not check_if_company_email(email):
-            yield [
-                intro_form_error_message.push(
-                    "Please enter a valid company email - gmails, aol, me, etc are not allowed"
-                ),
-            ]
-        else:
-            yield intro_form_error_message.push("")
-
-    @rx.event
+    @instrument
     def track_intro_form_posthog(self, form_data: dict[str, Any]):
         """Send intro form fields to PostHog (identify + capture) in the browser.
 
         Returns:
             Event that runs PostHog identify and capture in the browser.
         """
+        if not check_if_company_email(form_data.get("email", "")):
+            return intro_form_error_message.push(company_email_validator.error_message)
         return track_intro_form_posthog_submission(form_data)
 
 
@@ -291,8 +275,8 @@ def intro_form(
                 True,
                 PERSONAL_EMAIL_PROVIDERS,
                 id=email_id,
-                on_blur=IntroFormStateUI.validate_email(
-                    rx.Var(get_element_value(email_id))
+                on_blur=company_email_validator.validate_on_client(
+                    get_element_value(email_id), intro_form_error_message
                 ),
             ),
             input_field("Phone number", "+1234567890", "phone_number", "tel", True),
@@ -355,7 +339,19 @@ def intro_form(
             "@container flex flex-col lg:gap-6 gap-2 p-6",
             props.pop("class_name", ""),
         ),
-        on_submit=[IntroFormStateUI.track_intro_form_posthog, *extra],
+        on_submit=[
+            IntroFormStateUI.track_intro_form_posthog,
+            # Keep the form open with the error when the email is rejected.
+            *company_email_validator.gate_on_client(
+                get_element_value(email_id),
+                [
+                    event
+                    for handler in extra
+                    for event in _bind_form_data(handler, email_id)
+                ],
+                intro_form_error_message,
+            ),
+        ],
         **props,
     )
     return rx.fragment(
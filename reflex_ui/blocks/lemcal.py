@@ -3,8 +3,10 @@
 import reflex as rx
 
 import reflex_ui as ui
+from reflex_ui.blocks.scripts import external_script
 
 LEMCAL_DEMO_URL = "https://app.lemcal.com/@alek/reflex-demo-call"
+LEMCAL_SCRIPT_URL = "https://cdn.lemcal.com/lemcal-integrations.min.js"
 
 
 @rx.memo
@@ -30,12 +32,8 @@ def lemcal_booking_calendar():
 
 
 def lemcal_script(**props) -> rx.Component:
-    """Return the Lemcal integrations script tag."""
-    return rx.script(
-        src="https://cdn.lemcal.com/lemcal-integrations.min.js",
-        defer=True,
-        **props,
-    )
+    """Return the Lemcal integrations script, loaded once per page."""
+    return external_script(src=LEMCAL_SCRIPT_URL, **props)
 
 
 def lemcal_dialog(trigger: rx.Component, **props) -> rx.Component:
@@ -10,7 +10,10 @@ from typing import Any
 import reflex as rx
 from reflex.components.tags.tag import Tag
 
+from reflex_ui.blocks.scripts import SCRIPT_REGISTRY_SCRIPT, load_script
+
 PLAIN_APP_ID = os.getenv("PLAIN_APP_ID", "liveChatApp_01KGG4JD5JHG8JY8X5CCN7811V")
+PLAIN_SCRIPT_URL = "https://chat.cdn-plain.com/index.js"
 
 
 class PlainChat(rx.Component):
@@ -46,6 +49,10 @@ class PlainChat(rx.Component):
         """Add React imports."""
         return {"react": ["useEffect"]}
 
+    def add_custom_code(self) -> list[str]:
+        """Add the script registry runtime."""
+        return [SCRIPT_REGISTRY_SCRIPT]
+
     def add_hooks(self) -> list[str | rx.Var]:
         """Add hooks to initialize Plain chat widget."""
         return [
@@ -114,7 +121,8 @@ class PlainChat(rx.Component):
     }}
   }}
 
-  if (window.Plain) {{
+  const ready = window.Plain ? Promise.resolve() : {load_script(PLAIN_SCRIPT_URL)};
+  ready.then(() => {{
     if (Plain.isInitialized()) {{
       // Already initialized, update in-place
       // Exclude appId from update - it's only valid for init()
@@ -123,14 +131,7 @@ class PlainChat(rx.Component):
     }} else {{
       Plain.init(initOptions);
     }}
-    return;
-  }}
-
-  const script = document.createElement('script');
-  script.async = false;
-  script.src = 'https://chat.cdn-plain.com/index.js';
-  script.onload = () => Plain.init(initOptions);
-  document.head.appendChild(script);
+  }}).catch((error) => console.error(error));
 }}, [{self.full_name!s}, {self.short_name!s}, {self.chat_avatar_url!s}, {self.external_id!s}, {self.tier_id!s}, {self.entry_point_type!s}, {self.entry_point_external_id!s}, {self.single_chat_mode!s}, {self.email!s}, {self.email_hash!s}])"""
             )
         ]
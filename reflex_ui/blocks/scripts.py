@@ -0,0 +1,149 @@
+"""Global registry of external scripts and one-time initializers.
+
+Every embed and tracker loads its script through one promise per script, so a
+widget rendered in several places or across client-side navigations never
+appends a second script tag or re-runs its initialization.
+"""
+
+import json
+from collections.abc import Mapping
+from typing import Any
+
+import reflex as rx
+from reflex.components.tags.tag import Tag
+
+# Global holding the registry
+SCRIPT_REGISTRY_GLOBAL: str = "__reflexUiScripts"
+
+# Registry runtime, safe to run several times and from inline scripts
+SCRIPT_REGISTRY_SCRIPT: str = f"""
+if (typeof window !== 'undefined' && !window.{SCRIPT_REGISTRY_GLOBAL}) {{
+    window.{SCRIPT_REGISTRY_GLOBAL} = (function () {{
+        var promises = {{}};
+        var once = function (key, factory) {{
+            if (!promises[key]) {{
+                promises[key] = Promise.resolve().then(factory);
+                // Failed scripts may be retried by the next caller.
+                promises[key].catch(function () {{
+                    delete promises[key];
+                }});
+            }}
+            return promises[key];
+        }};
+        var load = function (src, attributes) {{
+            return once(src, function () {{
+                return new Promise(function (resolve, reject) {{
+                    var script = document.createElement('script');
+                    script.async = true;
+                    script.src = src;
+                    Object.keys(attributes || {{}}).forEach(function (key) {{
+                        script.setAttribute(key, attributes[key]);
+                    }});
+                    script.onload = function () {{
+                        resolve(script);
+                    }};
+                    script.onerror = function () {{
+                        script.remove();
+                        reject(new Error('Failed to load ' + src));
+                    }};
+                    document.head.appendChild(script);
+                }});
+            }});
+        }};
+        return {{ once: once, load: load, promises: promises }};
+    }})();
+}}
+"""
+
+
+def load_script(src: str | rx.Var[str], attributes: Any = None) -> str:
+    """Get a JavaScript expression loading a script through the registry.
+
+    Args:
+        src: The script URL, a string or a var.
+        attributes: Attributes of the script element, a mapping or a var.
+
+    Returns:
+        Expression evaluating to a promise resolved once the script has loaded.
+    """
+    src_js = f"{src!s}" if isinstance(src, rx.Var) else json.dumps(src)
+    if isinstance(attributes, rx.Var):
+        attributes_js = f"{attributes!s}"
+    else:
+        attributes_js = json.dumps(dict(attributes or {}))
+    return f"window.{SCRIPT_REGISTRY_GLOBAL}.load({src_js}, {attributes_js})"
+
+
+def run_once(key: str, function: str) -> str:
+    """Get a JavaScript expression running an initializer once per page.
+
+    Args:
+        key: Unique key of the initializer.
+        function: JavaScript function, may return a promise.
+
+    Returns:
+        Expression evaluating to the shared promise of the initializer.
+    """
+    return f"window.{SCRIPT_REGISTRY_GLOBAL}.once({json.dumps(key)}, {function})"
+
+
+def run_once_script(key: str, code: str) -> str:
+    """Get an inline script running a vendor snippet once per page.
+
+    Args:
+        key: Unique key of the snippet.
+        code: The snippet. It runs in a function scope.
+
+    Returns:
+        The inline script, including the registry runtime.
+    """
+    return f"{SCRIPT_REGISTRY_SCRIPT}\n{run_once(key, f'function () {{{code}}}')};"
+
+
+class ExternalScript(rx.Component):
+    """Loads an external script through the script registry."""
+
+    tag = "ExternalScript"
+
+    # The script URL.
+    src: rx.Var[str]
+
+    # Attributes of the script element.
+    attributes: rx.Var[Mapping[str, str]] = rx.Var.create({})
+
+    def add_custom_code(self) -> list[str]:
+        """Add the registry runtime.
+
+        Returns:
+            The registry runtime code
+        """
+        return [SCRIPT_REGISTRY_SCRIPT]
+
+    def add_imports(self) -> rx.ImportDict:
+        """Add React imports.
+
+        Returns:
+            Dictionary of imports needed for the component
+        """
+        return {"react": rx.ImportVar("useEffect")}
+
+    def add_hooks(self) -> list[str | rx.Var]:
+        """Add the hook loading the script.
+
+        Returns:
+            List of hook code strings loading the script
+        """
+        return [
+            rx.Var(
+                f"""useEffect(() => {{
+  {load_script(self.src, self.attributes)}.catch((error) => console.error(error));
+}}, [{self.src!s}])"""
+            )
+        ]
+
+    def _render(self, props: dict[str, Any] | None = None) -> Tag:
+        """Render empty tag."""
+        return Tag("")
+
+
+external_script = ExternalScript.create
@@ -1,23 +1,51 @@
 """Telemetry blocks for the Reflex UI library."""
 
-from .clearbit import get_clearbit_trackers
-from .common_room import get_common_room_trackers, identify_common_room_user
-from .default import get_default_telemetry_script
-from .google import get_google_analytics_trackers, gtag_report_conversion
-from .koala import get_koala_trackers
-from .posthog import get_posthog_trackers
-from .rb2b import get_rb2b_trackers
-from .unify import get_unify_trackers
+from .clearbit import clearbit_tracker, get_clearbit_trackers
+from .common_room import (
+    common_room_tracker,
+    get_common_room_trackers,
+    identify_common_room_user,
+)
+from .default import default_telemetry_tracker, get_default_telemetry_script
+from .google import (
+    get_google_analytics_trackers,
+    google_analytics_tracker,
+    gtag_conversion_tracker,
+    gtag_report_conversion,
+)
+from .koala import get_koala_trackers, koala_tracker
+from .loader import Tracker, get_deferred_trackers
+from .posthog import get_posthog_trackers, posthog_tracker
+from .queue import enqueue_events
+from .rb2b import get_rb2b_trackers, rb2b_tracker
+from .unify import get_unify_trackers, unify_tracker
+from .web_vitals import get_web_vitals_tracker, web_vitals_api
+from .worker import get_partytown_runtime
 
 __all__ = [
+    "Tracker",
+    "clearbit_tracker",
+    "common_room_tracker",
+    "default_telemetry_tracker",
+    "enqueue_events",
     "get_clearbit_trackers",
     "get_common_room_trackers",
     "get_default_telemetry_script",
+    "get_deferred_trackers",
     "get_google_analytics_trackers",
     "get_koala_trackers",
+    "get_partytown_runtime",
     "get_posthog_trackers",
     "get_rb2b_trackers",
     "get_unify_trackers",
+    "get_web_vitals_tracker",
+    "google_analytics_tracker",
+    "gtag_conversion_tracker",
     "gtag_report_conversion",
     "identify_common_room_user",
+    "koala_tracker",
+    "posthog_tracker",
+    "rb2b_tracker",
+    "unify_tracker",
+    "web_vitals_api",
 ]
@@ -2,21 +2,51 @@
 
 import reflex as rx
 
+from reflex_ui.blocks.scripts import external_script
+
+from .loader import Tracker
+from .worker import PARTYTOWN_SCRIPT_TYPE
+
 CLEARBIT_SCRIPT_URL_TEMPLATE: str = (
     "https://tag.clearbitscripts.com/v1/{public_key}/tags.js"
 )
 
 
-def get_clearbit_trackers(public_key: str) -> rx.Component:
+def get_clearbit_trackers(public_key: str, worker: bool = False) -> rx.Component:
     """Generate Clearbit tracking component for a Reflex application.
 
     Args:
         public_key: Clearbit public key (defaults to app's public key)
+        worker: Whether to run the script in a web worker. Needs the Partytown runtime copied into the app's assets, see `get_partytown_runtime`
 
     Returns:
         rx.Component: Script component needed for Clearbit tracking
     """
-    return rx.el.script(
+    src = CLEARBIT_SCRIPT_URL_TEMPLATE.format(public_key=public_key)
+    if worker:
+        return rx.el.script(
+            src=src,
+            referrer_policy="strict-origin-when-cross-origin",
+            type=PARTYTOWN_SCRIPT_TYPE,
+        )
+    return external_script(
+        src=src, attributes={"referrerpolicy": "strict-origin-when-cross-origin"}
+    )
+
+
+def clearbit_tracker(public_key: str, priority: int = 0) -> Tracker:
+    """Declare the Clearbit tracker for `get_deferred_trackers`.
+
+    Args:
+        public_key: Clearbit public key
+        priority: Load order relative to other trackers
+
+    Returns:
+        Tracker: The Clearbit tracker
+    """
+    return Tracker(
+        name="clearbit",
         src=CLEARBIT_SCRIPT_URL_TEMPLATE.format(public_key=public_key),
-        referrer_policy="strict-origin-when-cross-origin",
+        attributes={"referrerpolicy": "strict-origin-when-cross-origin"},
+        priority=priority,
     )
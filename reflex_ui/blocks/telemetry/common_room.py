@@ -4,6 +4,11 @@ import json
 
 import reflex as rx
 
+from reflex_ui.blocks.scripts import run_once_script
+
+from .loader import Tracker
+from .worker import PARTYTOWN_SCRIPT_TYPE
+
 # Common Room tracking configuration
 COMMON_ROOM_CDN_URL_TEMPLATE: str = (
     "https://cdn.cr-relay.com/v1/site/{site_id}/signals.js"
@@ -32,18 +37,22 @@ COMMON_ROOM_SCRIPT_TEMPLATE: str = """
 """
 
 
-def get_common_room_trackers(site_id: str) -> rx.Component:
+def get_common_room_trackers(site_id: str, worker: bool = False) -> rx.Component:
     """Generate Common Room tracking component for a Reflex application.
 
     Args:
         site_id: Your Common Room site ID (found in your tracking snippet)
+        worker: Whether to run the script in a web worker. Needs the Partytown runtime copied into the app's assets, see `get_partytown_runtime`
 
     Returns:
         rx.Component: Script component needed for Common Room tracking
     """
     cdn_url = COMMON_ROOM_CDN_URL_TEMPLATE.format(site_id=site_id)
 
-    return rx.script(COMMON_ROOM_SCRIPT_TEMPLATE.format(cdn_url=cdn_url))
+    script = COMMON_ROOM_SCRIPT_TEMPLATE.format(cdn_url=cdn_url)
+    if worker:
+        return rx.script(script, type=PARTYTOWN_SCRIPT_TYPE)
+    return rx.script(run_once_script("common_room", script))
 
 
 def identify_common_room_user(
@@ -75,3 +84,22 @@ def identify_common_room_user(
         }}
         """
     )
+
+
+def common_room_tracker(site_id: str, priority: int = 0) -> Tracker:
+    """Declare the Common Room tracker for `get_deferred_trackers`.
+
+    Args:
+        site_id: Your Common Room site ID (found in your tracking snippet)
+        priority: Load order relative to other trackers
+
+    Returns:
+        Tracker: The Common Room tracker
+    """
+    cdn_url = COMMON_ROOM_CDN_URL_TEMPLATE.format(site_id=site_id)
+    return Tracker(
+        name="common_room",
+        script=COMMON_ROOM_SCRIPT_TEMPLATE.format(cdn_url=cdn_url),
+        queues={"signals": ["page", "identify", "form", "track"]},
+        priority=priority,
+    )
@@ -2,6 +2,10 @@
 
 import reflex as rx
 
+from reflex_ui.blocks.scripts import run_once_script
+
+from .loader import Tracker
+
 DEFAULT_TELEMETRY_SCRIPT = """
 !function(e,t){var _=0;e.__default__=e.__default__||{},e.__default__.form_id=268792,e.__default__.team_id=654,e.__default__.listenToIds=[965991],function e(){var o=t.createElement("script");o.async=!0,o.src="https://import-cdn.default.com",o.onload=function(){!0},o.onerror=function(){++_<=3&&setTimeout(e,1e3*_)},t.head.appendChild(o)}()}(window,document);
 """
@@ -9,4 +13,16 @@ DEFAULT_TELEMETRY_SCRIPT = """
 
 def get_default_telemetry_script() -> rx.Component:
     """Get the Default.com telemetry script."""
-    return rx.el.script(DEFAULT_TELEMETRY_SCRIPT)
+    return rx.el.script(run_once_script("default", DEFAULT_TELEMETRY_SCRIPT))
+
+
+def default_telemetry_tracker(priority: int = 0) -> Tracker:
+    """Declare the Default.com tracker for `get_deferred_trackers`.
+
+    Args:
+        priority: Load order relative to other trackers
+
+    Returns:
+        Tracker: The Default.com tracker
+    """
+    return Tracker(name="default", script=DEFAULT_TELEMETRY_SCRIPT, priority=priority)
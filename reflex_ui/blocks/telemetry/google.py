@@ -2,6 +2,10 @@
 
 import reflex as rx
 
+from reflex_ui.blocks.scripts import external_script
+
+from .loader import Tracker
+
 # Google Tag Manager script template
 GTAG_SCRIPT_TEMPLATE: str = """
 window.dataLayer = window.dataLayer || [];
@@ -12,6 +16,20 @@ gtag('js', new Date());
 gtag('config', '{tracking_id}');
 """
 
+# Google Ads conversion script template
+GTAG_CONVERSION_SCRIPT_TEMPLATE: str = """
+function gtag_report_conversion() {{
+    var callback = function () {{
+        console.log('Conversion recorded!');
+    }};
+    gtag('event', 'conversion', {{
+        'send_to': '{conversion_id_and_label}',
+        'event_callback': callback
+    }});
+    return false;
+}}
+"""
+
 # Google Tag Manager script URL template
 GTAG_SCRIPT_URL_TEMPLATE: str = (
     "https://www.googletagmanager.com/gtag/js?id={tracking_id}"
@@ -31,7 +49,7 @@ def get_google_analytics_trackers(
     """
     # Load Google Tag Manager script
     return [
-        rx.script(src=GTAG_SCRIPT_URL_TEMPLATE.format(tracking_id=tracking_id)),
+        external_script(src=GTAG_SCRIPT_URL_TEMPLATE.format(tracking_id=tracking_id)),
         rx.script(GTAG_SCRIPT_TEMPLATE.format(tracking_id=tracking_id)),
     ]
 
@@ -46,14 +64,44 @@ def gtag_report_conversion(conversion_id_and_label: str) -> rx.Component:
         rx.Component: Script component to report the conversion.
     """
     return rx.script(
-        f"""function gtag_report_conversion() {{
-            var callback = function () {{
-                console.log('Conversion recorded!');
-            }};
-            gtag('event', 'conversion', {{
-                'send_to': '{conversion_id_and_label}',
-                'event_callback': callback
-            }});
-            return false;
-        }}"""
+        GTAG_CONVERSION_SCRIPT_TEMPLATE.format(
+            conversion_id_and_label=conversion_id_and_label
+        )
+    )
+
+
+def google_analytics_tracker(tracking_id: str, priority: int = 0) -> Tracker:
+    """Declare Google Analytics for `get_deferred_trackers`.
+
+    The `gtag` queue is defined immediately, only the tag script is deferred.
+
+    Args:
+        tracking_id: Google Analytics tracking ID
+        priority: Load order relative to other trackers
+
+    Returns:
+        Tracker: The Google Analytics tracker
+    """
+    return Tracker(
+        name=f"google_analytics:{tracking_id}",
+        stub=GTAG_SCRIPT_TEMPLATE.format(tracking_id=tracking_id),
+        src=GTAG_SCRIPT_URL_TEMPLATE.format(tracking_id=tracking_id),
+        priority=priority,
+    )
+
+
+def gtag_conversion_tracker(conversion_id_and_label: str) -> Tracker:
+    """Declare the Google Ads conversion helper for `get_deferred_trackers`.
+
+    Args:
+        conversion_id_and_label: The conversion label for the Google Ads conversion.
+
+    Returns:
+        Tracker: Tracker defining `gtag_report_conversion` immediately
+    """
+    return Tracker(
+        name=f"gtag_conversion:{conversion_id_and_label}",
+        stub=GTAG_CONVERSION_SCRIPT_TEMPLATE.format(
+            conversion_id_and_label=conversion_id_and_label
+        ),
     )
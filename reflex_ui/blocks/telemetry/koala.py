@@ -2,6 +2,11 @@
 
 import reflex as rx
 
+from reflex_ui.blocks.scripts import run_once_script
+
+from .loader import Tracker
+from .worker import PARTYTOWN_SCRIPT_TYPE
+
 # Koala tracking configuration
 KOALA_SCRIPT_URL_TEMPLATE: str = "https://cdn.getkoala.com/v1/{public_api_key}/sdk.js"
 
@@ -32,15 +37,48 @@ KOALA_SCRIPT_TEMPLATE: str = """
 """
 
 
-def get_koala_trackers(public_api_key: str) -> rx.Component:
+def get_koala_trackers(public_api_key: str, worker: bool = False) -> rx.Component:
     """Generate Koala tracking component for a Reflex application.
 
     Args:
         public_api_key: Koala public API key
+        worker: Whether to run the script in a web worker. Needs the Partytown runtime copied into the app's assets, see `get_partytown_runtime`
 
     Returns:
         rx.Component: Script component needed for Koala tracking
     """
     script_url = KOALA_SCRIPT_URL_TEMPLATE.format(public_api_key=public_api_key)
 
-    return rx.script(KOALA_SCRIPT_TEMPLATE.format(script_url=script_url))
+    script = KOALA_SCRIPT_TEMPLATE.format(script_url=script_url)
+    if worker:
+        return rx.script(script, type=PARTYTOWN_SCRIPT_TYPE)
+    return rx.script(run_once_script("koala", script))
+
+
+def koala_tracker(public_api_key: str, priority: int = 0) -> Tracker:
+    """Declare the Koala tracker for `get_deferred_trackers`.
+
+    Args:
+        public_api_key: Koala public API key
+        priority: Load order relative to other trackers
+
+    Returns:
+        Tracker: The Koala tracker
+    """
+    script_url = KOALA_SCRIPT_URL_TEMPLATE.format(public_api_key=public_api_key)
+    return Tracker(
+        name="koala",
+        script=KOALA_SCRIPT_TEMPLATE.format(script_url=script_url),
+        queues={
+            "ko": [
+                "identify",
+                "track",
+                "removeListeners",
+                "on",
+                "off",
+                "qualify",
+                "ready",
+            ]
+        },
+        priority=priority,
+    )
@@ -0,0 +1,165 @@
+"""Deferred loading of third-party telemetry trackers.
+
+Trackers are registered declaratively and loaded one at a time, ordered by
+priority, once the browser is idle after the page load, on the first user
+interaction or after a timeout, whichever comes first. Until a tracker has
+loaded, calls to its global API are queued and replayed into the vendor's own
+queue stub, so early calls are not lost.
+"""
+
+import dataclasses
+import json
+from collections.abc import Mapping, Sequence
+
+import reflex as rx
+
+from reflex_ui.blocks.scripts import SCRIPT_REGISTRY_SCRIPT
+
+# Milliseconds after which trackers load even if the page never becomes idle.
+DEFAULT_LOAD_TIMEOUT_MS: int = 5000
+
+# Loader script template, run once per page load after the script registry
+LOADER_SCRIPT_TEMPLATE: str = """
+(function () {{
+    if (typeof window === 'undefined') return;
+    var loader = window.__reflexUiTelemetry = window.__reflexUiTelemetry || {{ registered: {{}}, calls: {{}} }};
+    var trackers = {trackers}.filter(function (tracker) {{
+        return !loader.registered[tracker.name];
+    }});
+    var inline = function (code) {{
+        var script = document.createElement('script');
+        script.text = code;
+        document.head.appendChild(script);
+    }};
+    trackers.forEach(function (tracker) {{
+        loader.registered[tracker.name] = true;
+        if (tracker.stub) inline(tracker.stub);
+        Object.keys(tracker.queues).forEach(function (name) {{
+            if (typeof window[name] !== 'undefined') return;
+            var calls = loader.calls[name] = [];
+            window[name] = tracker.queues[name].reduce(function (stub, method) {{
+                stub[method] = function () {{
+                    calls.push([method, arguments]);
+                    return stub;
+                }};
+                return stub;
+            }}, {{}});
+        }});
+    }});
+    var load = function (tracker) {{
+        Object.keys(tracker.queues).forEach(function (name) {{
+            if (loader.calls[name]) delete window[name];
+        }});
+        if (tracker.src) {{
+            window.__reflexUiScripts.load(tracker.src, tracker.attributes).catch(function (error) {{
+                console.error(error);
+            }});
+        }}
+        if (tracker.script) inline(tracker.script);
+        Object.keys(tracker.queues).forEach(function (name) {{
+            var calls = loader.calls[name] || [];
+            delete loader.calls[name];
+            calls.forEach(function (call) {{
+                var target = window[name];
+                if (target && typeof target[call[0]] === 'function') {{
+                    target[call[0]].apply(target, call[1]);
+                }}
+            }});
+        }});
+    }};
+    var idle = window.requestIdleCallback || function (callback) {{
+        return setTimeout(callback, 1);
+    }};
+    var events = ['pointerdown', 'keydown', 'scroll', 'touchstart'];
+    var started = false;
+    var timer;
+    var start = function () {{
+        if (started) return;
+        started = true;
+        clearTimeout(timer);
+        events.forEach(function (event) {{
+            window.removeEventListener(event, start, true);
+        }});
+        var next = function () {{
+            var tracker = trackers.shift();
+            if (!tracker) return;
+            load(tracker);
+            idle(next, {{ timeout: {timeout} }});
+        }};
+        next();
+    }};
+    events.forEach(function (event) {{
+        window.addEventListener(event, start, {{ capture: true, passive: true }});
+    }});
+    timer = setTimeout(start, {timeout});
+    var scheduleIdle = function () {{
+        idle(start, {{ timeout: {timeout} }});
+    }};
+    if (document.readyState === 'complete') scheduleIdle();
+    else window.addEventListener('load', scheduleIdle, {{ once: true }});
+}})();
+"""
+
+
+@dataclasses.dataclass(frozen=True)
+class Tracker:
+    """A third-party tracker loaded by `get_deferred_trackers`."""
+
+    # Unique name of the tracker, so it is only registered once per page.
+    name: str
+
+    # Inline vendor snippet run when the tracker loads.
+    script: str = ""
+
+    # External script loaded when the tracker loads.
+    src: str = ""
+
+    # Attributes of the external script element.
+    attributes: Mapping[str, str] = dataclasses.field(default_factory=dict)
+
+    # Inline snippet run immediately, e.g. a queue stub that makes no requests.
+    stub: str = ""
+
+    # Global objects and the methods whose calls are queued until the tracker loads.
+    queues: Mapping[str, Sequence[str]] = dataclasses.field(default_factory=dict)
+
+    # Load order, trackers with a lower priority load first.
+    priority: int = 0
+
+    def to_dict(self) -> dict:
+        """Serialize the tracker for the loader script.
+
+        Returns:
+            The tracker as a JSON-serializable dict.
+        """
+        return {
+            "name": self.name,
+            "script": self.script,
+            "src": self.src,
+            "attributes": dict(self.attributes),
+            "stub": self.stub,
+            "queues": {name: list(methods) for name, methods in self.queues.items()},
+        }
+
+
+def get_deferred_trackers(
+    *trackers: Tracker, timeout_ms: int = DEFAULT_LOAD_TIMEOUT_MS
+) -> rx.Component:
+    """Generate a script component loading trackers off the critical path.
+
+    Args:
+        *trackers: The trackers to load.
+        timeout_ms: Milliseconds after which the trackers load if the page never becomes idle.
+
+    Returns:
+        rx.Component: Script component loading the trackers
+    """
+    ordered = sorted(trackers, key=lambda tracker: tracker.priority)
+    payload = json.dumps([tracker.to_dict() for tracker in ordered])
+    return rx.script(
+        SCRIPT_REGISTRY_SCRIPT
+        + LOADER_SCRIPT_TEMPLATE.format(
+            trackers=payload.replace("</", "<\\/"),
+            timeout=int(timeout_ms),
+        )
+    )
@@ -1,10 +1,14 @@
 """PostHog analytics tracking integration for Reflex applications."""
 
-import json
 from typing import Any
 
 import reflex as rx
 
+from reflex_ui.blocks.scripts import run_once_script
+
+from .loader import Tracker
+from .queue import enqueue_events, get_event_queue_script
+
 # PostHog tracking configuration
 POSTHOG_API_HOST: str = "https://pg.reflex.dev"
 POSTHOG_UI_HOST: str = "https://us.posthog.com"
@@ -32,15 +36,10 @@ def identify_posthog_user(user_id: str) -> rx.event.EventSpec:
     Returns:
         rx.event.EventSpec: Event specification for identifying the user in PostHog
     """
-    user_id = json.dumps(user_id)
-
-    return rx.call_script(
-        f"""
-        if (typeof posthog !== 'undefined') {{
-            posthog.identify({user_id});
-        }}
-        """
-    )
+    return enqueue_events({"type": "identify", "distinct_id": user_id})
+
+
+_PERSON_KEYS = ("email", "first_name", "last_name", "job_title", "company_name")
 
 
 def _track_form_posthog(
@@ -56,26 +55,31 @@ def _track_form_posthog(
         allowed_keys: Set of keys to include from form_data.
 
     Returns:
-        Event that runs PostHog identify and capture in the browser.
+        Event that queues PostHog identify and capture in the browser.
     """
     filtered = {k: v for k, v in form_data.items() if k in allowed_keys}
-    props_json = json.dumps(filtered)
-
-    return rx.call_script(
-        f"""
-        if (typeof posthog !== 'undefined') {{
-            const props = {props_json};
-            const distinctId = props.email || ('anon_' + String(Date.now()));
-            posthog.identify(distinctId, {{
-                email: props.email,
-                first_name: props.first_name,
-                last_name: props.last_name,
-                job_title: props.job_title,
-                company_name: props.company_name,
-            }});
-            posthog.capture('{event_name}', props);
-        }}
-        """
+    distinct_id = filtered.get("email") or None
+
+    # Without an email the capture goes to PostHog's anonymous person.
+    identify = (
+        [
+            {
+                "type": "identify",
+                "distinct_id": distinct_id,
+                "properties": {k: filtered[k] for k in _PERSON_KEYS if k in filtered},
+            }
+        ]
+        if distinct_id
+        else []
+    )
+    return enqueue_events(
+        *identify,
+        {
+            "type": "capture",
+            "event": event_name,
+            "distinct_id": distinct_id,
+            "properties": filtered,
+        },
     )
 
 
@@ -96,7 +100,7 @@ def track_demo_form_posthog_submission(form_data: dict[str, Any]) -> rx.event.Ev
     """Capture a demo_request event in PostHog.
 
     Returns:
-        Event that runs PostHog identify and capture in the browser.
+        Event that queues PostHog identify and capture in the browser.
     """
     return _track_form_posthog("demo_request", form_data, _COMMON_KEYS)
 
@@ -107,7 +111,7 @@ def track_intro_form_posthog_submission(
     """Capture an intro_submit event in PostHog.
 
     Returns:
-        Event that runs PostHog identify and capture in the browser.
+        Event that queues PostHog identify and capture in the browser.
     """
     return _track_form_posthog(
         "intro_submit", form_data, _COMMON_KEYS | {"phone_number"}
@@ -130,9 +134,59 @@ def get_posthog_trackers(
         rx.Component: Script component needed for PostHog tracking
     """
     return rx.script(
-        POSTHOG_SCRIPT_TEMPLATE.format(
+        get_event_queue_script(project_id, api_host)
+        + run_once_script(
+            "posthog",
+            POSTHOG_SCRIPT_TEMPLATE.format(
+                project_id=project_id,
+                api_host=api_host,
+                ui_host=ui_host,
+            ),
+        )
+    )
+
+
+def posthog_tracker(
+    project_id: str,
+    api_host: str = POSTHOG_API_HOST,
+    ui_host: str = POSTHOG_UI_HOST,
+    priority: int = 0,
+) -> Tracker:
+    """Declare the PostHog tracker for `get_deferred_trackers`.
+
+    Args:
+        project_id: PostHog project ID
+        api_host: PostHog API host URL (defaults to reverse proxy)
+        ui_host: PostHog UI host URL for proper link generation
+        priority: Load order relative to other trackers
+
+    Returns:
+        Tracker: The PostHog tracker
+    """
+    return Tracker(
+        name="posthog",
+        stub=get_event_queue_script(project_id, api_host),
+        script=POSTHOG_SCRIPT_TEMPLATE.format(
             project_id=project_id,
             api_host=api_host,
             ui_host=ui_host,
-        )
+        ),
+        queues={
+            "posthog": [
+                "capture",
+                "identify",
+                "alias",
+                "group",
+                "register",
+                "register_once",
+                "unregister",
+                "setPersonProperties",
+                "reset",
+                "opt_in_capturing",
+                "opt_out_capturing",
+                "startSessionRecording",
+                "stopSessionRecording",
+            ]
+        },
+        priority=priority,
     )
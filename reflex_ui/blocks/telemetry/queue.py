@@ -0,0 +1,167 @@
+"""Batched, persistent client event queue for telemetry calls.
+
+Events pushed from the backend are stored in `localStorage` until delivered,
+so they survive navigations and offline periods. They are delivered to PostHog
+in batches once it has loaded. When the page is hidden before that, the
+remaining events are sent to the PostHog batch API with `navigator.sendBeacon`.
+"""
+
+import json
+from typing import Any
+
+import reflex as rx
+
+# Global holding the queue, an array of pending events until the runtime is installed
+EVENT_QUEUE_GLOBAL: str = "__reflexUiEvents"
+
+# Milliseconds to wait for more events before delivering a batch
+EVENT_QUEUE_BATCH_MS: int = 1000
+
+# Event queue runtime template, safe to run several times per page
+EVENT_QUEUE_SCRIPT_TEMPLATE: str = """
+(function () {{
+    if (typeof window === 'undefined') return;
+    var pending = window.{queue};
+    if (pending && !Array.isArray(pending)) return;
+    var storageKey = 'reflex_ui_telemetry_queue';
+    var read = function (key) {{
+        try {{
+            return JSON.parse(localStorage.getItem(key));
+        }} catch (e) {{
+            return null;
+        }}
+    }};
+    var write = function (key, value) {{
+        try {{
+            if (value === null) localStorage.removeItem(key);
+            else localStorage.setItem(key, JSON.stringify(value));
+        }} catch (e) {{}}
+    }};
+    var posthogId = function () {{
+        var posthog = window.posthog;
+        if (posthog && posthog.__loaded) return posthog.get_distinct_id();
+        var stored = read('ph_' + queue.config.apiKey + '_posthog');
+        return stored && stored.distinct_id;
+    }};
+    var queue = window.{queue} = {{
+        events: read(storageKey) || [],
+        config: {{}},
+        timer: null,
+        push: function () {{
+            Array.prototype.forEach.call(arguments, function (event) {{
+                event.timestamp = event.timestamp || new Date().toISOString();
+                queue.events.push(event);
+            }});
+            queue.save();
+            queue.schedule({batch_ms});
+            return queue.events.length;
+        }},
+        configure: function (config) {{
+            Object.assign(queue.config, config);
+            queue.schedule({batch_ms});
+        }},
+        save: function () {{
+            write(storageKey, queue.events.length ? queue.events : null);
+        }},
+        schedule: function (delay) {{
+            clearTimeout(queue.timer);
+            queue.timer = setTimeout(queue.flush, delay);
+        }},
+        flush: function () {{
+            var posthog = window.posthog;
+            if (!queue.events.length || navigator.onLine === false) return;
+            if (!posthog || !posthog.__loaded) {{
+                queue.schedule({batch_ms});
+                return;
+            }}
+            var events = queue.events.splice(0);
+            queue.save();
+            events.forEach(function (event) {{
+                if (event.type === 'identify') {{
+                    if (event.distinct_id) posthog.identify(event.distinct_id, event.properties);
+                }} else {{
+                    posthog.capture(event.event, event.properties, {{
+                        timestamp: new Date(event.timestamp),
+                    }});
+                }}
+            }});
+        }},
+        beacon: function () {{
+            var config = queue.config;
+            if (!queue.events.length || !config.apiKey || !navigator.sendBeacon) return;
+            // Events without an id of their own need PostHog's, and wait for it otherwise.
+            var fallbackId = posthogId();
+            var events = queue.events.filter(function (event) {{
+                return event.distinct_id || (fallbackId && event.type !== 'identify');
+            }});
+            if (!events.length) return;
+            var batch = events.map(function (event) {{
+                var identify = event.type === 'identify';
+                return {{
+                    event: identify ? '$identify' : event.event,
+                    distinct_id: event.distinct_id || fallbackId,
+                    properties: identify ? {{ $set: event.properties || {{}} }} : event.properties || {{}},
+                    timestamp: event.timestamp,
+                }};
+            }});
+            var body = JSON.stringify({{ api_key: config.apiKey, batch: batch }});
+            if (navigator.sendBeacon(config.apiHost + '/batch/', new Blob([body], {{ type: 'text/plain' }}))) {{
+                queue.events = queue.events.filter(function (event) {{
+                    return events.indexOf(event) === -1;
+                }});
+                queue.save();
+            }}
+        }},
+        drain: function () {{
+            if (window.posthog && window.posthog.__loaded) queue.flush();
+            else queue.beacon();
+        }},
+    }};
+    document.addEventListener('visibilitychange', function () {{
+        if (document.visibilityState === 'hidden') queue.drain();
+    }});
+    window.addEventListener('online', function () {{
+        queue.schedule(0);
+    }});
+    if (pending) queue.push.apply(queue, pending);
+    else queue.schedule({batch_ms});
+}})();
+window.{queue}.configure({config});
+"""
+
+
+def get_event_queue_script(api_key: str, api_host: str) -> str:
+    """Get the script installing the event queue and its PostHog beacon settings.
+
+    Args:
+        api_key: PostHog project API key used by the beacon.
+        api_host: PostHog API host URL used by the beacon.
+
+    Returns:
+        The event queue script.
+    """
+    return EVENT_QUEUE_SCRIPT_TEMPLATE.format(
+        queue=EVENT_QUEUE_GLOBAL,
+        batch_ms=EVENT_QUEUE_BATCH_MS,
+        config=json.dumps({"apiKey": api_key, "apiHost": api_host.rstrip("/")}),
+    )
+
+
+def enqueue_events(*events: dict[str, Any]) -> rx.event.EventSpec:
+    """Push events to the client event queue.
+
+    Events are either `{"type": "identify", "distinct_id": ..., "properties": ...}`
+    or `{"type": "capture", "event": ..., "distinct_id": ..., "properties": ...}`.
+    Captures without a distinct id use PostHog's anonymous id, identifies
+    without one are dropped.
+
+    Args:
+        *events: The events to push.
+
+    Returns:
+        Event that pushes the events in the browser.
+    """
+    payload = ", ".join(json.dumps(event) for event in events)
+    return rx.call_script(
+        f"(window.{EVENT_QUEUE_GLOBAL} = window.{EVENT_QUEUE_GLOBAL} || []).push({payload})"
+    )
@@ -2,6 +2,11 @@
 
 import reflex as rx
 
+from reflex_ui.blocks.scripts import run_once_script
+
+from .loader import Tracker
+from .worker import PARTYTOWN_SCRIPT_TYPE
+
 PIXEL_SCRIPT_RB2B: str = """
 !function () {var reb2b = window.reb2b = window.reb2b || [];if (reb2b.invoked) return;reb2b.invoked = true;reb2b.methods = ["identify", "collect"];reb2b.factory = function (method) {return function () {var args = Array.prototype.slice.call(arguments);args.unshift(method);reb2b.push(args);return reb2b;};};for (var i = 0; i < reb2b.methods.length; i++) {var key = reb2b.methods[i];reb2b[key] = reb2b.factory(key);}reb2b.load = function (key) {var script = document.createElement("script");script.type = "text/javascript";script.async = true;script.src = "https://s3-us-west-2.amazonaws.com/b2bjsstore/b/" + key + "/reb2b.js.gz";var first = document.getElementsByTagName("script")[0];first.parentNode.insertBefore(script, first);};reb2b.SNIPPET_VERSION = "1.0.1";reb2b.load("0OV0VHLWZX6Z");}();"""
 
@@ -18,13 +23,38 @@ PIXEL2 = """
     reb2b.SNIPPET_VERSION = "1.0.1";reb2b.load("4N210HEPR96Z");}();"""
 
 
-def get_rb2b_trackers() -> list[rx.Component]:
+def get_rb2b_trackers(worker: bool = False) -> list[rx.Component]:
     """Generate specific hardcoded RB2B tracking components.
 
+    Args:
+        worker: Whether to run the script in a web worker. Needs the Partytown runtime copied into the app's assets, see `get_partytown_runtime`
+
     Returns:
         list[rx.Component]: Both PIXEL_SCRIPT_RB2B and PIXEL2 script components
     """
+    if worker:
+        return [
+            rx.script(PIXEL_SCRIPT_RB2B, type=PARTYTOWN_SCRIPT_TYPE),
+            rx.script(PIXEL2, type=PARTYTOWN_SCRIPT_TYPE),
+        ]
     return [
-        rx.script(PIXEL_SCRIPT_RB2B),
-        rx.script(PIXEL2),
+        rx.script(run_once_script("rb2b", PIXEL_SCRIPT_RB2B)),
+        rx.script(run_once_script("rb2b:pixel2", PIXEL2)),
     ]
+
+
+def rb2b_tracker(priority: int = 0) -> Tracker:
+    """Declare the RB2B tracker for `get_deferred_trackers`.
+
+    Args:
+        priority: Load order relative to other trackers
+
+    Returns:
+        Tracker: Tracker running both PIXEL_SCRIPT_RB2B and PIXEL2
+    """
+    return Tracker(
+        name="rb2b",
+        script=f"{PIXEL_SCRIPT_RB2B}\n{PIXEL2}",
+        queues={"reb2b": ["identify", "collect"]},
+        priority=priority,
+    )
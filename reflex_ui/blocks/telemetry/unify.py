@@ -2,14 +2,55 @@
 
 import reflex as rx
 
+from reflex_ui.blocks.scripts import run_once_script
+
+from .loader import Tracker
+from .worker import PARTYTOWN_SCRIPT_TYPE
+
+UNIFY_METHODS: list[str] = [
+    "identify",
+    "page",
+    "startAutoPage",
+    "stopAutoPage",
+    "startAutoIdentify",
+    "stopAutoIdentify",
+]
+
 PIXEL_SCRIPT_UNIFY: str = """
 !function(){var e=["identify","page","startAutoPage","stopAutoPage","startAutoIdentify","stopAutoIdentify"];function t(o){return Object.assign([],e.reduce(function(r,n){return r[n]=function(){return o.push([n,[].slice.call(arguments)]),o},r},{}))}window.unify||(window.unify=t(window.unify)),window.unifyBrowser||(window.unifyBrowser=t(window.unifyBrowser));var n=document.createElement("script");n.async=!0,n.setAttribute("src","https://tag.unifyintent.com/v1/XAyM6RZXJzKpWH6mKPaB5S/script.js"),n.setAttribute("data-api-key","wk_DAwnkdfG_625skePqM8NZjq7jFvo6SnWFUPH2aRth"),n.setAttribute("id","unifytag"),(document.body||document.head).appendChild(n)}();"""
 
+# Unify queue stub from PIXEL_SCRIPT_UNIFY, run before the tag script is loaded
+UNIFY_QUEUE_STUB: str = """
+!function(){var e=["identify","page","startAutoPage","stopAutoPage","startAutoIdentify","stopAutoIdentify"];function t(o){return Object.assign(o,e.reduce(function(r,n){return r[n]=function(){return o.push([n,[].slice.call(arguments)]),o},r},{}))}window.unify||(window.unify=t([])),window.unifyBrowser||(window.unifyBrowser=t([]))}();"""
 
-def get_unify_trackers() -> rx.Component:
+
+def get_unify_trackers(worker: bool = False) -> rx.Component:
     """Generate specific hardcoded Unify tracking components.
 
+    Args:
+        worker: Whether to run the script in a web worker. Needs the Partytown runtime copied into the app's assets, see `get_partytown_runtime`
+
     Returns:
         rx.Component: The PIXEL_SCRIPT_UNIFY script component
     """
-    return rx.script(PIXEL_SCRIPT_UNIFY)
+    if worker:
+        return rx.script(PIXEL_SCRIPT_UNIFY, type=PARTYTOWN_SCRIPT_TYPE)
+    return rx.script(run_once_script("unify", PIXEL_SCRIPT_UNIFY))
+
+
+def unify_tracker(priority: int = 0) -> Tracker:
+    """Declare the Unify tracker for `get_deferred_trackers`.
+
+    Args:
+        priority: Load order relative to other trackers
+
+    Returns:
+        Tracker: The Unify tracker
+    """
+    return Tracker(
+        name="unify",
+        stub=UNIFY_QUEUE_STUB,
+        script=PIXEL_SCRIPT_UNIFY,
+        queues={"unify": UNIFY_METHODS, "unifyBrowser": UNIFY_METHODS},
+        priority=priority,
+    )
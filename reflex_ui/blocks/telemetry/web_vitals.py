@@ -0,0 +1,292 @@
+"""Core Web Vitals collection for Reflex UI pages.
+
+Records LCP, CLS, INP, TTFB and hydration time per route in the browser and
+attributes each metric to the `data-slot` of the responsible element where
+possible. Reports are batched and sent with `navigator.sendBeacon` to an
+endpoint, or captured as `web_vitals` events through the PostHog event queue.
+"""
+
+import json
+import math
+import statistics
+from collections import deque
+from typing import Any
+
+import reflex as rx
+from reflex.components.tags.tag import Tag
+from reflex.utils import console
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+
+from .queue import EVENT_QUEUE_GLOBAL
+
+# Path of the local test endpoint
+DEFAULT_WEB_VITALS_PATH: str = "/_web_vitals"
+
+# Number of reports collected before a batch is sent early
+WEB_VITALS_BATCH_SIZE: int = 10
+
+# Web vitals runtime template, installed once per page
+WEB_VITALS_SCRIPT_TEMPLATE: str = """
+if (!window.__reflexUiWebVitals) {{
+  const config = {{ endpoint: {endpoint}, sampleRate: {sample_rate} }};
+  const vitals = (window.__reflexUiWebVitals = {{
+    path: window.location.pathname,
+    reports: [],
+    route: () => {{}},
+  }});
+  if (Math.random() < config.sampleRate) {{
+    const navigation = performance.getEntriesByType('navigation')[0];
+    const activationStart = (navigation && navigation.activationStart) || 0;
+    const since = (time) => Math.max(time - activationStart, 0);
+    const slotOf = (node) => {{
+      const element = node && (node.nodeType === 1 ? node : node.parentElement);
+      const slot = element && element.closest('[data-slot]');
+      return slot ? slot.getAttribute('data-slot') : null;
+    }};
+    const observe = (type, callback, options) => {{
+      try {{
+        new PerformanceObserver((list) => callback(list.getEntries())).observe({{
+          type,
+          buffered: true,
+          ...options,
+        }});
+      }} catch (e) {{}}
+    }};
+    const lcp = {{ value: null, slot: null, path: vitals.path }};
+    const cls = {{ value: 0, slot: null, reported: false, session: 0, first: 0, last: 0, largest: 0, sessionSlot: null }};
+    let interactions = {{}};
+
+    const report = (name, value, slot, path) => {{
+      vitals.reports.push({{
+        metric: name,
+        value: Math.round(value * 1000) / 1000,
+        slot,
+        path: path || vitals.path,
+      }});
+      if (vitals.reports.length >= {batch_size}) vitals.flush();
+    }};
+    vitals.flush = () => {{
+      if (!vitals.reports.length) return;
+      const reports = vitals.reports.splice(0);
+      if (config.endpoint) {{
+        const body = JSON.stringify({{ reports }});
+        const sent = navigator.sendBeacon && navigator.sendBeacon(config.endpoint, new Blob([body], {{ type: 'text/plain' }}));
+        if (!sent) fetch(config.endpoint, {{ method: 'POST', body, keepalive: true }}).catch(() => {{}});
+        return;
+      }}
+      const queue = (window.{queue} = window.{queue} || []);
+      queue.push(...reports.map((properties) => ({{ type: 'capture', event: 'web_vitals', properties }})));
+      if (document.visibilityState === 'hidden' && queue.drain) queue.drain();
+    }};
+    const finalize = () => {{
+      if (lcp.value !== null) {{
+        report('LCP', lcp.value, lcp.slot, lcp.path);
+        lcp.value = null;
+      }}
+      if (!cls.reported || cls.value > 0) {{
+        report('CLS', cls.value, cls.slot);
+        Object.assign(cls, {{ value: 0, slot: null, reported: true, session: 0 }});
+      }}
+      const durations = Object.values(interactions).sort((a, b) => b.duration - a.duration);
+      if (durations.length) {{
+        const worst = durations[Math.min(Math.floor(durations.length / 50), durations.length - 1)];
+        report('INP', worst.duration, worst.slot);
+        interactions = {{}};
+      }}
+    }};
+
+    if (navigation) report('TTFB', since(navigation.responseStart), null);
+    report('hydration', since(performance.now()), null);
+    observe('largest-contentful-paint', (entries) => {{
+      const entry = entries[entries.length - 1];
+      if (!entry || lcp.path !== vitals.path) return;
+      lcp.value = since(entry.startTime);
+      lcp.slot = slotOf(entry.element);
+    }});
+    observe('layout-shift', (entries) => entries.forEach((entry) => {{
+      if (entry.hadRecentInput) return;
+      if (cls.session && entry.startTime - cls.last < 1000 && entry.startTime - cls.first < 5000) {{
+        cls.session += entry.value;
+      }} else {{
+        Object.assign(cls, {{ session: entry.value, first: entry.startTime, largest: 0, sessionSlot: null }});
+      }}
+      cls.last = entry.startTime;
+      if (entry.value > cls.largest) {{
+        const source = (entry.sources || []).find((source) => source.node);
+        cls.largest = entry.value;
+        cls.sessionSlot = slotOf(source && source.node);
+      }}
+      if (cls.session > cls.value) {{
+        cls.value = cls.session;
+        cls.slot = cls.sessionSlot;
+      }}
+    }}));
+    const onInteraction = (entries) => entries.forEach((entry) => {{
+      if (!entry.interactionId) return;
+      const current = interactions[entry.interactionId];
+      if (!current || entry.duration > current.duration) {{
+        interactions[entry.interactionId] = {{ duration: entry.duration, slot: slotOf(entry.target) }};
+      }}
+    }});
+    observe('event', onInteraction, {{ durationThreshold: 40 }});
+    observe('first-input', onInteraction);
+
+    document.addEventListener('visibilitychange', () => {{
+      if (document.visibilityState !== 'hidden') return;
+      finalize();
+      vitals.flush();
+    }});
+    vitals.route = (path) => {{
+      if (path === vitals.path) return;
+      finalize();
+      vitals.path = path;
+      cls.reported = false;
+    }};
+  }}
+}}
+window.__reflexUiWebVitals.route({pathname});
+"""
+
+
+class WebVitalsTracker(rx.Component):
+    """Collects Core Web Vitals for the pages it is rendered on."""
+
+    tag = "WebVitalsTracker"
+
+    # Endpoint receiving the batched reports. Reports go to PostHog when empty.
+    endpoint: rx.Var[str] = rx.Var.create("")
+
+    # Fraction of page loads that are measured, between 0 and 1.
+    sample_rate: rx.Var[float] = rx.Var.create(1.0)
+
+    def add_imports(self) -> rx.ImportDict:
+        """Add React and router imports.
+
+        Returns:
+            Dictionary of imports needed for the component
+        """
+        return {
+            "react": rx.ImportVar("useEffect"),
+            "react-router": rx.ImportVar("useLocation"),
+        }
+
+    def add_hooks(self) -> list[str | rx.Var]:
+        """Add the hook installing the collector and tracking the current route.
+
+        The first run happens after the initial render is committed, which is
+        recorded as the hydration time.
+
+        Returns:
+            List of hook code strings collecting web vitals
+        """
+        script = WEB_VITALS_SCRIPT_TEMPLATE.format(
+            endpoint=f"{self.endpoint!s}",
+            sample_rate=f"{self.sample_rate!s}",
+            batch_size=WEB_VITALS_BATCH_SIZE,
+            queue=EVENT_QUEUE_GLOBAL,
+            pathname="webVitalsLocation.pathname",
+        )
+        return [
+            "const webVitalsLocation = useLocation()",
+            rx.Var(f"""useEffect(() => {{{script}}}, [webVitalsLocation.pathname])"""),
+        ]
+
+    def _render(self, props: dict[str, Any] | None = None) -> Tag:
+        """Render empty tag."""
+        return Tag("")
+
+
+def get_web_vitals_tracker(
+    endpoint: str = "", sample_rate: float = 1.0
+) -> rx.Component:
+    """Generate the Core Web Vitals collector for a Reflex application.
+
+    Args:
+        endpoint: Endpoint receiving the batched reports, e.g. `web_vitals_api`.
+            Reports are captured in PostHog when empty.
+        sample_rate: Fraction of page loads that are measured, between 0 and 1.
+
+    Returns:
+        rx.Component: The web vitals collector
+    """
+    return WebVitalsTracker.create(endpoint=endpoint, sample_rate=sample_rate)
+
+
+def _is_valid_report(report: Any) -> bool:
+    # A report object with a finite numeric value.
+    if not isinstance(report, dict):
+        return False
+    value = report.get("value")
+    return (
+        isinstance(value, int | float)
+        and not isinstance(value, bool)
+        and math.isfinite(value)
+    )
+
+
+def web_vitals_api(
+    path: str = DEFAULT_WEB_VITALS_PATH, max_reports: int = 1000
+) -> Starlette:
+    """Create a local endpoint collecting web vitals reports, e.g. for testing.
+
+    Mount it with `rx.App(api_transformer=web_vitals_api())` and pass the same
+    path as the tracker endpoint. POST requests store and log reports, GET
+    requests return the p75 of each metric per route and slot.
+
+    Args:
+        path: Path of the endpoint.
+        max_reports: Number of most recent reports kept in memory.
+
+    Returns:
+        The Starlette app serving the endpoint.
+    """
+    reports: deque[dict[str, Any]] = deque(maxlen=max_reports)
+
+    async def collect(request: Request) -> Response:
+        try:
+            batch = json.loads(await request.body()).get("reports", [])
+        except (ValueError, AttributeError):
+            return Response(status_code=400)
+        if not isinstance(batch, list) or not all(map(_is_valid_report, batch)):
+            return Response(status_code=400)
+        for report in batch:
+            console.info(
+                f"web vitals: {report.get('path')} {report.get('metric')}="
+                f"{report.get('value')} slot={report.get('slot')}"
+            )
+        reports.extend(batch)
+        return Response(status_code=204)
+
+    async def summary(request: Request) -> JSONResponse:
+        groups: dict[tuple[str, str, str | None], list[float]] = {}
+        for report in reports:
+            key = (report.get("path"), report.get("metric"), report.get("slot"))
+            groups.setdefault(key, []).append(float(report["value"]))
+        return JSONResponse(
+            [
+                {
+                    "path": route,
+                    "metric": metric,
+                    "slot": slot,
+                    "count": len(values),
+                    "p75": (
+                        statistics.quantiles(values, n=4, method="inclusive")[2]
+                        if len(values) > 1
+                        else values[0]
+                    ),
+                }
+                for (route, metric, slot), values in sorted(
+                    groups.items(), key=lambda item: str(item[0])
+                )
+            ]
+        )
+
+    return Starlette(
+        routes=[
+            Route(path, collect, methods=["POST"]),
+            Route(path, summary, methods=["GET"]),
+        ]
+    )
@@ -0,0 +1,156 @@
+"""Web worker offloading of third-party telemetry scripts with Partytown.
+
+Trackers rendered with `worker=True` emit `text/partytown` scripts, which the
+browser does not run. The Partytown runtime executes them in a web worker and
+proxies the DOM and `window` calls they make to the main thread.
+
+The runtime is served from the app's own origin, as required by its service
+worker. It has to be copied into the app's assets once the frontend packages
+are installed, see `get_partytown_runtime`. When the runtime is not found
+there, the scripts run on the main thread instead, with a console warning, so
+the trackers keep working.
+"""
+
+from collections.abc import Sequence
+from typing import Any
+
+import reflex as rx
+from reflex.components.tags.tag import Tag
+
+from .loader import Tracker
+
+PARTYTOWN_PACKAGE = "@builder.io/partytown"
+PARTYTOWN_VERSION = "0.10.2"
+
+# Path the Partytown runtime files are served from
+DEFAULT_PARTYTOWN_LIB = "/~partytown/"
+
+# Script type that keeps a script off the main thread
+PARTYTOWN_SCRIPT_TYPE = "text/partytown"
+
+
+class PartytownRuntime(rx.Component):
+    """Runs the page's `text/partytown` scripts in a web worker."""
+
+    tag = "PartytownRuntime"
+
+    lib_dependencies: list[str] = [f"{PARTYTOWN_PACKAGE}@{PARTYTOWN_VERSION}"]
+
+    # Path the runtime files are served from, ending with a slash.
+    lib: rx.Var[str] = rx.Var.create(DEFAULT_PARTYTOWN_LIB)
+
+    # Main thread globals forwarded to the worker, e.g. "ko.identify".
+    forward: rx.Var[list[str]] = rx.Var.create([])
+
+    # Whether to load the unminified runtime with debug logs.
+    debug: rx.Var[bool] = rx.Var.create(False)
+
+    def add_imports(self) -> rx.ImportDict:
+        """Add the Partytown snippet import.
+
+        Returns:
+            Dictionary of imports needed for the component
+        """
+        return {
+            "react": rx.ImportVar("useEffect"),
+            f"{PARTYTOWN_PACKAGE}/integration": rx.ImportVar("partytownSnippet"),
+        }
+
+    def add_hooks(self) -> list[str | rx.Var]:
+        """Add the hook that starts the runtime, or the fallback, once per page.
+
+        Returns:
+            List of hook code strings starting Partytown
+        """
+        return [
+            rx.Var(
+                f"""useEffect(() => {{
+  const lib = {self.lib!s};
+  // Run the worker scripts as regular scripts, next to the inert originals.
+  const runOnMainThread = () => {{
+    document.querySelectorAll('script[type="{PARTYTOWN_SCRIPT_TYPE}"]:not([data-pt-fallback])').forEach((original) => {{
+      original.setAttribute('data-pt-fallback', '');
+      const script = document.createElement('script');
+      for (const attribute of original.attributes) {{
+        if (attribute.name !== 'type' && attribute.name !== 'data-pt-fallback') {{
+          script.setAttribute(attribute.name, attribute.value);
+        }}
+      }}
+      script.text = original.text;
+      original.after(script);
+    }});
+  }};
+  if (window.__reflexUiPartytown === 'fallback') {{
+    runOnMainThread();
+    return;
+  }}
+  if (window.__reflexUiPartytown === 'worker') {{
+    // Pick up scripts rendered after the runtime started.
+    window.dispatchEvent(new CustomEvent('ptupdate'));
+    return;
+  }}
+  if (window.__reflexUiPartytown) return;
+  window.__reflexUiPartytown = 'pending';
+  fetch(`${{lib}}partytown.js`, {{ method: 'HEAD' }})
+    .then((response) => {{
+      if (!response.ok || !(response.headers.get('content-type') || '').includes('javascript')) {{
+        throw new Error(`HTTP ${{response.status}}`);
+      }}
+      window.__reflexUiPartytown = 'worker';
+      const script = document.createElement('script');
+      script.text = partytownSnippet({{
+        lib,
+        forward: {self.forward!s},
+        debug: {self.debug!s},
+      }});
+      document.head.appendChild(script);
+    }})
+    .catch(() => {{
+      console.warn(`Partytown runtime not found at ${{lib}}, running worker scripts on the main thread. Copy it with 'cd .web && npx partytown copylib ../assets/~partytown'.`);
+      window.__reflexUiPartytown = 'fallback';
+      runOnMainThread();
+    }});
+}}, [])"""
+            )
+        ]
+
+    def _render(self, props: dict[str, Any] | None = None) -> Tag:
+        """Render empty tag."""
+        return Tag("")
+
+
+def get_partytown_runtime(
+    *trackers: Tracker,
+    forward: Sequence[str] = (),
+    lib: str = DEFAULT_PARTYTOWN_LIB,
+    debug: bool = False,
+) -> rx.Component:
+    """Generate the Partytown runtime for trackers rendered with `worker=True`.
+
+    The runtime files are not bundled, copy them into the app's assets once
+    the frontend packages are installed, and again after upgrading them:
+
+        cd .web && npx partytown copylib ../assets/~partytown
+
+    Without them, the trackers run on the main thread with a console warning.
+
+    Args:
+        *trackers: Trackers whose queued globals are forwarded to the worker.
+        forward: Additional main thread globals forwarded to the worker.
+        lib: Path the runtime files are served from.
+        debug: Whether to load the unminified runtime with debug logs.
+
+    Returns:
+        rx.Component: The runtime component
+    """
+    forwarded = [
+        f"{name}.{method}"
+        for tracker in trackers
+        for name, methods in tracker.queues.items()
+        for method in methods
+    ]
+    return PartytownRuntime.create(
+        lib=lib,
+        forward=list(dict.fromkeys([*forwarded, *forward])),
+        debug=debug,
+    )
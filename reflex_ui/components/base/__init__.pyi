@@ -26,6 +26,7 @@ from .scroll_area import scroll_area
 from .select import select
 from .skeleton import skeleton
 from .slider import slider
+from .suspense import suspense
 from .switch import switch
 from .tabs import tabs
 from .textarea import textarea
@@ -61,6 +62,7 @@ __all__ = [
     "select",
     "skeleton",
     "slider",
+    "suspense",
     "switch",
     "tabs",
     "textarea",
@@ -1,13 +1,16 @@
 """Custom drawer component."""
 
 from collections.abc import Sequence
-from typing import Literal
+from typing import ClassVar, Literal
 
 from reflex.components.component import Component, ComponentNamespace
-from reflex.event import EventHandler, passthrough_event_spec
-from reflex.vars.base import Var
+from reflex.components.core.cond import cond
+from reflex.event import EventHandler, call_function, passthrough_event_spec
+from reflex.utils.imports import ImportVar
+from reflex.vars.base import Var, VarData, get_unique_variable_name
 
 from reflex_ui.components.component import CoreComponent
+from reflex_ui.utils.events import event_list
 
 LiteralDirectionType = Literal["top", "bottom", "left", "right"]
 
@@ -24,6 +27,10 @@ class ClassNames:
     TITLE = "text-2xl font-semibold text-secondary-12"
     DESCRIPTION = "text-sm text-secondary-11"
     HANDLE = ""
+    # Vaul slides the content with transform and fades the overlay with opacity,
+    # these promote them to their own layers so a fresh mount doesn't repaint.
+    LAZY_CONTENT = "will-change-transform transform-gpu [backface-visibility:hidden]"
+    LAZY_OVERLAY = "will-change-[opacity]"
 
 
 class DrawerBaseComponent(CoreComponent):
@@ -226,6 +233,12 @@ class HighLevelDrawer(DrawerRoot):
     title: Var[str | Component | None]
     description: Var[str | Component | None]
 
+    # Whether to mount the drawer content only after the drawer is opened for the first time. Defaults to False.
+    lazy_mount: ClassVar[bool]
+
+    # Milliseconds to wait after the drawer is closed before releasing its content. Only used with lazy_mount. Defaults to keeping the content mounted.
+    unmount_delay: ClassVar[int | None]
+
     @classmethod
     def create(cls, *children, **props) -> Component:
         """Create the high level drawer component."""
@@ -233,25 +246,113 @@ class HighLevelDrawer(DrawerRoot):
         content = props.pop("content", None)
         title = props.pop("title", None)
         description = props.pop("description", None)
+        lazy_mount = props.pop("lazy_mount", False)
+        unmount_delay = props.pop("unmount_delay", None)
 
-        return super().create(
-            DrawerTrigger.create(render_=trigger) if trigger is not None else None,
-            DrawerPortal.create(
-                DrawerOverlay.create(),
-                DrawerContent.create(
-                    DrawerTitle.create(title) if title is not None else None,
-                    (
-                        DrawerDescription.create(description)
-                        if description is not None
-                        else None
-                    ),
-                    content,
-                    *children,
+        portal = DrawerPortal.create(
+            DrawerOverlay.create(
+                class_name=ClassNames.LAZY_OVERLAY if lazy_mount else "",
+            ),
+            DrawerContent.create(
+                DrawerTitle.create(title) if title is not None else None,
+                (
+                    DrawerDescription.create(description)
+                    if description is not None
+                    else None
                 ),
+                content,
+                *children,
+                class_name=ClassNames.LAZY_CONTENT if lazy_mount else "",
             ),
+        )
+
+        if lazy_mount:
+            portal = cls._create_lazy_portal(portal, unmount_delay, props)
+
+        return super().create(
+            DrawerTrigger.create(render_=trigger) if trigger is not None else None,
+            portal,
             **props,
         )
 
+    @staticmethod
+    def _create_lazy_portal(
+        portal: Component, unmount_delay: int | None, props: dict
+    ) -> Component:
+        """Wrap the portal so it mounts on first open and is released after closing.
+
+        Args:
+            portal: The drawer portal to mount lazily.
+            unmount_delay: Milliseconds to keep the content mounted after closing.
+            props: The drawer root props, updated with the mount event handlers.
+
+        Returns:
+            The conditionally rendered portal.
+        """
+        mounted = get_unique_variable_name()
+        timer = f"{mounted}_timer"
+        # A drawer rendered open mounts its content right away.
+        open_props = [
+            Var.create(props[name])
+            for name in ("open", "default_open")
+            if name in props
+        ]
+        initial = " || ".join(f"({prop!s})" for prop in open_props) or "false"
+        hooks: dict[str, VarData | None] = {
+            f"const [{mounted}, set_{mounted}] = useState(() => Boolean({initial}))": VarData.merge(
+                *(prop._get_all_var_data() for prop in open_props)
+            ),
+            f"const {timer} = useRef(null)": None,
+            f"useEffect(() => () => clearTimeout({timer}.current), [])": None,
+        }
+        if "open" in props:
+            # A drawer opened through its controlled `open` prop fires no open change.
+            open_prop = open_props[0]
+            open_js = str(open_prop)
+            hooks[
+                f"useEffect(() => {{ if ({open_js}) {{ clearTimeout({timer}.current); set_{mounted}(true); }} }}, [{open_js}])"
+            ] = open_prop._get_all_var_data()
+        var_data = VarData(
+            hooks=hooks,
+            imports={
+                "react": [
+                    ImportVar(tag="useState"),
+                    ImportVar(tag="useRef"),
+                    ImportVar(tag="useEffect"),
+                ]
+            },
+        )
+
+        def on_open_change(open: Var[bool]):
+            return call_function(
+                Var(
+                    f"() => {{ if ({open}) {{ clearTimeout({timer}.current); set_{mounted}(true); }} }}",
+                    _var_data=var_data,
+                )
+            )
+
+        props["on_open_change"] = [
+            *event_list(props.get("on_open_change")),
+            on_open_change,
+        ]
+
+        if unmount_delay is not None:
+
+            def on_animation_end(open: Var[bool]):
+                return call_function(
+                    Var(
+                        f"() => {{ if (!{open}) {{ clearTimeout({timer}.current); {timer}.current = setTimeout(() => set_{mounted}(false), {int(unmount_delay)}); }} }}",
+                        _var_data=var_data,
+                    )
+                )
+
+            props["on_animation_end"] = [
+                *event_list(props.get("on_animation_end")),
+                on_animation_end,
+            ]
+
+        return cond(Var(mounted, _var_data=var_data), portal)
+
     def _exclude_props(self) -> list[str]:
         return [
             *super()._exclude_props(),
@@ -259,6 +360,8 @@ class HighLevelDrawer(DrawerRoot):
             "content",
             "title",
             "description",
+            "lazy_mount",
+            "unmount_delay",
         ]
 
 
@@ -4,7 +4,7 @@
 # This file was generated by `reflex/utils/pyi_generator.py`!
 # ------------------------------------------------------
 from collections.abc import Mapping, Sequence
-from typing import Any, Literal
+from typing import Any, ClassVar, Literal
 
 from reflex.components.component import Component, ComponentNamespace
 from reflex.components.core.breakpoints import Breakpoints
@@ -25,6 +25,8 @@ class ClassNames:
     TITLE = "text-2xl font-semibold text-secondary-12"
     DESCRIPTION = "text-sm text-secondary-11"
     HANDLE = ""
+    LAZY_CONTENT = "will-change-transform transform-gpu [backface-visibility:hidden]"
+    LAZY_OVERLAY = "will-change-[opacity]"
 
 class DrawerBaseComponent(CoreComponent):
     @classmethod
@@ -426,6 +428,9 @@ class DrawerHandle(DrawerBaseComponent):
         """Create the drawer handle component."""
 
 class HighLevelDrawer(DrawerRoot):
+    lazy_mount: ClassVar[bool]
+    unmount_delay: ClassVar[int | None]
+
     @classmethod
     def create(
         cls,
@@ -434,6 +439,8 @@ class HighLevelDrawer(DrawerRoot):
         content: Component | Var[Component | str | None] | str | None = None,
         title: Component | Var[Component | str | None] | str | None = None,
         description: Component | Var[Component | str | None] | str | None = None,
+        lazy_mount: ClassVar[bool] | None = None,
+        unmount_delay: ClassVar[int | None] | None = None,
         default_open: Var[bool] | bool | None = None,
         open: Var[bool] | bool | None = None,
         modal: Var[bool] | bool | None = None,
@@ -501,6 +508,8 @@ class Drawer(ComponentNamespace):
         content: Component | Var[Component | str | None] | str | None = None,
         title: Component | Var[Component | str | None] | str | None = None,
         description: Component | Var[Component | str | None] | str | None = None,
+        lazy_mount: ClassVar[bool] | None = None,
+        unmount_delay: ClassVar[int | None] | None = None,
         default_open: Var[bool] | bool | None = None,
         open: Var[bool] | bool | None = None,
         modal: Var[bool] | bool | None = None,
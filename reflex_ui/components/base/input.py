@@ -1,16 +1,31 @@
 """Custom input component."""
 
-from typing import ClassVar, Literal
+from typing import Any, ClassVar, Literal
 
 from reflex.components.component import Component, ComponentNamespace
 from reflex.components.el import Button, Div, Span
 from reflex.components.el import Input as ReflexInput
-from reflex.event import EventHandler, passthrough_event_spec, set_focus, set_value
+from reflex.event import (
+    EventChain,
+    EventHandler,
+    EventSpec,
+    JavascriptInputEvent,
+    call_event_fn,
+    call_event_handler,
+    call_function,
+    input_event,
+    passthrough_event_spec,
+    set_focus,
+    set_value,
+)
+from reflex.utils import console
 from reflex.utils.imports import ImportVar
-from reflex.vars.base import Var, get_unique_variable_name
+from reflex.vars.base import Var, VarData, get_unique_variable_name
+from reflex.vars.object import ObjectVar
 
 from reflex_ui.components.base_ui import PACKAGE_NAME, BaseUIComponent
 from reflex_ui.components.icons.hugeicon import hi
+from reflex_ui.utils.events import event_list
 from reflex_ui.utils.twmerge import cn
 
 INPUT_SIZE_VARIANTS = {
@@ -31,6 +46,20 @@ DEFAULT_INPUT_ATTRS = {
 }
 
 
+def _value_change_on_blur(
+    e: ObjectVar[JavascriptInputEvent],
+) -> tuple[Var[str], Var[dict]]:
+    """Get the on_value_change arguments from a blur event.
+
+    Args:
+        e: The blur event.
+
+    Returns:
+        The value of the input and empty change details.
+    """
+    return input_event(e)[0], Var.create({})
+
+
 class ClassNames:
     """Class names for input components."""
 
@@ -79,6 +108,15 @@ class HighLevelInput(InputBaseComponent):
     # Events to fire when the clear button is clicked.
     clear_events: Var[list[EventHandler]]
 
+    # Delay in milliseconds to debounce the change events by. Needs an uncontrolled input, use default_value instead of value.
+    debounce_ms: Var[int]
+
+    # Minimum interval in milliseconds between change events. Needs an uncontrolled input, use default_value instead of value.
+    throttle_ms: Var[int]
+
+    # Whether to keep the value on the client and only fire the change events on blur or enter. Defaults to False.
+    commit_on_blur: Var[bool]
+
     _el_input_props = {
         "default_value",
         "on_value_change",
@@ -131,6 +169,19 @@ class HighLevelInput(InputBaseComponent):
         class_name = props.pop("class_name", "")
         show_clear_button = props.pop("show_clear_button", True)
         clear_events = props.pop("clear_events", [])
+        debounce_ms = props.pop("debounce_ms", None)
+        throttle_ms = props.pop("throttle_ms", None)
+        commit_on_blur = props.pop("commit_on_blur", False)
+        if (
+            (debounce_ms is not None or throttle_ms is not None)
+            and not commit_on_blur
+            and "value" in input_props
+        ):
+            # React puts the bound value back before the delayed event fires.
+            console.warn(
+                "ui.input with debounce_ms or throttle_ms drops keystrokes when "
+                "controlled with value. Use default_value instead."
+            )
         # Configure input with merged attributes
         custom_attrs_override = props.pop("custom_attrs", {})
         input_props.update(
@@ -143,6 +194,22 @@ class HighLevelInput(InputBaseComponent):
             }
         )
 
+        change_triggers = ["on_change", "on_value_change"]
+        if commit_on_blur:
+            cls._set_commit_on_blur(id, input_props)
+            change_triggers = ["on_blur"]
+
+        input_root = InputRoot.create(**input_props)
+        for trigger in change_triggers:
+            chain = input_root.event_triggers.get(trigger)
+            if not isinstance(chain, EventChain):
+                continue
+            if debounce_ms is not None:
+                chain = chain.debounce(debounce_ms)
+            if throttle_ms is not None:
+                chain = chain.throttle(throttle_ms)
+            input_root.event_triggers[trigger] = chain
+
         return Div.create(  # pyright: ignore[reportReturnType]
             (
                 Span.create(
@@ -152,7 +219,7 @@ class HighLevelInput(InputBaseComponent):
                 if icon
                 else None
             ),
-            InputRoot.create(**input_props),
+            input_root,
             (cls._create_clear_button(id, clear_events) if show_clear_button else None),
             *children,
             on_click=set_focus(id),
@@ -160,6 +227,60 @@ class HighLevelInput(InputBaseComponent):
             **props,
         )
 
+    @staticmethod
+    def _set_commit_on_blur(id: str, input_props: dict) -> None:
+        """Move the change events to blur and make enter blur the input.
+
+        Args:
+            id: The id of the input element.
+            input_props: The input props, updated in place.
+        """
+        if "value" in input_props:
+            # Keep the value on the client, resyncing when the bound value changes
+            # unless the user is editing it.
+            value = Var.create(input_props.pop("value"))
+            input_props["default_value"] = value._replace(
+                merge_var_data=VarData(
+                    hooks={
+                        f"useEffect(() => {{ const el = document.getElementById('{id}'); if (el && el !== document.activeElement) el.value = {value!s} ?? ''; }}, [{value!s}])": None
+                    },
+                    imports={"react": [ImportVar(tag="useEffect")]},
+                )
+            )
+        input_props["on_blur"] = [
+            *event_list(input_props.pop("on_blur", None)),
+            *event_list(input_props.pop("on_change", None)),
+            *(
+                event
+                for handler in event_list(input_props.pop("on_value_change", None))
+                for event in event_list(HighLevelInput._adapt_value_change(handler))
+            ),
+        ]
+        input_props["on_key_down"] = [
+            *event_list(input_props.pop("on_key_down", None)),
+            lambda key: call_function(
+                Var(
+                    f"() => {{ if ({key!s} === 'Enter') document.getElementById('{id}')?.blur(); }}"
+                )
+            ),
+        ]
+
+    @staticmethod
+    def _adapt_value_change(handler: Any) -> Any:
+        """Bind an on_value_change handler to the arguments of a blur event.
+
+        Args:
+            handler: The on_value_change handler.
+
+        Returns:
+            The handler for on_blur.
+        """
+        if isinstance(handler, EventHandler | EventSpec):
+            return call_event_handler(handler, _value_change_on_blur)
+        if callable(handler) and not isinstance(handler, Var):
+            return call_event_fn(handler, _value_change_on_blur)
+        return handler
+
     @staticmethod
     def _create_clear_button(id: str, clear_events: list[EventHandler]) -> Button:
         """Create the clear button component."""
@@ -182,6 +303,9 @@ class HighLevelInput(InputBaseComponent):
             "icon",
             "show_clear_button",
             "clear_events",
+            "debounce_ms",
+            "throttle_ms",
+            "commit_on_blur",
         ]
 
 
@@ -412,6 +412,9 @@ class HighLevelInput(InputBaseComponent):
         icon: Var[str] | str | None = None,
         show_clear_button: ClassVar[bool] | None = None,
         clear_events: Var[list[EventHandler]] | list[EventHandler] | None = None,
+        debounce_ms: Var[int] | int | None = None,
+        throttle_ms: Var[int] | int | None = None,
+        commit_on_blur: Var[bool] | bool | None = None,
         unstyled: Var[bool] | bool | None = None,
         style: Sequence[Mapping[str, Any]]
         | Mapping[str, Any]
@@ -456,6 +459,9 @@ class Input(ComponentNamespace):
         icon: Var[str] | str | None = None,
         show_clear_button: ClassVar[bool] | None = None,
         clear_events: Var[list[EventHandler]] | list[EventHandler] | None = None,
+        debounce_ms: Var[int] | int | None = None,
+        throttle_ms: Var[int] | int | None = None,
+        commit_on_blur: Var[bool] | bool | None = None,
         unstyled: Var[bool] | bool | None = None,
         style: Sequence[Mapping[str, Any]]
         | Mapping[str, Any]
@@ -3,9 +3,10 @@
 from typing import Literal
 
 from reflex.components.component import Component, ComponentNamespace
-from reflex.event import EventHandler, passthrough_event_spec
+from reflex.event import EventChain, EventHandler, passthrough_event_spec
 from reflex.utils.imports import ImportVar
-from reflex.vars.base import Var
+from reflex.vars.base import Var, VarData, get_unique_variable_name
+from reflex.vars.function import FunctionVar
 
 from reflex_ui.components.base_ui import PACKAGE_NAME, BaseUIComponent
 
@@ -223,6 +224,12 @@ class SliderThumb(SliderBaseComponent):
 class HighLevelSlider(SliderRoot):
     """High-level wrapper for the Slider component."""
 
+    # Minimum milliseconds between on_value_change events while dragging. Use 0 to send at most one per animation frame. The latest value is always sent.
+    change_interval: Var[int]
+
+    # Whether to keep intermediate values on the client and only send on_value_committed. Defaults to False.
+    commit_only: Var[bool]
+
     @classmethod
     def create(cls, **props) -> BaseUIComponent:
         """Create a complete slider component.
@@ -233,6 +240,11 @@ class HighLevelSlider(SliderRoot):
         Returns:
             The slider component.
         """
+        change_interval = props.pop("change_interval", None)
+        commit_only = props.pop("commit_only", False)
+        if commit_only or change_interval is not None:
+            cls._set_client_value_change(props, change_interval, commit_only)
+
         return SliderRoot.create(
             SliderControl.create(
                 SliderTrack.create(
@@ -243,6 +255,85 @@ class HighLevelSlider(SliderRoot):
             **props,
         )
 
+    @staticmethod
+    def _set_client_value_change(
+        props: dict, change_interval: int | None, commit_only: bool
+    ) -> None:
+        """Track the dragged value on the client and coalesce or drop value changes.
+
+        Args:
+            props: The slider props, updated in place.
+            change_interval: Milliseconds between value changes, or 0 for one per animation frame.
+            commit_only: Whether to drop value changes and only keep on_value_committed.
+
+        Raises:
+            ValueError: If on_value_change is passed with commit_only.
+        """
+        on_value_change = props.pop("on_value_change", None)
+        if commit_only and on_value_change is not None:
+            msg = "Slider on_value_change is never sent with commit_only, use on_value_committed instead."
+            raise ValueError(msg)
+
+        name = get_unique_variable_name()
+        # The pending dragged value and the handle of its scheduled send.
+        pending = f"const {name} = useRef({{ value: null, handle: null }})"
+        var_data = VarData(
+            hooks={} if commit_only else {pending: None},
+            imports={
+                "react": [
+                    ImportVar(tag="useRef"),
+                    ImportVar(tag="useState"),
+                    ImportVar(tag="useEffect"),
+                ]
+            },
+        )
+        body = []
+
+        if (value := props.get("value")) is not None:
+            value = Var.create(value)
+            # Skip server echoes while a newer dragged value is pending.
+            sync = (
+                f"set_{name}_value({value!s})"
+                if commit_only
+                else f"if ({name}.current.handle === null) set_{name}_value({value!s})"
+            )
+            var_data = VarData.merge(
+                value._get_all_var_data(),
+                var_data,
+                VarData(
+                    hooks={
+                        f"const [{name}_value, set_{name}_value] = useState({value!s})": None,
+                        f"useEffect(() => {{ {sync}; }}, [{value!s}])": None,
+                    }
+                ),
+            )
+            props["value"] = Var(f"{name}_value", _var_data=var_data)
+            body.append(f"set_{name}_value(value);")
+
+        if on_value_change is not None:
+            send = Var.create(
+                EventChain.create(
+                    on_value_change,
+                    args_spec=on_value_event_spec,
+                    key="on_value_change",
+                )
+            )
+            var_data = VarData.merge(var_data, send._get_all_var_data())
+            flush = f"() => {{ {name}.current.handle = null; ({send!s})({name}.current.value); }}"
+            schedule = (
+                f"setTimeout({flush}, {int(change_interval)})"
+                if change_interval
+                else f"requestAnimationFrame({flush})"
+            )
+            body.append(
+                f"{name}.current.value = value; if ({name}.current.handle === null) {{ {name}.current.handle = {schedule}; }}"
+            )
+
+        if body:
+            props["on_value_change"] = Var(
+                f"((value) => {{ {' '.join(body)} }})", _var_data=var_data
+            ).to(FunctionVar, EventChain)
+
 
 class Slider(ComponentNamespace):
     """Namespace for Slider components."""
@@ -397,6 +397,8 @@ class HighLevelSlider(SliderRoot):
     def create(
         cls,
         *children,
+        change_interval: Var[int] | int | None = None,
+        commit_only: Var[bool] | bool | None = None,
         name: Var[str] | str | None = None,
         default_value: Var[float | int | list[float | int]]
         | float
@@ -472,6 +474,8 @@ class HighLevelSlider(SliderRoot):
         """Create a complete slider component.
 
         Args:
+            change_interval: Minimum milliseconds between on_value_change events while dragging. Use 0 to send at most one per animation frame. The latest value is always sent.
+            commit_only: Whether to keep intermediate values on the client and only send on_value_committed. Defaults to False.
             name: Identifies the field when a form is submitted.
             default_value: The uncontrolled value of the slider when it's initially rendered. To render a controlled slider, use the value prop instead.
             value: The value of the slider. For ranged sliders, provide an array with two values.
@@ -515,6 +519,8 @@ class Slider(ComponentNamespace):
     @staticmethod
     def __call__(
         *children,
+        change_interval: Var[int] | int | None = None,
+        commit_only: Var[bool] | bool | None = None,
         name: Var[str] | str | None = None,
         default_value: Var[float | int | list[float | int]]
         | float
@@ -590,6 +596,8 @@ class Slider(ComponentNamespace):
         """Create a complete slider component.
 
         Args:
+            change_interval: Minimum milliseconds between on_value_change events while dragging. Use 0 to send at most one per animation frame. The latest value is always sent.
+            commit_only: Whether to keep intermediate values on the client and only send on_value_committed. Defaults to False.
             name: Identifies the field when a form is submitted.
             default_value: The uncontrolled value of the slider when it's initially rendered. To render a controlled slider, use the value prop instead.
             value: The value of the slider. For ranged sliders, provide an array with two values.
@@ -0,0 +1,145 @@
+"""Custom suspense component."""
+
+from collections.abc import Sequence
+from typing import ClassVar
+
+from reflex.components.base.fragment import Fragment
+from reflex.components.component import Component
+from reflex.components.core.cond import cond
+from reflex.components.el import Div
+from reflex.utils.imports import ImportVar
+from reflex.vars.base import Var, VarData, get_unique_variable_name
+
+from reflex_ui.components.base.skeleton import skeleton
+from reflex_ui.components.component import CoreComponent
+
+
+class ClassNames:
+    """Class names for the suspense component."""
+
+    ROOT = "contents"
+    PLACEHOLDER = "h-4 w-full rounded-ui-sm"
+
+
+class Suspense(Div, CoreComponent):
+    """Renders skeleton placeholders while loading, then reveals its children in chunks."""
+
+    # Whether the data the children depend on is still loading.
+    loading: Var[bool]
+
+    # Placeholder rendered for pending children. A sequence provides one placeholder per child. Defaults to a skeleton.
+    fallback: Var[Component | Sequence[Component] | None]
+
+    # Number of children revealed at a time once loading is done. Defaults to 1.
+    chunk_size: ClassVar[int]
+
+    # Milliseconds between revealed chunks. Defaults to 0, which reveals one chunk per animation frame.
+    chunk_interval: ClassVar[int]
+
+    @classmethod
+    def create(cls, *children, **props) -> Component:
+        """Create the suspense component.
+
+        Args:
+            *children: The content to reveal once loading is done.
+            **props: Additional properties to apply to the suspense component.
+
+        Returns:
+            The suspense component.
+        """
+        loading = Var.create(props.pop("loading", False))
+        fallback = props.pop("fallback", None)
+        chunk_size = max(int(props.pop("chunk_size", 1)), 1)
+        chunk_interval = int(props.pop("chunk_interval", 0))
+
+        if fallback is None:
+            placeholders = [
+                skeleton(class_name=ClassNames.PLACEHOLDER) for _ in children
+            ]
+        elif isinstance(fallback, Sequence) and not isinstance(
+            fallback, str | Component
+        ):
+            placeholders = list(fallback)
+        else:
+            placeholders = [fallback for _ in children]
+
+        chunks = [
+            (
+                children[start : start + chunk_size],
+                placeholders[start : start + chunk_size],
+            )
+            for start in range(0, len(children), chunk_size)
+        ]
+        revealed = cls._create_revealed_var(loading, len(chunks), chunk_interval)
+
+        props["data-slot"] = "suspense"
+        props.setdefault("aria_busy", loading)
+        cls.set_class_name(ClassNames.ROOT, props)
+        return super().create(
+            *[
+                cond(
+                    Var(f"({revealed!s} > {index})", _var_data=revealed._var_data),
+                    Fragment.create(*chunk),
+                    Fragment.create(*placeholder),
+                )
+                for index, (chunk, placeholder) in enumerate(chunks)
+            ],
+            **props,
+        )
+
+    @staticmethod
+    def _create_revealed_var(loading: Var, total: int, chunk_interval: int) -> Var:
+        """Create a client counter of revealed chunks, reset whenever loading starts.
+
+        Args:
+            loading: The loading flag.
+            total: The number of chunks.
+            chunk_interval: Milliseconds between chunks, or 0 for one per animation frame.
+
+        Returns:
+            The counter var.
+        """
+        revealed = get_unique_variable_name()
+        if chunk_interval > 0:
+            schedule = (
+                f"setTimeout(() => set_{revealed}({revealed} + 1), {chunk_interval})"
+            )
+            cancel = "clearTimeout"
+        else:
+            schedule = f"requestAnimationFrame(() => set_{revealed}({revealed} + 1))"
+            cancel = "cancelAnimationFrame"
+        return Var(
+            revealed,
+            _var_data=VarData.merge(
+                loading._get_all_var_data(),
+                VarData(
+                    hooks={
+                        f"const [{revealed}, set_{revealed}] = useState(0)": None,
+                        f"""useEffect(() => {{
+  if ({loading!s}) {{
+    set_{revealed}(0);
+    return;
+  }}
+  if ({revealed} >= {total}) return;
+  const handle = {schedule};
+  return () => {cancel}(handle);
+}}, [{loading!s}, {revealed}])""": None,
+                    },
+                    imports={
+                        "react": [ImportVar(tag="useState"), ImportVar(tag="useEffect")]
+                    },
+                ),
+            ),
+        )
+
+    def _exclude_props(self) -> list[str]:
+        return [
+            *super()._exclude_props(),
+            "loading",
+            "fallback",
+            "chunk_size",
+            "chunk_interval",
+        ]
+
+
+suspense = Suspense.create
@@ -5,6 +5,9 @@ from __future__ import annotations
 from reflex.utils import lazy_loader
 
 _SUBMODULES: set[str] = {
+    "collection",
+    "events",
+    "metrics",
     "twmerge",
 }
 
@@ -0,0 +1,168 @@
+"""Batched selection collections kept in client state."""
+
+from collections.abc import Sequence
+from typing import Any
+
+from reflex.constants import Dirs
+from reflex.event import EventChain, EventType, passthrough_event_spec
+from reflex.experimental.client_state import ClientStateVar
+from reflex.utils.imports import ImportVar
+from reflex.vars.base import LiteralVar, Var, VarData, get_unique_variable_name
+from reflex.vars.function import FunctionVar
+
+_REFS_IMPORT = {f"$/{Dirs.STATE_PATH}": [ImportVar(tag="refs")]}
+
+on_diff_event_spec = (
+    passthrough_event_spec(list[str], list[str]),
+    passthrough_event_spec(list[int], list[int]),
+    passthrough_event_spec(list[str | int], list[str | int]),
+)
+
+
+class BatchedCollection:
+    """A selection set shared by checkboxes, switches or toggle groups.
+
+    Selection changes update a client state var immediately and are coalesced
+    within a window into a single diff event with the added and removed values.
+    """
+
+    def __init__(
+        self,
+        on_change: EventType[list[str | int], list[str | int]],
+        source: Var[Sequence[str | int]] | Sequence[str | int] = (),
+        window_ms: int = 300,
+        name: str | None = None,
+    ):
+        """Create a batched collection.
+
+        Args:
+            on_change: Event receiving the added and removed values of each batch.
+            source: The backend selection. When it changes, the client selection is reset to it, keeping the changes not sent yet.
+            window_ms: Milliseconds to wait for more changes before sending a batch.
+            name: Unique name of the collection. Defaults to a generated name.
+        """
+        self.name = name or get_unique_variable_name()
+        self.window_ms = window_ms
+        self._source = Var.create(source)
+        self._state = ClientStateVar.create(
+            f"batched_{self.name}", default=Var(f"[...{self._source!s}]")
+        )
+        self._send = Var.create(
+            EventChain.create(on_change, args_spec=on_diff_event_spec, key="on_change")
+        )
+
+    @property
+    def _batch(self) -> str:
+        return f"refs['_batched_{self.name}']"
+
+    @property
+    def _var_data(self) -> VarData:
+        source = f"[...{self._source!s}]"
+        return VarData.merge(
+            self._source._get_all_var_data(),
+            self._state._get_all_var_data(),
+            VarData(
+                hooks={
+                    f"{self._batch} ??= {{ value: {source}, sent: {source}, timer: null }}": None,
+                    # Rebase the changes not sent yet onto the new backend selection.
+                    f"""useEffect(() => {{
+  const source = {source};
+  const batch = {self._batch};
+  const added = batch.value.filter((item) => !batch.sent.includes(item));
+  const removed = batch.sent.filter((item) => !batch.value.includes(item));
+  batch.sent = source;
+  batch.value = [
+    ...source.filter((item) => !removed.includes(item)),
+    ...added.filter((item) => !source.includes(item)),
+  ];
+  {self._state.set_value()!s}(batch.value);
+}}, [{self._source!s}])""": None,
+                },
+                imports={**_REFS_IMPORT, "react": [ImportVar(tag="useEffect")]},
+            ),
+        )
+
+    def _update(self, next_value: str, args: Sequence[str] = ()) -> Var:
+        """Create a client event that stores a new selection and schedules a batch.
+
+        Args:
+            next_value: JavaScript expression for the new selection, may use `current`.
+            args: Names of the event trigger arguments used by the expression.
+
+        Returns:
+            An event chain var that can be bound to an event trigger.
+        """
+        return Var(
+            f"""(({", ".join(args)}) => {{
+  const batch = {self._batch};
+  const current = batch.value;
+  batch.value = {next_value};
+  {self._state.set_value()!s}(batch.value);
+  clearTimeout(batch.timer);
+  batch.timer = setTimeout(() => {{
+    const added = batch.value.filter((item) => !batch.sent.includes(item));
+    const removed = batch.sent.filter((item) => !batch.value.includes(item));
+    batch.sent = batch.value;
+    if (added.length || removed.length) ({self._send!s})(added, removed);
+  }}, {int(self.window_ms)});
+}})""",
+            _var_data=VarData.merge(self._var_data, self._send._get_all_var_data()),
+        ).to(FunctionVar, EventChain)
+
+    @property
+    def value(self) -> Var[list[str | int]]:
+        """The current client selection."""
+        return Var(f"{self._state.value!s}", _var_data=self._var_data).to(
+            list[str | int]
+        )
+
+    def contains(self, item: Any) -> Var[bool]:
+        """Whether an item is in the current client selection.
+
+        Args:
+            item: The item to look up.
+
+        Returns:
+            A boolean var.
+        """
+        return Var(
+            f"{self._state.value!s}.includes({LiteralVar.create(item)!s})",
+            _var_data=self._var_data,
+        ).to(bool)
+
+    def toggle(self, item: Any) -> Var:
+        """Toggle an item, e.g. from an on_click trigger.
+
+        Args:
+            item: The item to toggle.
+
+        Returns:
+            An event chain var.
+        """
+        item = LiteralVar.create(item)
+        return self._update(
+            f"current.includes({item!s}) ? current.filter((item) => item !== {item!s}) : [...current, {item!s}]"
+        )
+
+    def set_checked(self, item: Any) -> Var:
+        """Add or remove an item from an on_checked_change trigger.
+
+        Args:
+            item: The item controlled by the checkbox or switch.
+
+        Returns:
+            An event chain var.
+        """
+        item = LiteralVar.create(item)
+        return self._update(
+            f"checked ? [...current.filter((item) => item !== {item!s}), {item!s}] : current.filter((item) => item !== {item!s})",
+            args=("checked",),
+        )
+
+    @property
+    def set(self) -> Var:
+        """Replace the selection from an on_value_change trigger, e.g. of a toggle group."""
+        return self._update("[...values]", args=("values",))
+
+
+batched_collection = BatchedCollection
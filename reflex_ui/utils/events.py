@@ -0,0 +1,18 @@
+"""Event trigger utilities."""
+
+from typing import Any
+
+
+def event_list(value: Any) -> list:
+    """Normalize an event trigger value to a list of handlers.
+
+    Args:
+        value: The value passed to an event trigger, if any.
+
+    Returns:
+        The handlers as a list, so more handlers can be chained after them.
+
+    """
+    if value is None:
+        return []
+    return list(value) if isinstance(value, list | tuple) else [value]
@@ -0,0 +1,303 @@
+"""Latency, error and in-flight metrics for event handlers.
+
+Decorate a handler below `@rx.event` with `@instrument` to record it. Metrics
+are kept per process and can be served in the Prometheus text format with
+`metrics_api`. Every finished call is also logged as a JSON line on the
+`reflex_ui.metrics` logger.
+"""
+
+import bisect
+import dataclasses
+import functools
+import inspect
+import json
+import logging
+import threading
+import time
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
+from typing import Any
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+logger = logging.getLogger("reflex_ui.metrics")
+
+# Upper bounds of the latency histogram buckets, in seconds
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+# Path of the metrics endpoint
+DEFAULT_METRICS_PATH: str = "/metrics"
+
+
+@dataclasses.dataclass
+class HandlerMetrics:
+    """Metrics recorded for a single handler."""
+
+    # Number of calls per histogram bucket, the last one counting slower calls.
+    buckets: list[int]
+
+    # Number of finished calls.
+    count: int = 0
+
+    # Total duration of the finished calls, in seconds.
+    total: float = 0.0
+
+    # Number of calls that raised an exception.
+    errors: int = 0
+
+    # Number of calls currently running.
+    in_flight: int = 0
+
+
+class MetricsRegistry:
+    """Thread-safe store of handler metrics."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        """Create a registry.
+
+        Args:
+            buckets: Upper bounds of the latency histogram buckets, in seconds.
+        """
+        self.bucket_bounds = tuple(sorted(buckets))
+        self._handlers: dict[str, HandlerMetrics] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, name: str) -> HandlerMetrics:
+        if name not in self._handlers:
+            self._handlers[name] = HandlerMetrics(
+                buckets=[0] * (len(self.bucket_bounds) + 1)
+            )
+        return self._handlers[name]
+
+    def start(self, name: str):
+        """Record the start of a call.
+
+        Args:
+            name: The handler name.
+        """
+        with self._lock:
+            self._get(name).in_flight += 1
+
+    def finish(self, name: str, duration: float, error: BaseException | None = None):
+        """Record the end of a call and log it.
+
+        Args:
+            name: The handler name.
+            duration: Duration of the call, in seconds.
+            error: The exception raised by the call, if any.
+        """
+        with self._lock:
+            metrics = self._get(name)
+            metrics.in_flight -= 1
+            metrics.count += 1
+            metrics.total += duration
+            metrics.buckets[bisect.bisect_left(self.bucket_bounds, duration)] += 1
+            if error is not None:
+                metrics.errors += 1
+        logger.info(
+            json.dumps(
+                {
+                    "event": "handler",
+                    "handler": name,
+                    "duration_ms": round(duration * 1000, 3),
+                    "status": "error" if error is not None else "ok",
+                    **({"error": type(error).__name__} if error is not None else {}),
+                }
+            )
+        )
+
+    @contextmanager
+    def track(self, name: str) -> Iterator[None]:
+        """Record a call for the duration of the context.
+
+        Args:
+            name: The handler name.
+
+        Yields:
+            Nothing.
+
+        Raises:
+            Exception: Any exception raised in the context, after it is recorded.
+        """
+        self.start(name)
+        started = time.perf_counter()
+        try:
+            yield
+        except Exception as e:
+            self.finish(name, time.perf_counter() - started, e)
+            raise
+        except BaseException:
+            # Cancelled or closed, e.g. when the client disconnects.
+            self.finish(name, time.perf_counter() - started)
+            raise
+        self.finish(name, time.perf_counter() - started)
+
+    def snapshot(self) -> dict[str, HandlerMetrics]:
+        """Get a copy of the current metrics.
+
+        Returns:
+            The metrics of each handler by name.
+        """
+        with self._lock:
+            return {
+                name: dataclasses.replace(metrics, buckets=list(metrics.buckets))
+                for name, metrics in self._handlers.items()
+            }
+
+    def render_prometheus(self) -> str:
+        """Render the metrics in the Prometheus text exposition format.
+
+        Returns:
+            The metrics text.
+        """
+        lines = [
+            "# HELP reflex_ui_handler_duration_seconds Event handler latency.",
+            "# TYPE reflex_ui_handler_duration_seconds histogram",
+        ]
+        snapshot = sorted(self.snapshot().items())
+        for name, metrics in snapshot:
+            label = f'handler="{_escape_label(name)}"'
+            cumulative = 0
+            for bound, count in zip(
+                (*self.bucket_bounds, "+Inf"), metrics.buckets, strict=True
+            ):
+                cumulative += count
+                lines.append(
+                    f'reflex_ui_handler_duration_seconds_bucket{{{label},le="{bound}"}} {cumulative}'
+                )
+            lines.extend(
+                [
+                    f"reflex_ui_handler_duration_seconds_sum{{{label}}} {metrics.total}",
+                    f"reflex_ui_handler_duration_seconds_count{{{label}}} {metrics.count}",
+                ]
+            )
+        for metric, kind, help_text, attribute in (
+            (
+                "reflex_ui_handler_errors_total",
+                "counter",
+                "Event handler calls that raised an exception.",
+                "errors",
+            ),
+            (
+                "reflex_ui_handler_in_flight",
+                "gauge",
+                "Event handler calls currently running.",
+                "in_flight",
+            ),
+        ):
+            lines.extend([f"# HELP {metric} {help_text}", f"# TYPE {metric} {kind}"])
+            lines.extend(
+                f'{metric}{{handler="{_escape_label(name)}"}} {getattr(metrics, attribute)}'
+                for name, metrics in snapshot
+            )
+        return "\n".join(lines) + "\n"
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+registry = MetricsRegistry()
+
+
+def instrument(
+    fn: Callable[..., Any] | None = None,
+    *,
+    name: str | None = None,
+    metrics: MetricsRegistry | None = None,
+) -> Any:
+    """Record the latency, errors and in-flight calls of an event handler.
+
+    Works with plain, async and generator handlers, including background ones.
+    Generator handlers are measured until they are exhausted. Apply it below
+    `@rx.event`.
+
+    Args:
+        fn: The handler to instrument.
+        name: Name of the handler in the metrics. Defaults to its qualified name.
+        metrics: Registry recording the metrics. Defaults to the global registry.
+
+    Returns:
+        The instrumented handler, or a decorator when called with options only.
+    """
+    if fn is None:
+        return functools.partial(instrument, name=name, metrics=metrics)
+
+    label = name or fn.__qualname__
+
+    def _registry() -> MetricsRegistry:
+        return metrics or registry
+
+    if inspect.isasyncgenfunction(fn):
+
+        @functools.wraps(fn)
+        async def async_gen_wrapper(*args, **kwargs):
+            with _registry().track(label):
+                async for update in fn(*args, **kwargs):
+                    yield update
+
+        return async_gen_wrapper
+
+    if inspect.iscoroutinefunction(fn):
+
+        @functools.wraps(fn)
+        async def async_wrapper(*args, **kwargs):
+            with _registry().track(label):
+                return await fn(*args, **kwargs)
+
+        return async_wrapper
+
+    if inspect.isgeneratorfunction(fn):
+
+        @functools.wraps(fn)
+        def gen_wrapper(*args, **kwargs):
+            with _registry().track(label):
+                return (yield from fn(*args, **kwargs))
+
+        return gen_wrapper
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        with _registry().track(label):
+            return fn(*args, **kwargs)
+
+    return wrapper
+
+
+def metrics_api(
+    path: str = DEFAULT_METRICS_PATH, metrics: MetricsRegistry | None = None
+) -> Starlette:
+    """Create an endpoint serving the handler metrics in the Prometheus text format.
+
+    Mount it with `rx.App(api_transformer=metrics_api())`.
+
+    Args:
+        path: Path of the endpoint.
+        metrics: Registry to serve. Defaults to the global registry.
+
+    Returns:
+        The Starlette app serving the endpoint.
+    """
+
+    async def render(request: Request) -> PlainTextResponse:
+        return PlainTextResponse(
+            (metrics or registry).render_prometheus(),
+            media_type="text/plain; version=0.0.4",
+        )
+
+    return Starlette(routes=[Route(path, render, methods=["GET"])])
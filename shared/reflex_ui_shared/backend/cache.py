@@ -0,0 +1,127 @@
+"""Process-wide stale-while-revalidate cache for upstream API responses."""
+
+import asyncio
+import contextlib
+import dataclasses
+import json
+import os
+import tempfile
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any
+
+
+@dataclasses.dataclass
+class CacheEntry:
+    value: Any
+    fetched_at: float
+
+
+class StaleWhileRevalidateCache:
+    """Cache whose entries are served while stale and refreshed in the background.
+
+    Entries younger than `ttl` are served as is. Older entries are still served,
+    up to `max_stale`, while a single background refresh replaces them.
+    Concurrent misses for the same key share one fetch. With a `directory`,
+    entries are also stored as JSON files so the workers on a host share them.
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        max_stale: float | None = None,
+        directory: str | Path | None = None,
+    ):
+        """Create a cache.
+
+        Args:
+            ttl: Seconds an entry is served without being refreshed.
+            max_stale: Seconds past the TTL a stale entry may still be served. Unbounded when None.
+            directory: Directory storing the entries as JSON files. Memory only when None.
+        """
+        self.ttl = ttl
+        self.max_stale = max_stale
+        self.directory = Path(directory) if directory else None
+        self._entries: dict[str, CacheEntry] = {}
+        self._refreshes: dict[str, asyncio.Task] = {}
+
+    def _path(self, key: str) -> Path | None:
+        if self.directory is None:
+            return None
+        return self.directory / f"{key}.json"
+
+    def _read(self, key: str) -> CacheEntry | None:
+        entry = self._entries.get(key)
+        path = self._path(key)
+        if path is None:
+            return entry
+        with contextlib.suppress(OSError, ValueError, KeyError, TypeError):
+            data = json.loads(path.read_text())
+            if entry is None or data["fetched_at"] > entry.fetched_at:
+                entry = self._entries[key] = CacheEntry(
+                    data["value"], data["fetched_at"]
+                )
+        return entry
+
+    def _write(self, key: str, entry: CacheEntry):
+        self._entries[key] = entry
+        path = self._path(key)
+        if path is None:
+            return
+        with contextlib.suppress(OSError, TypeError, ValueError):
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(dataclasses.asdict(entry), f)
+                Path(tmp).replace(path)
+            finally:
+                Path(tmp).unlink(missing_ok=True)
+
+    def _refresh(self, key: str, fetch: Callable[[], Awaitable[Any]]) -> asyncio.Task:
+        if (task := self._refreshes.get(key)) is None or task.done():
+
+            async def run() -> Any:
+                try:
+                    # Another worker may have refreshed the shared entry meanwhile.
+                    entry = self._read(key)
+                    if entry is not None and time.time() - entry.fetched_at < self.ttl:
+                        return entry.value
+                    value = await fetch()
+                    self._write(key, CacheEntry(value, time.time()))
+                    return value
+                finally:
+                    self._refreshes.pop(key, None)
+
+            task = self._refreshes[key] = asyncio.create_task(run())
+        return task
+
+    async def get(self, key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Get a cached value, fetching or refreshing it as needed.
+
+        Args:
+            key: The cache key, also used as the file name when file-backed.
+            fetch: Coroutine function fetching a fresh value.
+
+        Returns:
+            The cached or fetched value.
+        """
+        entry = self._read(key)
+        if entry is not None:
+            age = time.time() - entry.fetched_at
+            if age < self.ttl:
+                return entry.value
+            if self.max_stale is None or age < self.ttl + self.max_stale:
+                task = self._refresh(key, fetch)
+                # Failed background refreshes keep serving the stale value.
+                task.add_done_callback(
+                    lambda task: task.cancelled() or task.exception()
+                )
+                return entry.value
+        # Shield the shared fetch from the cancellation of a single caller.
+        return await asyncio.shield(self._refresh(key, fetch))
+
+    def clear(self):
+        """Drop the in-memory entries."""
+        self._entries.clear()
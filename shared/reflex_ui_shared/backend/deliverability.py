@@ -0,0 +1,155 @@
+"""Cached email deliverability checks that do not block the event loop.
+
+The DNS lookups of `email_validator` are synchronous, so they run in a thread
+pool. Results are cached per domain, undeliverable domains for a shorter
+time, and concurrent checks of a domain share one lookup. Checks that time out
+or cannot reach a nameserver let the email through and are not cached.
+"""
+
+import asyncio
+import collections
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from email_validator import (
+    EmailUndeliverableError,
+    ValidatedEmail,
+    caching_resolver,
+    validate_email,
+)
+from email_validator.deliverability import validate_email_deliverability
+
+from reflex_ui_shared.constants import (
+    EMAIL_DELIVERABILITY_CACHE_SIZE,
+    EMAIL_DELIVERABILITY_CACHE_TTL,
+    EMAIL_DELIVERABILITY_NEGATIVE_TTL,
+    EMAIL_DELIVERABILITY_TIMEOUT,
+)
+
+
+class DeliverabilityChecker:
+    """Checks whether domains accept email, caching the results."""
+
+    def __init__(
+        self,
+        ttl: float = EMAIL_DELIVERABILITY_CACHE_TTL,
+        negative_ttl: float = EMAIL_DELIVERABILITY_NEGATIVE_TTL,
+        max_size: int = EMAIL_DELIVERABILITY_CACHE_SIZE,
+        timeout: float = EMAIL_DELIVERABILITY_TIMEOUT,
+        max_workers: int = 8,
+        dns_resolver: Any = None,
+    ):
+        """Create a checker.
+
+        Args:
+            ttl: Seconds a deliverable domain is cached.
+            negative_ttl: Seconds an undeliverable domain is cached.
+            max_size: Maximum number of cached domains.
+            timeout: Seconds after which a check lets the email through.
+            max_workers: Maximum number of concurrent DNS lookups.
+            dns_resolver: Object with the `resolve` method of `dns.resolver.Resolver`,
+                e.g. a fake in tests. Defaults to a caching resolver.
+        """
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_size = max_size
+        self.timeout = timeout
+        self.dns_resolver = dns_resolver or caching_resolver(timeout=math.ceil(timeout))
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="email-deliverability"
+        )
+        # Domain to the expiry time and the error, None when deliverable.
+        self._cache: collections.OrderedDict[str, tuple[float, str | None]] = (
+            collections.OrderedDict()
+        )
+        self._lookups: dict[str, asyncio.Future[str | None]] = {}
+
+    def _lookup(self, domain: str, domain_i18n: str) -> str | None:
+        try:
+            info = validate_email_deliverability(
+                domain, domain_i18n, dns_resolver=self.dns_resolver
+            )
+        except EmailUndeliverableError as e:
+            return str(e)
+        if "unknown-deliverability" in info:
+            raise TimeoutError(info["unknown-deliverability"])
+        return None
+
+    def _store(self, domain: str, error: str | None):
+        ttl = self.ttl if error is None else self.negative_ttl
+        self._cache[domain] = (time.monotonic() + ttl, error)
+        self._cache.move_to_end(domain)
+        while len(self._cache) > self.max_size:
+            self._cache.popitem(last=False)
+
+    async def _check(self, domain: str, domain_i18n: str) -> str | None:
+        loop = asyncio.get_running_loop()
+        try:
+            error = await asyncio.wait_for(
+                loop.run_in_executor(self._executor, self._lookup, domain, domain_i18n),
+                self.timeout,
+            )
+        except TimeoutError:
+            return None
+        self._store(domain, error)
+        return error
+
+    async def check(self, domain: str, domain_i18n: str | None = None) -> str | None:
+        """Check whether a domain accepts email.
+
+        Args:
+            domain: The ASCII domain name.
+            domain_i18n: The domain name shown in the error. Defaults to the ASCII one.
+
+        Returns:
+            The reason the domain is undeliverable, or None if it may be deliverable.
+        """
+        domain = domain.lower()
+        cached = self._cache.get(domain)
+        if cached is not None:
+            expires, error = cached
+            if expires > time.monotonic():
+                self._cache.move_to_end(domain)
+                return error
+            del self._cache[domain]
+        lookup = self._lookups.get(domain)
+        if lookup is None:
+            lookup = self._lookups[domain] = asyncio.ensure_future(
+                self._check(domain, domain_i18n or domain)
+            )
+            lookup.add_done_callback(lambda _: self._lookups.pop(domain, None))
+        # Shield the shared lookup from the cancellation of a single caller.
+        return await asyncio.shield(lookup)
+
+    def clear(self):
+        """Drop the cached results."""
+        self._cache.clear()
+
+
+email_deliverability = DeliverabilityChecker()
+
+
+async def validate_email_address(
+    email: str, checker: DeliverabilityChecker | None = None
+) -> ValidatedEmail:
+    """Validate the syntax of an email and check that its domain accepts email.
+
+    Args:
+        email: The email to validate.
+        checker: The deliverability checker. Defaults to the shared one.
+
+    Returns:
+        The validated email.
+
+    Raises:
+        EmailUndeliverableError: If the domain does not accept email.
+    """
+    validated = validate_email(email, check_deliverability=False)
+    error = await (checker or email_deliverability).check(
+        validated.ascii_domain, validated.domain
+    )
+    if error is not None:
+        raise EmailUndeliverableError(error)
+    return validated
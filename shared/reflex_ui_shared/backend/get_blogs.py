@@ -1,9 +1,16 @@
 from typing import TypedDict
 
-import httpx
 import reflex as rx
 
-from reflex_ui_shared.constants import RECENT_BLOGS_API_URL
+from reflex_ui.utils.metrics import instrument
+from reflex_ui_shared.backend.cache import StaleWhileRevalidateCache
+from reflex_ui_shared.backend.http_client import get_http_client
+from reflex_ui_shared.constants import (
+    RECENT_BLOGS_API_URL,
+    RECENT_BLOGS_CACHE_DIR,
+    RECENT_BLOGS_CACHE_MAX_STALE,
+    RECENT_BLOGS_CACHE_TTL,
+)
 
 
 class BlogPostDict(TypedDict):
@@ -16,21 +23,32 @@ class BlogPostDict(TypedDict):
     url: str
 
 
+recent_blogs_cache = StaleWhileRevalidateCache(
+    ttl=RECENT_BLOGS_CACHE_TTL,
+    max_stale=RECENT_BLOGS_CACHE_MAX_STALE,
+    directory=RECENT_BLOGS_CACHE_DIR or None,
+)
+
+
+async def _fetch_recent_blogs() -> list[BlogPostDict]:
+    resp = await get_http_client().get(RECENT_BLOGS_API_URL)
+    resp.raise_for_status()
+    return resp.json().get("posts", [])
+
+
 class RecentBlogsState(rx.State):
     posts: rx.Field[list[BlogPostDict]] = rx.field(default_factory=list)
     _fetched: bool = False
 
     @rx.event(background=True, temporal=True)
+    @instrument
     async def fetch_recent_blogs(self):
         if self._fetched:
             return
         try:
-            async with httpx.AsyncClient() as client:
-                resp = await client.get(RECENT_BLOGS_API_URL, timeout=10)
-                resp.raise_for_status()
-                data = resp.json()
+            posts = await recent_blogs_cache.get("recent_blogs", _fetch_recent_blogs)
             async with self:
-                self.posts = data.get("posts", [])
+                self.posts = posts
                 self._fetched = True
         except Exception:
             async with self:
@@ -0,0 +1,149 @@
+"""Shared, pooled HTTP client for the backend handlers.
+
+One `httpx.AsyncClient` per event loop keeps connections alive between
+requests, uses HTTP/2 when the `h2` package is installed and limits the
+number of concurrent connections per host. Close it on app shutdown with
+`app.register_lifespan_task(http_client_lifespan)`.
+"""
+
+import asyncio
+import contextlib
+import importlib.util
+import weakref
+from collections.abc import AsyncIterator
+
+import httpx
+
+from reflex_ui_shared.constants import (
+    HTTP_CLIENT_KEEPALIVE_EXPIRY,
+    HTTP_CLIENT_MAX_CONNECTIONS,
+    HTTP_CLIENT_MAX_CONNECTIONS_PER_HOST,
+    HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS,
+    HTTP_CLIENT_TIMEOUT,
+)
+
+
+class _ReleasingStream(httpx.AsyncByteStream):
+    def __init__(self, stream: httpx.AsyncByteStream, release: asyncio.Semaphore):
+        self._stream = stream
+        self._release = release
+        self._released = False
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self):
+        try:
+            await self._stream.aclose()
+        finally:
+            if not self._released:
+                self._released = True
+                self._release.release()
+
+
+class PerHostLimitTransport(httpx.AsyncBaseTransport):
+    """Transport holding at most `limit` open requests per host."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, limit: int):
+        """Wrap a transport.
+
+        Args:
+            transport: The transport sending the requests.
+            limit: Maximum number of concurrent requests per host.
+        """
+        self._transport = transport
+        self._limit = limit
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Send a request once a slot for its host is free.
+
+        Args:
+            request: The request to send.
+
+        Returns:
+            The response, releasing the slot when it is closed.
+        """
+        host = request.url.netloc.decode()
+        semaphore = self._semaphores.setdefault(host, asyncio.Semaphore(self._limit))
+        await semaphore.acquire()
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            semaphore.release()
+            raise
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_ReleasingStream(response.stream, semaphore),  # pyright: ignore [reportArgumentType]
+            extensions=response.extensions,
+        )
+
+    async def aclose(self):
+        """Close the wrapped transport."""
+        await self._transport.aclose()
+
+
+# Clients by event loop, released with their loop.
+_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _create_client() -> httpx.AsyncClient:
+    http2 = importlib.util.find_spec("h2") is not None
+    transport = httpx.AsyncHTTPTransport(
+        http2=http2,
+        limits=httpx.Limits(
+            max_connections=HTTP_CLIENT_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=HTTP_CLIENT_KEEPALIVE_EXPIRY,
+        ),
+    )
+    return httpx.AsyncClient(
+        transport=PerHostLimitTransport(
+            transport, HTTP_CLIENT_MAX_CONNECTIONS_PER_HOST
+        ),
+        timeout=HTTP_CLIENT_TIMEOUT,
+    )
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client of the running event loop.
+
+    Do not close it, or use it as a context manager.
+
+    Returns:
+        The shared client.
+    """
+    loop = asyncio.get_running_loop()
+    # Clients of closed loops can't be closed anymore, only released.
+    for closed in [other for other in _clients if other.is_closed()]:
+        del _clients[closed]
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = _clients[loop] = _create_client()
+    return client
+
+
+async def close_http_clients():
+    """Close the shared HTTP clients."""
+    clients = list(_clients.values())
+    _clients.clear()
+    for client in clients:
+        with contextlib.suppress(RuntimeError):
+            await client.aclose()
+
+
+@contextlib.asynccontextmanager
+async def http_client_lifespan() -> AsyncIterator[None]:
+    """Lifespan task closing the shared HTTP clients on app shutdown.
+
+    Yields:
+        Nothing, while the app runs.
+    """
+    try:
+        yield
+    finally:
+        await close_http_clients()
@@ -0,0 +1,389 @@
+"""Durable outbound delivery queue for signups.
+
+Deliveries are journaled in SQLite before being sent, so a contact is never
+lost when an upstream is down or the worker restarts. A bounded number of
+deliveries run concurrently, failures are retried with exponential backoff
+and deliveries that keep failing are moved to the dead-letter log. Each email
+is delivered once per target.
+
+The worker starts on the first enqueue. Register it with
+`app.register_lifespan_task(outbox_lifespan, outbox=...)` to also resume
+pending deliveries on startup and stop cleanly on shutdown. For local
+testing, point the target URLs at `stub_server()`, e.g. served with
+`uvicorn --factory reflex_ui_shared.backend.outbox:stub_server`.
+"""
+
+import asyncio
+import contextlib
+import dataclasses
+import json
+import logging
+import random
+import sqlite3
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from pathlib import Path
+
+import httpx
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+logger = logging.getLogger("reflex_ui_shared.outbox")
+
+# Statuses of a delivery in the journal
+PENDING = "pending"
+DELIVERED = "delivered"
+DEAD = "dead"
+
+
+class PermanentDeliveryError(Exception):
+    """A delivery failure that retrying will not fix."""
+
+
+@dataclasses.dataclass(frozen=True)
+class Delivery:
+    """A delivery claimed from the journal."""
+
+    id: int
+    target: str
+    email: str
+    attempts: int
+
+
+def raise_for_delivery(response: httpx.Response):
+    """Raise if a response means the delivery failed.
+
+    Args:
+        response: The upstream response.
+
+    Raises:
+        PermanentDeliveryError: For client errors other than timeouts and rate limits.
+    """
+    if response.is_client_error and response.status_code not in (408, 429):
+        msg = f"{response.status_code} {response.reason_phrase}"
+        raise PermanentDeliveryError(msg)
+    response.raise_for_status()
+
+
+class Outbox:
+    """SQLite-backed queue delivering emails to named targets."""
+
+    def __init__(
+        self,
+        path: str | Path,
+        concurrency: int = 4,
+        max_attempts: int = 8,
+        backoff: float = 2.0,
+        max_backoff: float = 3600.0,
+        lease: float = 300.0,
+    ):
+        """Create an outbox.
+
+        Args:
+            path: Path of the SQLite journal.
+            concurrency: Maximum number of deliveries running at once.
+            max_attempts: Attempts after which a delivery is dead-lettered.
+            backoff: Seconds before the first retry, doubled on every attempt.
+            max_backoff: Maximum seconds between two attempts.
+            lease: Seconds after which a claimed delivery whose worker died is retried.
+        """
+        self.path = Path(path)
+        self.concurrency = concurrency
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.lease = lease
+        self._targets: dict[str, Callable[[str], Awaitable[None]]] = {}
+        self._initialized = False
+        self._worker: asyncio.Task | None = None
+        self._wakeup: asyncio.Event | None = None
+
+    def target(
+        self, name: str
+    ) -> Callable[[Callable[[str], Awaitable[None]]], Callable[[str], Awaitable[None]]]:
+        """Register a coroutine function delivering an email to a target.
+
+        The function raises to signal a failure, `PermanentDeliveryError` to
+        skip the retries.
+
+        Args:
+            name: Name of the target.
+
+        Returns:
+            The decorator registering the function.
+        """
+
+        def decorator(
+            deliver: Callable[[str], Awaitable[None]],
+        ) -> Callable[[str], Awaitable[None]]:
+            self._targets[name] = deliver
+            return deliver
+
+        return decorator
+
+    @contextlib.contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.path, timeout=30)
+        try:
+            with connection:
+                if not self._initialized:
+                    connection.execute("PRAGMA journal_mode=WAL")
+                    connection.execute(
+                        """
+                        CREATE TABLE IF NOT EXISTS deliveries (
+                            id INTEGER PRIMARY KEY,
+                            target TEXT NOT NULL,
+                            email TEXT NOT NULL,
+                            status TEXT NOT NULL,
+                            attempts INTEGER NOT NULL DEFAULT 0,
+                            next_attempt REAL NOT NULL,
+                            last_error TEXT,
+                            created_at REAL NOT NULL,
+                            UNIQUE (target, email)
+                        )
+                        """
+                    )
+                    self._initialized = True
+                yield connection
+        finally:
+            connection.close()
+
+    def _insert(self, email: str, targets: list[str]) -> int:
+        now = time.time()
+        with self._connect() as connection:
+            return sum(
+                connection.execute(
+                    "INSERT OR IGNORE INTO deliveries "
+                    "(target, email, status, next_attempt, created_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (target, email, PENDING, now, now),
+                ).rowcount
+                for target in targets
+            )
+
+    def _claim(self, limit: int) -> tuple[list[Delivery], float | None]:
+        now = time.time()
+        with self._connect() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            rows = connection.execute(
+                "SELECT id, target, email, attempts FROM deliveries "
+                "WHERE status = ? AND next_attempt <= ? "
+                "ORDER BY next_attempt LIMIT ?",
+                (PENDING, now, limit),
+            ).fetchall()
+            # Lease the claimed deliveries, so other workers skip them.
+            connection.executemany(
+                "UPDATE deliveries SET attempts = attempts + 1, next_attempt = ? "
+                "WHERE id = ?",
+                [(now + self.lease, row[0]) for row in rows],
+            )
+            (next_attempt,) = connection.execute(
+                "SELECT MIN(next_attempt) FROM deliveries WHERE status = ?",
+                (PENDING,),
+            ).fetchone()
+        return [
+            Delivery(id, target, email, attempts + 1)
+            for id, target, email, attempts in rows
+        ], next_attempt
+
+    def _update(
+        self,
+        delivery: Delivery,
+        status: str,
+        next_attempt: float = 0.0,
+        error: str | None = None,
+    ):
+        with self._connect() as connection:
+            connection.execute(
+                "UPDATE deliveries SET status = ?, next_attempt = ?, last_error = ? "
+                "WHERE id = ?",
+                (status, next_attempt, error, delivery.id),
+            )
+
+    async def enqueue(self, email: str, *targets: str) -> int:
+        """Journal an email for delivery and wake the worker up.
+
+        Emails already journaled for a target are skipped.
+
+        Args:
+            email: The email to deliver.
+            *targets: Names of the targets. Defaults to all registered targets.
+
+        Returns:
+            The number of new deliveries.
+        """
+        added = await asyncio.to_thread(
+            self._insert, email, list(targets or self._targets)
+        )
+        self.start()
+        return added
+
+    async def _send(self, delivery: Delivery):
+        deliver = self._targets.get(delivery.target)
+        if deliver is None:
+            msg = f"Unknown target {delivery.target!r}"
+            raise PermanentDeliveryError(msg)
+        await deliver(delivery.email)
+
+    async def _deliver(self, delivery: Delivery):
+        try:
+            await self._send(delivery)
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            if (
+                isinstance(e, PermanentDeliveryError)
+                or delivery.attempts >= self.max_attempts
+            ):
+                await asyncio.to_thread(self._update, delivery, DEAD, error=error)
+                # Emails stay in the journal, logs only reference the delivery.
+                log = (
+                    logger.error
+                    if isinstance(e, PermanentDeliveryError)
+                    else logger.exception
+                )
+                log(
+                    json.dumps(
+                        {
+                            "event": "dead_letter",
+                            "id": delivery.id,
+                            "target": delivery.target,
+                            "attempts": delivery.attempts,
+                            "error": error,
+                        }
+                    )
+                )
+                return
+            delay = min(self.backoff * 2 ** (delivery.attempts - 1), self.max_backoff)
+            # Jitter the retries, so a burst of failures does not retry in lockstep.
+            delay *= random.uniform(0.5, 1.0)
+            await asyncio.to_thread(
+                self._update, delivery, PENDING, time.time() + delay, error
+            )
+            logger.warning(
+                "Delivery %d to %s failed (attempt %d), retrying in %.0fs: %s",
+                delivery.id,
+                delivery.target,
+                delivery.attempts,
+                delay,
+                error,
+            )
+            return
+        await asyncio.to_thread(self._update, delivery, DELIVERED)
+
+    async def run(self):
+        """Deliver the pending emails until cancelled."""
+        wakeup = self._wakeup = asyncio.Event()
+        running: set[asyncio.Task] = set()
+
+        def done(task: asyncio.Task):
+            running.discard(task)
+            wakeup.set()
+
+        try:
+            while True:
+                wakeup.clear()
+                deliveries, next_attempt = await asyncio.to_thread(
+                    self._claim, self.concurrency - len(running)
+                )
+                for delivery in deliveries:
+                    task = asyncio.create_task(self._deliver(delivery))
+                    running.add(task)
+                    task.add_done_callback(done)
+                timeout = None
+                if next_attempt is not None:
+                    timeout = max(next_attempt - time.time(), 0.1)
+                # Unlike `wait_for`, `timeout` never swallows a stop() racing a wakeup.
+                with contextlib.suppress(TimeoutError):
+                    async with asyncio.timeout(timeout):
+                        await wakeup.wait()
+        finally:
+            for task in running:
+                task.cancel()
+            await asyncio.gather(*running, return_exceptions=True)
+
+    def start(self):
+        """Start the worker on the running event loop, or wake it up."""
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self.run())
+        elif self._wakeup is not None:
+            self._wakeup.set()
+
+    async def stop(self):
+        """Stop the worker, leaving unfinished deliveries to be retried."""
+        if self._worker is not None:
+            self._worker.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._worker
+            self._worker = None
+
+    def dead_letters(self) -> list[dict]:
+        """Get the deliveries that were given up on.
+
+        Returns:
+            The dead-lettered deliveries.
+        """
+        with self._connect() as connection:
+            connection.row_factory = sqlite3.Row
+            return [
+                dict(row)
+                for row in connection.execute(
+                    "SELECT * FROM deliveries WHERE status = ? ORDER BY id", (DEAD,)
+                )
+            ]
+
+    def retry_dead_letters(self) -> int:
+        """Move the dead-lettered deliveries back to the queue.
+
+        Returns:
+            The number of requeued deliveries.
+        """
+        with self._connect() as connection:
+            return connection.execute(
+                "UPDATE deliveries SET status = ?, attempts = 0, next_attempt = ? "
+                "WHERE status = ?",
+                (PENDING, time.time(), DEAD),
+            ).rowcount
+
+
+def stub_server(failure_rate: float = 0.0) -> Starlette:
+    """Create a stub upstream accepting any POST, for local testing.
+
+    Received payloads are listed with a GET on any path.
+
+    Args:
+        failure_rate: Fraction of the requests answered with a 503.
+
+    Returns:
+        The Starlette app of the stub.
+    """
+    received: list[dict] = []
+
+    async def receive(request: Request) -> JSONResponse:
+        if request.method == "GET":
+            return JSONResponse(received)
+        if random.random() < failure_rate:
+            return JSONResponse({"success": False}, status_code=503)
+        received.append({"path": request.url.path, "body": await request.json()})
+        return JSONResponse({"success": True})
+
+    return Starlette(routes=[Route("/{path:path}", receive, methods=["GET", "POST"])])
+
+
+@contextlib.asynccontextmanager
+async def outbox_lifespan(outbox: Outbox) -> AsyncIterator[None]:
+    """Run an outbox worker for the lifetime of the app.
+
+    Args:
+        outbox: The outbox to run.
+
+    Yields:
+        Nothing, while the app runs.
+    """
+    outbox.start()
+    try:
+        yield
+    finally:
+        await outbox.stop()
@@ -1,16 +1,66 @@
-import contextlib
 import os
 from typing import Any
 
-import httpx
 import reflex as rx
-from email_validator import EmailNotValidError, ValidatedEmail, validate_email
+from email_validator import EmailNotValidError, ValidatedEmail
+from reflex.utils import console
 
+from reflex_ui.utils.metrics import instrument
+from reflex_ui_shared.backend.deliverability import validate_email_address
+from reflex_ui_shared.backend.http_client import get_http_client
+from reflex_ui_shared.backend.outbox import Outbox, raise_for_delivery
 from reflex_ui_shared.constants import (
     API_BASE_URL_LOOPS,
     REFLEX_DEV_WEB_NEWSLETTER_FORM_WEBHOOK_URL,
+    SIGNUP_OUTBOX_CONCURRENCY,
+    SIGNUP_OUTBOX_MAX_ATTEMPTS,
+    SIGNUP_OUTBOX_PATH,
 )
 
+# API key of Loops, read once at startup.
+LOOPS_API_KEY: str | None = os.getenv("LOOPS_API_KEY")
+
+signup_outbox = Outbox(
+    SIGNUP_OUTBOX_PATH,
+    concurrency=SIGNUP_OUTBOX_CONCURRENCY,
+    max_attempts=SIGNUP_OUTBOX_MAX_ATTEMPTS,
+)
+
+
+@signup_outbox.target("webhook")
+async def _send_contact_to_webhook(email: str):
+    response = await get_http_client().post(
+        REFLEX_DEV_WEB_NEWSLETTER_FORM_WEBHOOK_URL,
+        json={
+            "email": email,
+        },
+    )
+    raise_for_delivery(response)
+
+
+async def _add_contact_to_loops(email: str):
+    response = await get_http_client().post(
+        f"{API_BASE_URL_LOOPS}/contacts/create",
+        headers={
+            "Accept": "application/json",
+            "Authorization": f"Bearer {LOOPS_API_KEY}",
+        },
+        json={
+            "email": email,
+        },
+    )
+    # Loops answers 409 when the contact already exists.
+    if response.status_code != 409:
+        raise_for_delivery(response)
+
+
+# Without the API key, signups only go to the webhook instead of being
+# dead-lettered for Loops one by one.
+if LOOPS_API_KEY:
+    signup_outbox.target("loops")(_add_contact_to_loops)
+else:
+    console.warn("Loops API key does not exist, signups are not sent to Loops.")
+
 
 class IndexState(rx.State):
     """Hold the state for the home page."""
@@ -22,54 +72,30 @@ class IndexState(rx.State):
     show_confetti: bool = False
 
     @rx.event(background=True)
+    @instrument
     async def send_contact_to_webhook(
         self,
         email: str | None,
     ) -> None:
-        with contextlib.suppress(httpx.HTTPError):
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    REFLEX_DEV_WEB_NEWSLETTER_FORM_WEBHOOK_URL,
-                    json={
-                        "email": email,
-                    },
-                )
-            response.raise_for_status()
+        if email:
+            await signup_outbox.enqueue(email, "webhook")
 
     @rx.event(background=True)
+    @instrument
     async def add_contact_to_loops(
         self,
         email: str | None,
     ):
-        url: str = f"{API_BASE_URL_LOOPS}/contacts/create"
-        loops_api_key: str | None = os.getenv("LOOPS_API_KEY")
-        if loops_api_key is None:
-            print("Loops API key does not exist")
-            return
-
-        headers = {
-            "Accept": "application/json",
-            "Authorization": f"Bearer {loops_api_key}",
-        }
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    url,
-                    headers=headers,
-                    json={
-                        "email": email,
-                    },
-                )
-                response.raise_for_status()  # Raise an exception for HTTP errors (4xx and 5xx)
-
-        except httpx.HTTPError as e:
-            print(f"An error occurred: {e}")
+        if email and LOOPS_API_KEY:
+            await signup_outbox.enqueue(email, "loops")
 
     @rx.event
+    @instrument
     def signup_for_another_user(self):
         self.signed_up = False
 
     @rx.event(background=True)
+    @instrument
     async def signup(
         self,
         form_data: dict[str, Any],
@@ -78,9 +104,8 @@ class IndexState(rx.State):
         email: str | None = None
         if email_to_validate := form_data.get("input_email"):
             try:
-                validated_email: ValidatedEmail = validate_email(
-                    email_to_validate,
-                    check_deliverability=True,
+                validated_email: ValidatedEmail = await validate_email_address(
+                    email_to_validate
                 )
                 email = validated_email.normalized
 
@@ -94,8 +119,9 @@ class IndexState(rx.State):
                     },
                 )
                 return
-        yield IndexState.send_contact_to_webhook(email)
-        yield IndexState.add_contact_to_loops(email)
+        if email:
+            # Journaled before the success toast, delivered by the outbox worker.
+            await signup_outbox.enqueue(email)
         async with self:
             self.signed_up = True
             yield
@@ -1,9 +1,16 @@
 """Code block components for documentation pages."""
 
 import reflex as rx
+from reflex.components.datadisplay.shiki_code_block import (
+    BOX_PARENT_STYLING,
+    ShikiHighLevelCodeBlock,
+    copy_script,
+)
 
 import reflex_ui_shared.styles.fonts as fonts
 from reflex_ui_shared import styles
+from reflex_ui_shared.constants import DOCS_STATIC_HIGHLIGHT
+from reflex_ui_shared.utils.highlight import highlight
 
 
 @rx.memo
@@ -32,12 +39,86 @@ def code_block_dark(code: str, language: str):
     )
 
 
+def _copy_button(code: str) -> rx.Component:
+    # The default copy button of `rx._x.code_block`.
+    return rx.el.button(
+        rx.icon(tag="copy", size=16, color=rx.color("gray", 11)),
+        on_click=[
+            rx.set_clipboard(ShikiHighLevelCodeBlock._strip_transformer_triggers(code)),
+            copy_script(),
+        ],
+        style={
+            "position": "absolute",
+            "top": "4px",
+            "right": "4px",
+            "background": rx.color("gray", 3),
+            "border": "1px solid",
+            "border-color": rx.color("gray", 5),
+            "border-radius": "6px",
+            "padding": "5px",
+            "opacity": "1",
+            "cursor": "pointer",
+            "_hover": {
+                "background": rx.color("gray", 4),
+            },
+            "transition": "background 0.250s ease-out",
+            "&>svg": {
+                "transition": "transform 0.250s ease-out, opacity 0.250s ease-out",
+            },
+            "_active": {
+                "background": rx.color("gray", 5),
+            },
+        },
+    )
+
+
+# Props `static_code_block` renders like `rx._x.code_block` does.
+STATIC_CODE_BLOCK_PROPS = frozenset({"language", "can_copy", "class_name", "style"})
+
+
+def static_code_block(
+    code: str, language: str = "python", can_copy: bool = False, **props
+) -> rx.Component:
+    """Create a code block highlighted at build time.
+
+    Looks like `rx._x.code_block` with the default themes, without loading a
+    highlighter in the browser.
+
+    Args:
+        code: The code to display.
+        language: The language of the code.
+        can_copy: Whether to show the copy button.
+        props: Props of the code block.
+
+    Returns:
+        The code block.
+    """
+    return rx.box(
+        rx.html(highlight(code, language)),
+        _copy_button(code) if can_copy else rx.fragment(),
+        position="relative",
+        style={**BOX_PARENT_STYLING, **props.pop("style", {})},
+        **props,
+    )
+
+
 def code_block_markdown(*children, **props):
     language = props.get("language", "plain")
+    # Code known at build time is highlighted then, other code in the browser.
+    if DOCS_STATIC_HIGHLIGHT and isinstance(children[0], str):
+        return rx.box(
+            static_code_block(
+                children[0], language=language, class_name="code-block", can_copy=True
+            ),
+            class_name="relative mb-4",
+        )
     return code_block(code=children[0], language=language)
 
 
 def code_block_markdown_dark(*children, **props):
+    # Both code blocks use the color mode themes.
+    if DOCS_STATIC_HIGHLIGHT and isinstance(children[0], str):
+        return code_block_markdown(*children, **props)
     language = props.get("language", "plain")
     return code_block_dark(code=children[0], language=language)
 
@@ -4,9 +4,10 @@ import textwrap
 from typing import Any
 
 import reflex as rx
-import ruff_format
 
-from .code import code_block, code_block_dark
+from reflex_ui_shared.utils.format_cache import format_python
+
+from .code import code_block_markdown, code_block_markdown_dark
 
 
 def docdemobox(*children, **props) -> rx.Component:
@@ -45,7 +46,7 @@ def doccode(
     """
     # For Python snippets, lint the code with black.
     if language == "python":
-        code = ruff_format.format_string(textwrap.dedent(code)).strip()
+        code = format_python(code).strip()
 
     # If needed, only display a subset of the lines.
     if lines is not None:
@@ -54,11 +55,8 @@ def doccode(
         ).strip()
 
     # Create the code snippet.
-    cb = code_block_dark if theme == "dark" else code_block
-    return cb(
-        code=code,
-        language=language,
-    )
+    cb = code_block_markdown_dark if theme == "dark" else code_block_markdown
+    return cb(code, language=language)
 
 
 def docdemo(
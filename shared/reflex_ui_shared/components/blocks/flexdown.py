@@ -1,12 +1,31 @@
 # pyright: reportAttributeAccessIssue=false
+import ast
+import collections
+import contextlib
+import dataclasses
+import importlib
+import inspect
+import linecache
+import os
+import sys
+import textwrap
+import types
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
 import flexdown
 import reflex as rx
+from reflex.compiler.compiler import compile_unevaluated_page
+from reflex.utils import console
+from reflex.utils.exec import is_prod_mode
 from reflex_base.constants.colors import ColorType
 
 import reflex_ui as ui
 from reflex_ui_shared.components.blocks.code import (
+    STATIC_CODE_BLOCK_PROPS,
     code_block_markdown,
     code_block_markdown_dark,
+    static_code_block,
 )
 from reflex_ui_shared.components.blocks.collapsible import collapsible_box
 from reflex_ui_shared.components.blocks.demo import docdemo, docdemobox, docgraphing
@@ -26,9 +45,95 @@ from reflex_ui_shared.components.blocks.typography import (
     text_comp,
     unordered_list_comp,
 )
-from reflex_ui_shared.constants import REFLEX_ASSETS_CDN
+from reflex_ui_shared.constants import (
+    DOCS_INCREMENTAL_BUILD,
+    DOCS_STATIC_HIGHLIGHT,
+    REFLEX_ASSETS_CDN,
+)
 from reflex_ui_shared.styles.colors import c_color
 from reflex_ui_shared.styles.fonts import base, code
+from reflex_ui_shared.utils.code_cache import compile_cached, last_definition
+from reflex_ui_shared.utils.docpage import get_outline
+from reflex_ui_shared.utils.documents import document_cache
+from reflex_ui_shared.utils.format_cache import prefetch_formats
+
+# The flexdown module, shadowed by the Flexdown class on the package.
+_flexdown_module = importlib.import_module("flexdown.flexdown")
+
+# Number of times each file was rendered again.
+_renders: collections.Counter[str] = collections.Counter()
+
+
+def _demo_component(code: str, env: dict) -> rx.Component:
+    # The demo is the function or class the code defines last.
+    name = last_definition(code) or list(env.keys())[-1]
+    return env[name]()
+
+
+def _snippet_filename(block: flexdown.blocks.Block) -> str:
+    # Tracebacks name the snippet instead of the lines of the markdown file.
+    return f"<demo {block.filename}:{block.start_line_number}>"
+
+
+class CachedFlexdown(flexdown.Flexdown):
+    """Flexdown running exec blocks from cached code objects.
+
+    Modules are created in memory instead of being written to the flexdown
+    package and imported, and their source is registered for `inspect`.
+    """
+
+    def exec(self, content: str, env: dict | None = None, filename: str | None = None):
+        """Execute a block of code in its own module.
+
+        Args:
+            content: The code to execute.
+            env: The environment updated with the module globals.
+            filename: Filename of the document.
+
+        Raises:
+            RuntimeError: If the module of the block was already executed.
+        """
+        if env is None:
+            env = {}
+        if filename is None:
+            filename = ""
+
+        # Each block gets its own module, importing the previous one of the file.
+        per_file_modules = _flexdown_module.files.setdefault(filename, [])
+        module_file_name = flexdown.utils.get_id(
+            content
+            + filename
+            + str(len(per_file_modules))
+            + (f":{_renders[filename]}" if _renders[filename] else "")
+        )
+        if per_file_modules:
+            previous_module_name = f"flexdown.{self.module_dir}.{per_file_modules[-1]}"
+            content = f"from {previous_module_name} import *\n\n" + content
+        content += "\n"
+        per_file_modules.append(module_file_name)
+
+        module_name = f"flexdown.{self.module_dir}.{module_file_name}"
+        if module_name in sys.modules:
+            msg = f"{module_name} from {filename} has already been imported. This is a bug."
+            raise RuntimeError(msg)
+        module_path = str(self.get_full_module_dir() / f"{module_file_name}.py")
+        module = types.ModuleType(module_name)
+        module.__file__ = module_path
+        linecache.cache[module_path] = (
+            len(content),
+            None,
+            content.splitlines(keepends=True),
+            module_path,
+        )
+        sys.modules[module_name] = module
+
+        os.environ["PYTEST_CURRENT_TEST"] = "1"
+        try:
+            exec(compile_cached(content, module_path, "exec"), module.__dict__)
+        finally:
+            del os.environ["PYTEST_CURRENT_TEST"]
+
+        env.update(vars(module))
 
 
 def get_code_style(color: ColorType):
@@ -246,11 +351,11 @@ class DemoOnly(flexdown.blocks.Block):
         if "exec" in args:
             env["__xd"].exec(code, env, self.filename)
             if not exec_mode:
-                comp = env[list(env.keys())[-1]]()
+                comp = _demo_component(code, env)
         elif "graphing" in args:
             env["__xd"].exec(code, env, self.filename)
             if not exec_mode:
-                comp = env[list(env.keys())[-1]]()
+                comp = _demo_component(code, env)
                 # Get all the code before the final "def".
                 parts = code.rpartition("def")
                 data, code = parts[0], parts[1] + parts[2]
@@ -258,10 +363,10 @@ class DemoOnly(flexdown.blocks.Block):
         elif exec_mode:
             return comp
         elif "box" in args:
-            comp = eval(code, env, env)
+            comp = eval(compile_cached(code, _snippet_filename(self), "eval"), env, env)
             return rx.box(comp, margin_bottom="1em", id=comp_id)
         else:
-            comp = eval(code, env, env)
+            comp = eval(compile_cached(code, _snippet_filename(self), "eval"), env, env)
 
         # Return only the component without any code display
         return rx.box(comp, margin_bottom="1em", id=comp_id)
@@ -294,11 +399,11 @@ class DemoBlock(flexdown.blocks.Block):
         if "exec" in args:
             env["__xd"].exec(code, env, self.filename)
             if not exec_mode:
-                comp = env[list(env.keys())[-1]]()
+                comp = _demo_component(code, env)
         elif "graphing" in args:
             env["__xd"].exec(code, env, self.filename)
             if not exec_mode:
-                comp = env[list(env.keys())[-1]]()
+                comp = _demo_component(code, env)
                 # Get all the code before the final "def".
                 parts = code.rpartition("def")
                 data, code = parts[0], parts[1] + parts[2]
@@ -306,10 +411,10 @@ class DemoBlock(flexdown.blocks.Block):
         elif exec_mode:
             return comp
         elif "box" in args:
-            comp = eval(code, env, env)
+            comp = eval(compile_cached(code, _snippet_filename(self), "eval"), env, env)
             return rx.box(docdemobox(comp), margin_bottom="1em", id=comp_id)
         else:
-            comp = eval(code, env, env)
+            comp = eval(compile_cached(code, _snippet_filename(self), "eval"), env, env)
 
         # Sweep up additional CSS-like props to apply to the demobox itself
         demobox_props = {}
@@ -562,7 +667,7 @@ class TabsBlock(flexdown.blocks.Block):
                 if isinstance(block, flexdown.blocks.MarkdownBlock):
                     block.render_fn = env["__xd"].flexdown_memo
                 try:
-                    tab_content.append(block.render(env=env))
+                    tab_content.append(_render_block(block, env))
                 except Exception:
                     print(
                         f"Error while rendering {type(block)} on line {block.start_line_number}. "
@@ -577,6 +682,18 @@ class TabsBlock(flexdown.blocks.Block):
         )
 
 
+def _render_block(block: flexdown.blocks.Block, env: dict) -> rx.Component:
+    # Fenced code is highlighted at build time rather than by the markdown
+    # component in the browser.
+    if DOCS_STATIC_HIGHLIGHT and type(block) is flexdown.blocks.CodeBlock:
+        lines = block.get_content(env).splitlines()
+        info = lines[0].lstrip("`").split()
+        return env["__xd"].component_map["pre"](
+            "\n".join(lines[1:-1]), language=info[0] if info else "plain"
+        )
+    return block.render(env=env)
+
+
 def _markdown_table(*children, **props) -> rx.Component:
     return rx.box(
         rx.el.table(
@@ -656,7 +773,7 @@ comp2["ul"] = lambda items: unordered_list_comp(items=items)
 comp2["ol"] = lambda items: ordered_list_comp(items=items)
 
 
-xd = flexdown.Flexdown(
+xd = CachedFlexdown(
     block_types=[
         DemoOnly,
         DemoBlock,
@@ -671,7 +788,7 @@ xd = flexdown.Flexdown(
     component_map=component_map,
 )
 xd.clear_modules()
-xd2 = flexdown.Flexdown(
+xd2 = CachedFlexdown(
     block_types=[
         DemoBlockDark,
         DemoBlockNestedMarkdownDark,
@@ -691,8 +808,315 @@ def markdown(text: str):
     return xd.get_default_block().render_fn(content=text)
 
 
+def _render_document(document: flexdown.Document, filename: str) -> rx.Component:
+    outline = get_outline(document, filename)
+    env = document.metadata
+
+    # Format the demo snippets of the document in one batch.
+    prefetch_formats(
+        "\n".join(block.lines[1:-1])
+        for block in outline.blocks
+        if isinstance(block, DemoBlock)
+    )
+
+    # Reset the exec modules of the file for consistent hashing, like xd.render.
+    # A file rendered again gets new modules, as its states can't be redefined.
+    xd.clear_module(filename)
+    if _flexdown_module.files.pop(filename, None) is not None:
+        _renders[filename] += 1
+
+    out: list[rx.Component] = []
+    for block in outline.blocks:
+        if isinstance(block, flexdown.blocks.MarkdownBlock):
+            block.render_fn = xd.flexdown_memo
+        try:
+            comp = _render_block(block, env)
+        except Exception:
+            console.error(
+                f"Error while rendering {type(block)} on line {block.start_line_number}. "
+                f"\n{block.get_content(env)}"
+            )
+            raise
+        if comp:
+            out.append(comp)
+    return xd.page_template(rx.fragment(*out))
+
+
+def _file_version(path: str) -> str:
+    try:
+        stat = Path(path).stat()
+    except OSError:
+        return ""
+    return f"{stat.st_mtime_ns}:{stat.st_size}"
+
+
+def _source_file(obj: object) -> str | None:
+    with contextlib.suppress(TypeError, OSError):
+        if source := inspect.getsourcefile(obj):  # pyright: ignore [reportArgumentType]
+            return str(Path(source).resolve())
+    return None
+
+
+def _imported_modules(code: str) -> Iterator[str]:
+    try:
+        tree = ast.parse(textwrap.dedent(code))
+    except SyntaxError:
+        return
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            yield from (alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            yield node.module
+            yield from (f"{node.module}.{alias.name}" for alias in node.names)
+
+
+def _local_module_file(name: str) -> str | None:
+    # Source file of an imported module of the project, None for installed packages.
+    file = getattr(sys.modules.get(name), "__file__", None)
+    if not file:
+        return None
+    path = Path(file).resolve()
+    if not path.is_relative_to(Path.cwd()) or "site-packages" in path.parts:
+        return None
+    return str(path)
+
+
+def _evaluating_route() -> str | None:
+    # Route of the page reflex is evaluating, from the frame of its compiler.
+    frame = inspect.currentframe()
+    while frame is not None:
+        if frame.f_code is compile_unevaluated_page.__code__:
+            return frame.f_locals.get("route")
+        frame = frame.f_back
+    return None
+
+
+def incremental_build_enabled() -> bool:
+    """Check whether rendered documents are tracked for incremental rebuilds.
+
+    Returns:
+        Whether DOCS_INCREMENTAL_BUILD applies to this process.
+    """
+    return DOCS_INCREMENTAL_BUILD == "1" or (
+        DOCS_INCREMENTAL_BUILD == "dev" and not is_prod_mode()
+    )
+
+
+@dataclasses.dataclass
+class RenderedDocument:
+    # The document passed by the page, reloaded from its file once it changes.
+    source: flexdown.Document
+
+    # Version of the document file when the page passed the document.
+    source_version: str
+
+    # Version of each file the output depends on, by path.
+    dependencies: dict[str, str]
+
+    # Routes of the pages showing the document.
+    routes: set[str] = dataclasses.field(default_factory=set)
+
+
+class IncrementalRenderer:
+    """Renders documents and tracks what each of them depends on.
+
+    A document depends on its file, the files defining its block types and
+    the component map, and the project modules its code imports. The pages
+    showing it are recorded while reflex evaluates them, so a watcher can
+    rebuild only the pages of the documents that changed, see `docs_watch`.
+    """
+
+    def __init__(self):
+        """Create a renderer."""
+        self._rendered: dict[str, RenderedDocument] = {}
+        # Keys of the rendered documents depending on each file.
+        self.dependents: dict[str, set[str]] = collections.defaultdict(set)
+        # Version of each dependency when it was last checked, by path.
+        self._versions: dict[str, str] = {}
+        self._component_map_files: set[str] | None = None
+
+    @staticmethod
+    def key(document: flexdown.Document, filename: str) -> str:
+        """Get the key of a document.
+
+        Args:
+            document: The document.
+            filename: Filename of the document, as passed to the renderer.
+
+        Returns:
+            The path of the document file, or the filename when not loaded from a file.
+        """
+        return str(Path(document.filename).resolve()) if document.filename else filename
+
+    def _dependencies(self, document: flexdown.Document, filename: str) -> set[str]:
+        if self._component_map_files is None:
+            self._component_map_files = {
+                path
+                for value in xd.component_map.values()
+                if (path := _source_file(value))
+            }
+        outline = get_outline(document, filename)
+        sources = {_source_file(type(block)) for block in outline.blocks}
+        sources.update(self._component_map_files)
+        sources.update(
+            _local_module_file(name)
+            for block in outline.blocks
+            if block.lines and block.lines[0].lstrip("`").startswith("python")
+            for name in _imported_modules("\n".join(block.lines[1:-1]))
+        )
+        if document.filename:
+            sources.add(self.key(document, filename))
+        return {path for path in sources if path}
+
+    def current(self, document: flexdown.Document, filename: str) -> flexdown.Document:
+        """Get the up to date version of a document the page loaded earlier.
+
+        Pages keep the document they loaded, so once its file changes the
+        document is loaded again, without metadata added by the page.
+
+        Args:
+            document: The document passed by the page.
+            filename: Filename of the document, as passed to the renderer.
+
+        Returns:
+            The document, or the document loaded again from its changed file.
+        """
+        rendered = self._rendered.get(self.key(document, filename))
+        if (
+            rendered is None
+            or rendered.source is not document
+            or not document.filename
+            or _file_version(rendered.source.filename) == rendered.source_version  # pyright: ignore [reportArgumentType]
+        ):
+            return document
+        return document_cache.get(document.filename)
+
+    def render(self, document: flexdown.Document, filename: str) -> rx.Component:
+        """Render a document, recording its dependencies and the page showing it.
+
+        Args:
+            document: The document to render.
+            filename: Filename of the document.
+
+        Returns:
+            The rendered document.
+        """
+        key = self.key(document, filename)
+        previous = self._rendered.get(key)
+        source, current = document, self.current(document, filename)
+        component = _render_document(current, filename)
+        if previous is not None:
+            for path in previous.dependencies:
+                self.dependents[path].discard(key)
+        dependencies = self._dependencies(current, filename)
+        rendered = self._rendered[key] = RenderedDocument(
+            source=source,
+            source_version=(
+                previous.source_version
+                if previous is not None and previous.source is source
+                else _file_version(key)
+            ),
+            dependencies={path: _file_version(path) for path in dependencies},
+            routes=previous.routes if previous is not None else set(),
+        )
+        if route := _evaluating_route():
+            rendered.routes.add(route)
+        for path, version in rendered.dependencies.items():
+            self.dependents[path].add(key)
+            self._versions[path] = version
+        return component
+
+    def changed(self) -> set[str]:
+        """Get the dependencies changed since the last check.
+
+        Returns:
+            Paths of the changed files.
+        """
+        changed = set()
+        for path, version in self._versions.items():
+            if (current := _file_version(path)) != version:
+                self._versions[path] = current
+                changed.add(path)
+        return changed
+
+    def affected(self, paths: Iterable[str | Path]) -> set[str]:
+        """Get the rendered documents depending on some files.
+
+        Args:
+            paths: Paths of the changed files.
+
+        Returns:
+            Keys of the documents to render again.
+        """
+        return {
+            key
+            for path in paths
+            for key in self.dependents.get(str(Path(path).resolve()), ())
+        }
+
+    def routes(self, keys: Iterable[str]) -> set[str]:
+        """Get the routes of the pages showing some documents.
+
+        Args:
+            keys: Keys of the documents.
+
+        Returns:
+            The routes.
+        """
+        return {
+            route
+            for key in keys
+            if (rendered := self._rendered.get(key)) is not None
+            for route in rendered.routes
+        }
+
+
+docs_renderer = IncrementalRenderer()
+
+
+def current_document(document: flexdown.Document, filename: str) -> flexdown.Document:
+    """Get the up to date version of a document, see `IncrementalRenderer.current`.
+
+    Args:
+        document: The document passed by the page.
+        filename: Filename of the document.
+
+    Returns:
+        The document, or the document loaded again from its changed file.
+    """
+    if incremental_build_enabled():
+        return docs_renderer.current(document, filename)
+    return document
+
+
+def render_document(document: flexdown.Document, filename: str) -> rx.Component:
+    """Render a document with `xd`, reusing the blocks parsed for its TOC.
+
+    Equivalent to `xd.render(document, filename)`. In incremental mode, see
+    DOCS_INCREMENTAL_BUILD, the dependencies of the document and the pages
+    showing it are tracked for `docs_watch`.
+
+    Args:
+        document: The document to render.
+        filename: Filename of the document.
+
+    Returns:
+        The rendered document.
+    """
+    if incremental_build_enabled():
+        return docs_renderer.render(document, filename)
+    return _render_document(document, filename)
+
+
 def markdown_codeblock(value: str, **props: object) -> rx.Component:
     """Render a code block using the Shiki-based code block component."""
+    # Other props, like the theme or line numbers, need the Shiki code block.
+    if (
+        DOCS_STATIC_HIGHLIGHT
+        and isinstance(value, str)
+        and props.keys() <= STATIC_CODE_BLOCK_PROPS
+    ):
+        return static_code_block(value, **props)
     return rx._x.code_block(value, **props)
 
 
@@ -2,7 +2,6 @@
 
 from typing import Any
 
-import flexdown
 import mistletoe
 
 from .blocks import *
@@ -141,46 +140,19 @@ def get_headings(comp: Any):
 
 
 def get_toc(source: Any, href: str, component_list: list | None = None):
-    from reflex_ui_shared.flexdown import xd
+    from reflex_ui_shared.components.blocks.flexdown import current_document
+    from reflex_ui_shared.utils.docpage import get_outline
 
+    source = current_document(source, href)
     component_list = component_list or []
     component_list = component_list[1:]
 
-    # Generate the TOC
-    # The environment used for execing and evaling code.
-    from reflex_ui_shared.constants import REFLEX_ASSETS_CDN
-
-    env = source.metadata
-    env["__xd"] = xd
-    env["REFLEX_ASSETS_CDN"] = REFLEX_ASSETS_CDN
-
-    # Get the content of the document.
-    doc_content = source.content
-
-    # Get the blocks in the source code.
-    # Note: we must use reflex-web's special flexdown instance xd here - it knows about all custom block types (like DemoBlock)
-    blocks = xd.get_blocks(doc_content, href)
-
-    content_pieces = []
-    for block in blocks:
-        if (
-            not isinstance(block, flexdown.blocks.MarkdownBlock)
-            or len(block.lines) == 0
-            or not block.lines[0].startswith("#")
-        ):
-            continue
-        # Now we should have all the env entries we need
-        content = block.get_content(env)
-        content_pieces.append(content)
-
-    content = "\n".join(content_pieces)
-    doc = mistletoe.Document(content)
-
-    # Parse the markdown headers.
-    headings = get_headings(doc)
+    # Generate the TOC from the outline shared with the page render.
+    headings = [
+        (heading.level, heading.text) for heading in get_outline(source, href).headings
+    ]
 
     if len(component_list):
         headings.append((1, "API Reference"))
-    for component_tuple in component_list:
-        headings.append((2, component_tuple[1]))
-    return headings, doc_content
+    headings.extend((2, component_tuple[1]) for component_tuple in component_list)
+    return headings, source.content
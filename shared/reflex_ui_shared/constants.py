@@ -26,11 +26,86 @@ REFLEX_DOMAIN = "reflex.dev"
 TWITTER_CREATOR = "@getreflex"
 
 
-API_BASE_URL_LOOPS: str = "https://app.loops.so/api/v1"
-REFLEX_DEV_WEB_NEWSLETTER_FORM_WEBHOOK_URL: str = "https://hkdk.events/t0qopjbznnp2fr"
+API_BASE_URL_LOOPS: str = os.environ.get(
+    "API_BASE_URL_LOOPS", "https://app.loops.so/api/v1"
+)
+REFLEX_DEV_WEB_NEWSLETTER_FORM_WEBHOOK_URL: str = os.environ.get(
+    "REFLEX_DEV_WEB_NEWSLETTER_FORM_WEBHOOK_URL", "https://hkdk.events/t0qopjbznnp2fr"
+)
 REFLEX_DEV_WEB_GENERAL_FORM_FEEDBACK_WEBHOOK_URL: str = os.environ.get(
     "REFLEX_DEV_WEB_GENERAL_FORM_FEEDBACK_WEBHOOK_URL", ""
 )
 RECENT_BLOGS_API_URL: str = os.environ.get(
     "RECENT_BLOGS_API_URL", "https://reflex.dev/api/v1/recent-blogs"
 )
+# Seconds the recent blogs are served from the cache before being refreshed.
+RECENT_BLOGS_CACHE_TTL: float = float(os.environ.get("RECENT_BLOGS_CACHE_TTL", "600"))
+# Seconds past the TTL during which stale recent blogs are served while refreshing.
+RECENT_BLOGS_CACHE_MAX_STALE: float = float(
+    os.environ.get("RECENT_BLOGS_CACHE_MAX_STALE", "86400")
+)
+# Directory sharing the cached recent blogs between workers. Memory only when empty.
+RECENT_BLOGS_CACHE_DIR: str = os.environ.get("RECENT_BLOGS_CACHE_DIR", "")
+# Seconds before a request of the shared HTTP client times out.
+HTTP_CLIENT_TIMEOUT: float = float(os.environ.get("HTTP_CLIENT_TIMEOUT", "10"))
+# Maximum number of connections of the shared HTTP client.
+HTTP_CLIENT_MAX_CONNECTIONS: int = int(
+    os.environ.get("HTTP_CLIENT_MAX_CONNECTIONS", "100")
+)
+# Maximum number of idle connections the shared HTTP client keeps alive.
+HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS: int = int(
+    os.environ.get("HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS", "20")
+)
+# Maximum number of concurrent requests of the shared HTTP client to a single host.
+HTTP_CLIENT_MAX_CONNECTIONS_PER_HOST: int = int(
+    os.environ.get("HTTP_CLIENT_MAX_CONNECTIONS_PER_HOST", "10")
+)
+# Seconds an idle connection of the shared HTTP client is kept alive.
+HTTP_CLIENT_KEEPALIVE_EXPIRY: float = float(
+    os.environ.get("HTTP_CLIENT_KEEPALIVE_EXPIRY", "30")
+)
+# SQLite journal of the signup deliveries to the newsletter webhook and Loops.
+SIGNUP_OUTBOX_PATH: str = os.environ.get(
+    "SIGNUP_OUTBOX_PATH", ".states/signup_outbox.db"
+)
+# Maximum number of signup deliveries running at once.
+SIGNUP_OUTBOX_CONCURRENCY: int = int(os.environ.get("SIGNUP_OUTBOX_CONCURRENCY", "4"))
+# Attempts after which a signup delivery is moved to the dead-letter log.
+SIGNUP_OUTBOX_MAX_ATTEMPTS: int = int(os.environ.get("SIGNUP_OUTBOX_MAX_ATTEMPTS", "8"))
+# Seconds a domain accepting email is cached by the signup deliverability check.
+EMAIL_DELIVERABILITY_CACHE_TTL: float = float(
+    os.environ.get("EMAIL_DELIVERABILITY_CACHE_TTL", "86400")
+)
+# Seconds a domain not accepting email is cached by the signup deliverability check.
+EMAIL_DELIVERABILITY_NEGATIVE_TTL: float = float(
+    os.environ.get("EMAIL_DELIVERABILITY_NEGATIVE_TTL", "3600")
+)
+# Maximum number of domains cached by the signup deliverability check.
+EMAIL_DELIVERABILITY_CACHE_SIZE: int = int(
+    os.environ.get("EMAIL_DELIVERABILITY_CACHE_SIZE", "10000")
+)
+# Seconds after which the signup deliverability check lets the email through.
+EMAIL_DELIVERABILITY_TIMEOUT: float = float(
+    os.environ.get("EMAIL_DELIVERABILITY_TIMEOUT", "5")
+)
+# Directory of the parsed flexdown document cache. Memory only when empty.
+DOCUMENT_CACHE_DIR: str = os.environ.get("DOCUMENT_CACHE_DIR", ".states/flexdown")
+# Processes parsing flexdown documents at startup. Defaults to the CPU count when 0.
+DOCUMENT_PARSE_WORKERS: int = int(os.environ.get("DOCUMENT_PARSE_WORKERS", "0"))
+# Minimum number of changed documents parsed in parallel, smaller batches are parsed serially.
+DOCUMENT_PARSE_MIN_PARALLEL: int = int(
+    os.environ.get("DOCUMENT_PARSE_MIN_PARALLEL", "256")
+)
+# Directory of the compiled docs code cache. Memory only when empty.
+DOCS_CODE_CACHE_DIR: str = os.environ.get("DOCS_CODE_CACHE_DIR", ".states/docs_code")
+# Directory of the formatted docs snippets cache. Memory only when empty.
+DOCS_FORMAT_CACHE_DIR: str = os.environ.get(
+    "DOCS_FORMAT_CACHE_DIR", ".states/ruff_format"
+)
+# Whether the pages showing each doc are tracked to rebuild only them: `dev` outside production, `1` always, `0` never.
+DOCS_INCREMENTAL_BUILD: str = os.environ.get("DOCS_INCREMENTAL_BUILD", "dev")
+# Seconds between checks of the docs files for changes by `docs_watch_lifespan`.
+DOCS_WATCH_INTERVAL: float = float(os.environ.get("DOCS_WATCH_INTERVAL", "0.5"))
+# Whether docs snippets known at build time are highlighted then instead of in the browser.
+# Pygments approximates the Shiki colors, e.g. parameters and attributes stay uncolored.
+DOCS_STATIC_HIGHLIGHT: bool = os.environ.get("DOCS_STATIC_HIGHLIGHT", "0") == "1"
@@ -1,23 +1,18 @@
-import copy
-import re
+import dataclasses
 
 import flexdown
 import reflex as rx
 
 import reflex_ui as ui
 from reflex_ui.blocks.demo_form import demo_form_dialog
-from reflex_ui_shared.components.blocks.flexdown import xd
+from reflex_ui_shared.components.blocks.flexdown import render_document
 from reflex_ui_shared.components.code_card import gallery_app_card
 from reflex_ui_shared.components.icons import get_icon
-from reflex_ui_shared.constants import REFLEX_ASSETS_CDN, SCREENSHOT_BUCKET
+from reflex_ui_shared.constants import REFLEX_ASSETS_CDN
 from reflex_ui_shared.gallery.gallery import integrations_stack
+from reflex_ui_shared.gallery.index import get_gallery_index
 from reflex_ui_shared.templates.gallery_app_page import gallery_app_page
 
-GALLERY_APP_SOURCES = [
-    ("templates/", "docs/getting-started/open-source-templates/"),
-    ("reflex_build_templates/", "templates/"),
-]
-
 
 def integration_image(integration: str):
     integration_logo = integration.replace(" ", "_").lower()
@@ -42,59 +37,44 @@ def integration_image(integration: str):
 
 
 def load_all_gallery_apps():
-    """Load markdown files from all supported paths and associate them with their base folder."""
-    gallery_apps = {}
-    for folder, _ in GALLERY_APP_SOURCES:
-        paths = flexdown.utils.get_flexdown_files(folder)
-        for path in sorted(paths, reverse=True):
-            document = flexdown.Document.from_file(path)  # This has metadata
-            document.metadata["title"] = document.metadata.get("title", "Untitled")
-            clean_path = str(path).replace(".md", "/")
-            gallery_apps[(clean_path, folder)] = document
-    return gallery_apps
+    """Get the gallery documents keyed by path and base folder, with resolved titles and images."""
+    return {
+        (entry.path, entry.folder): dataclasses.replace(
+            entry.document,
+            metadata={
+                **entry.document.metadata,
+                "title": entry.title,
+                "image": entry.image,
+            },
+        )
+        for entry in get_gallery_index().entries
+    }
 
 
 gallery_apps_data = load_all_gallery_apps()
 gallery_apps_data_copy = {path: doc for (path, _), doc in gallery_apps_data.items()}
 gallery_apps_data_open_source = {
-    (path, folder): doc
-    for (path, folder), doc in load_all_gallery_apps().items()
-    if folder == "templates/"
+    (entry.path, entry.folder): dataclasses.replace(
+        entry.document,
+        metadata={**entry.document.metadata, "title": entry.title},
+    )
+    for entry in get_gallery_index().by_folder["templates/"]
 }
 
 
 def more_posts(current_post: dict) -> rx.Component:
-    posts = []
-    app_copy = copy.deepcopy(gallery_apps_data)
-    app_items = list(app_copy.items())
-    current_index = next(
-        (
-            i
-            for i, (path, document) in enumerate(app_items)
-            if document.metadata.get("title") == current_post.get("title")
-        ),
-        None,
+    index = get_gallery_index()
+    current = index.by_title.get(current_post.get("title", ""))
+    selected_posts = (
+        index.related[current[0].path, current[0].folder]
+        if current
+        else index.entries[-3:]
     )
-
-    if current_index is None:
-        selected_posts = app_items[-3:]
-    else:
-        other_posts = app_items[:current_index] + app_items[current_index + 1 :]
-        if len(other_posts) <= 3:
-            selected_posts = other_posts
-        elif current_index == 0:
-            selected_posts = other_posts[:3]
-        elif current_index >= len(app_items) - 1:
-            selected_posts = other_posts[-3:]
-        else:
-            if current_index < len(app_items) - 2:
-                selected_posts = other_posts[current_index - 1 : current_index + 2]
-            else:
-                selected_posts = other_posts[current_index - 2 : current_index + 1]
-
-    for _path, document in selected_posts:
-        if not _path[0].startswith("reflex_build_templates/"):
-            posts.append(gallery_app_card(app=document.metadata))
+    posts = [
+        gallery_app_card(app=gallery_apps_data[entry.path, entry.folder].metadata)
+        for entry in selected_posts
+        if not entry.path.startswith("reflex_build_templates/")
+    ]
 
     return rx.el.section(
         rx.box(
@@ -246,7 +226,7 @@ def page(document: flexdown.Document, is_reflex_template: bool) -> rx.Component:
                 class_name="grid grid-cols-1 lg:grid-cols-2 divide-y lg:divide-y-0 lg:divide-x divide-slate-3 border-b border-slate-3",
             ),
             rx.box(
-                xd.render(document, "blog.md"),
+                render_document(document, "blog.md"),
                 class_name="flex flex-col gap-4 w-full p-8",
             ),
             more_posts(meta) if not is_reflex_template else rx.fragment(),
@@ -256,29 +236,15 @@ def page(document: flexdown.Document, is_reflex_template: bool) -> rx.Component:
 
 
 gallery_apps_routes = []
-for (_path, source_folder), document in gallery_apps_data.items():
-    is_reflex_template = source_folder.startswith("reflex_build_templates")
-    base_url = (
-        "templates/"
-        if is_reflex_template
-        else "docs/getting-started/open-source-templates/"
-    )
-    slug = re.sub(r"[\s_]+", "-", document.metadata["title"]).lower()
-    route = f"/{base_url}{slug}"
-
-    document.metadata["image"] = (
-        f"{REFLEX_ASSETS_CDN}reflex_build_template_images/{document.metadata['image']}"
-        if is_reflex_template and not document.metadata.get("ai_template", False)
-        else f"{REFLEX_ASSETS_CDN}templates/{document.metadata['image']}"
-        if not document.metadata.get("ai_template", False)
-        else f"{SCREENSHOT_BUCKET}{document.metadata['image']}"
-    )
+for entry in get_gallery_index().entries:
+    document = gallery_apps_data[entry.path, entry.folder]
+    is_reflex_template = entry.folder.startswith("reflex_build_templates")
 
     comp = gallery_app_page(
-        path=route,
-        title=document.metadata["title"],
+        path=entry.route,
+        title=entry.title,
         description=document.metadata.get("description", ""),
-        image=document.metadata["image"],
+        image=entry.image,
         demo=document.metadata.get("demo"),
         meta=document.metadata.get("meta", []),
     )(lambda doc=document, is_rt=is_reflex_template: page(doc, is_rt))
@@ -5,20 +5,27 @@ import reflex as rx
 
 import reflex_ui as ui
 from reflex_ui_shared.constants import INTEGRATIONS_IMAGES_URL, REFLEX_ASSETS_CDN
+from reflex_ui_shared.gallery.index import get_gallery_index
 from reflex_ui_shared.gallery.r_svg_loader import r_svg_loader
+from reflex_ui_shared.utils.documents import load_documents
 
 REFLEX_BUILD_TEMPLATES_PATH = "reflex_build_templates/"
 REFLEX_BUILD_TEMPLATES_IMAGES = "reflex_build_template_images/"
 
 
 def get_templatey_apps(paths: list):
-    """Method to parse each markdown file and return the data from the file."""
-    gallery_apps = {}
-    for path in sorted(paths, reverse=True):
-        document = flexdown.Document.from_file(path)  # This has metadata
-        key = str(path).replace(".md", "/")
-        gallery_apps[key] = document
-    return gallery_apps
+    """Method to return the data of each markdown file, by path.
+
+    Files of the gallery index are not parsed again. Prefer reading
+    `get_gallery_index()` directly.
+    """
+    indexed = {entry.path: entry.document for entry in get_gallery_index().entries}
+    keys = {str(path).replace(".md", "/"): path for path in sorted(paths, reverse=True)}
+    missing = [key for key in keys if key not in indexed]
+    loaded = dict(
+        zip(missing, load_documents([keys[key] for key in missing]), strict=True)
+    )
+    return {key: indexed[key] if key in indexed else loaded[key] for key in keys}
 
 
 paths = flexdown.utils.get_flexdown_files(REFLEX_BUILD_TEMPLATES_PATH)
@@ -0,0 +1,202 @@
+"""Index of the gallery documents, built once per process.
+
+The gallery pages, grids and sidebar all read the same markdown folders. They
+share this index instead of scanning and parsing the folders themselves. Treat
+the indexed documents as read-only, and copy them before customizing them.
+"""
+
+import collections
+import dataclasses
+import functools
+import re
+
+import flexdown
+
+from reflex_ui_shared.constants import REFLEX_ASSETS_CDN, SCREENSHOT_BUCKET
+from reflex_ui_shared.utils.documents import load_documents
+
+# Markdown folders of the gallery and the base route of their pages.
+GALLERY_APP_SOURCES = [
+    ("templates/", "docs/getting-started/open-source-templates/"),
+    ("reflex_build_templates/", "templates/"),
+]
+
+# Number of related entries of each entry.
+RELATED_COUNT = 3
+
+
+@dataclasses.dataclass(frozen=True)
+class GalleryEntry:
+    """A gallery document and the fields derived from it."""
+
+    # Path of the markdown file, with `.md` replaced by `/`.
+    path: str
+
+    # Folder the document was loaded from.
+    folder: str
+
+    # The parsed document.
+    document: flexdown.Document
+
+    # Title of the document, `Untitled` when missing.
+    title: str
+
+    # Slug of the title.
+    slug: str
+
+    # Route of the document page.
+    route: str
+
+    # URL of the document image.
+    image: str
+
+    @property
+    def tags(self) -> list[str]:
+        """Tags of the document."""
+        return self.document.metadata.get("tags") or []
+
+
+def _image_url(metadata: dict, is_reflex_template: bool) -> str:
+    if metadata.get("ai_template", False):
+        return f"{SCREENSHOT_BUCKET}{metadata['image']}"
+    if is_reflex_template:
+        return f"{REFLEX_ASSETS_CDN}reflex_build_template_images/{metadata['image']}"
+    return f"{REFLEX_ASSETS_CDN}templates/{metadata['image']}"
+
+
+def _neighbors(
+    entries: list[GalleryEntry], index: int, count: int = RELATED_COUNT
+) -> list[GalleryEntry]:
+    # Window over the other entries, centered on the entry and shifted left near the end.
+    size = len(entries) - 1
+    if size <= count or index == 0:
+        start = 0
+    elif index >= size:
+        start = size - count
+    elif index < size - 1:
+        start = index - 1
+    else:
+        start = index - 2
+    return [
+        entries[i if i < index else i + 1]
+        for i in range(start, min(start + count, size))
+    ]
+
+
+def _features(entry: GalleryEntry) -> set[str]:
+    return {f"tag:{tag}" for tag in entry.tags} | {
+        f"integration:{integration}"
+        for integration in entry.document.metadata.get("integrations") or []
+    }
+
+
+def _similar(
+    entries: list[GalleryEntry], index: int, count: int = RELATED_COUNT
+) -> list[GalleryEntry]:
+    features = _features(entries[index])
+    ranked = sorted(
+        (i for i in range(len(entries)) if i != index),
+        key=lambda i: (-len(features & _features(entries[i])), abs(i - index)),
+    )
+    return [entries[i] for i in ranked[:count]]
+
+
+@dataclasses.dataclass
+class GalleryIndex:
+    """Views of the gallery documents."""
+
+    # All the entries, by folder and in reverse path order.
+    entries: list[GalleryEntry]
+
+    # Entries by folder.
+    by_folder: dict[str, list[GalleryEntry]] = dataclasses.field(init=False)
+
+    # Entries by slug.
+    by_slug: dict[str, list[GalleryEntry]] = dataclasses.field(init=False)
+
+    # Entries by tag.
+    by_tag: dict[str, list[GalleryEntry]] = dataclasses.field(init=False)
+
+    # Entries by title.
+    by_title: dict[str, list[GalleryEntry]] = dataclasses.field(init=False)
+
+    # Neighbors of each entry in the entries, by path and folder.
+    related: dict[tuple[str, str], list[GalleryEntry]] = dataclasses.field(init=False)
+
+    # Similar entries computed so far, by path and folder.
+    _similar: dict[tuple[str, str], list[GalleryEntry]] = dataclasses.field(
+        init=False, default_factory=dict, repr=False
+    )
+
+    def __post_init__(self):
+        """Build the views."""
+        self.by_folder = collections.defaultdict(list)
+        self.by_slug = collections.defaultdict(list)
+        self.by_tag = collections.defaultdict(list)
+        self.by_title = collections.defaultdict(list)
+        for entry in self.entries:
+            self.by_folder[entry.folder].append(entry)
+            self.by_slug[entry.slug].append(entry)
+            self.by_title[entry.title].append(entry)
+            for tag in entry.tags:
+                self.by_tag[tag].append(entry)
+        self.related = {
+            (entry.path, entry.folder): _neighbors(self.entries, i)
+            for i, entry in enumerate(self.entries)
+        }
+
+    def similar(self, entry: GalleryEntry) -> list[GalleryEntry]:
+        """Get the entries of the same folder sharing the most tags and integrations.
+
+        Closest neighbors come first on ties. Computed on first use per entry.
+
+        Args:
+            entry: An entry of the index.
+
+        Returns:
+            The similar entries.
+        """
+        key = (entry.path, entry.folder)
+        if (similar := self._similar.get(key)) is None:
+            entries = self.by_folder[entry.folder]
+            similar = self._similar[key] = _similar(entries, entries.index(entry))
+        return similar
+
+
+def build_gallery_index() -> GalleryIndex:
+    """Load the gallery documents and index them.
+
+    Returns:
+        The gallery index.
+    """
+    entries = []
+    for folder, base_url in GALLERY_APP_SOURCES:
+        paths = sorted(flexdown.utils.get_flexdown_files(folder), reverse=True)
+        for path, document in zip(paths, load_documents(paths), strict=True):
+            title = document.metadata.get("title", "Untitled")
+            slug = re.sub(r"[\s_]+", "-", title).lower()
+            entries.append(
+                GalleryEntry(
+                    path=str(path).replace(".md", "/"),
+                    folder=folder,
+                    document=document,
+                    title=title,
+                    slug=slug,
+                    route=f"/{base_url}{slug}",
+                    image=_image_url(
+                        document.metadata,
+                        folder.startswith("reflex_build_templates"),
+                    ),
+                )
+            )
+    return GalleryIndex(entries)
+
+
+@functools.cache
+def get_gallery_index() -> GalleryIndex:
+    """Get the gallery index, building it on first use.
+
+    Returns:
+        The gallery index shared by the process.
+    """
+    return build_gallery_index()
@@ -1,7 +1,8 @@
 import reflex as rx
 
 import reflex_ui as ui
-from reflex_ui_shared.gallery.apps import gallery_apps_data
+from reflex_ui.utils.metrics import instrument
+from reflex_ui_shared.gallery.index import get_gallery_index
 
 TAGS = {
     "Category": [
@@ -22,12 +23,11 @@ TEMPLATES_FOLDER = "templates/"
 
 TEMPLATE_SUMMARIES = [
     {
-        "title": (m := doc.metadata or {}).get("title", ""),
-        "description": m.get("description", ""),
-        "tags": m.get("tags", []),
+        "title": entry.title,
+        "description": entry.document.metadata.get("description", ""),
+        "tags": entry.tags,
     }
-    for (_, folder), doc in gallery_apps_data.items()
-    if folder == TEMPLATES_FOLDER
+    for entry in get_gallery_index().by_folder[TEMPLATES_FOLDER]
 ]
 
 
@@ -37,6 +37,7 @@ class TemplatesState(rx.State):
     page: rx.Field[int] = rx.field(default=1)
 
     @rx.event
+    @instrument
     def clear_filters(self):
         self.checked_tags = set()
         self.page = 1
@@ -65,11 +66,13 @@ class TemplatesState(rx.State):
         return self.all_filtered_templates[start : start + ITEMS_PER_PAGE]
 
     @rx.event
+    @instrument
     def set_query(self, value: str):
         self.query = value
         self.page = 1
 
     @rx.event
+    @instrument
     def toggle_template(self, value: str):
         if value in self.checked_tags:
             self.checked_tags.remove(value)
@@ -78,16 +81,31 @@ class TemplatesState(rx.State):
         self.page = 1
 
     @rx.event
+    @instrument
+    def update_checked_tags(self, added: list[str], removed: list[str]):
+        self.checked_tags = (self.checked_tags | set(added)) - set(removed)
+        self.page = 1
+
+    @rx.event
+    @instrument
     def prev_page(self):
         if self.page > 1:
             self.page -= 1
 
     @rx.event
+    @instrument
     def next_page(self):
         if self.page < self.total_pages:
             self.page += 1
 
 
+checked_tags_collection = ui.batched_collection(
+    TemplatesState.update_checked_tags,
+    source=TemplatesState.checked_tags,
+    name="template_checked_tags",
+)
+
+
 def pagination() -> rx.Component:
     return rx.box(
         rx.box(
@@ -118,7 +136,7 @@ def pagination() -> rx.Component:
 def checkbox_item(text: str, value: str):
     return rx.box(
         rx.checkbox(
-            checked=TemplatesState.checked_tags.contains(value),
+            checked=checked_tags_collection.contains(value),
             color_scheme="violet",
             key=value,
             class_name="cursor-pointer",
@@ -127,7 +145,7 @@ def checkbox_item(text: str, value: str):
             text,
             class_name="text-sm font-medium text-slate-12 font-sans cursor-pointer",
         ),
-        on_click=TemplatesState.toggle_template(value),
+        on_click=checked_tags_collection.toggle(value),
         class_name="flex items-center gap-2 px-3 py-2 rounded-md bg-slate-3 hover:bg-slate-4 transition-colors cursor-pointer",
     )
 
@@ -179,7 +197,8 @@ def sidebar() -> rx.Component:
                 icon="Search01Icon",
                 placeholder="Search...",
                 class_name="w-full",
-                on_change=TemplatesState.set_query.debounce(300),
+                on_change=TemplatesState.set_query,
+                debounce_ms=300,
                 clear_button_event=TemplatesState.set_query(""),
             ),
             class_name="flex flex-col gap-2",
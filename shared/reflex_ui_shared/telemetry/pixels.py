@@ -3,24 +3,28 @@
 import reflex as rx
 
 from reflex_ui.blocks.telemetry import (
-    get_default_telemetry_script,
-    get_google_analytics_trackers,
-    get_posthog_trackers,
-    get_unify_trackers,
-    gtag_report_conversion,
+    default_telemetry_tracker,
+    get_deferred_trackers,
+    google_analytics_tracker,
+    gtag_conversion_tracker,
+    posthog_tracker,
+    unify_tracker,
 )
 
 
 def get_pixel_website_trackers() -> list[rx.Component]:
     """Get the pixel trackers for the website."""
     return [
-        *get_google_analytics_trackers(tracking_id="G-4T7C8ZD9TR"),
-        gtag_report_conversion(
-            conversion_id_and_label="AW-11360851250/ASB4COvpisIbELKqo6kq"
-        ),
-        get_unify_trackers(),
-        get_default_telemetry_script(),
-        get_posthog_trackers(
-            project_id="phc_JoMo0fOyi0GQAooY3UyO9k0hebGkMyFJrrCw1Gt5SGb"
-        ),
+        get_deferred_trackers(
+            google_analytics_tracker(tracking_id="G-4T7C8ZD9TR", priority=0),
+            gtag_conversion_tracker(
+                conversion_id_and_label="AW-11360851250/ASB4COvpisIbELKqo6kq"
+            ),
+            posthog_tracker(
+                project_id="phc_JoMo0fOyi0GQAooY3UyO9k0hebGkMyFJrrCw1Gt5SGb",
+                priority=1,
+            ),
+            unify_tracker(priority=2),
+            default_telemetry_tracker(priority=3),
+        )
     ]
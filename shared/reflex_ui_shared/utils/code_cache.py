@@ -0,0 +1,82 @@
+"""Content-addressed cache of compiled docs code.
+
+Demo and exec blocks are compiled once per source, in memory and, with a
+cache directory, as marshaled code objects on disk, so rebuilding the docs
+reuses the compiled code.
+"""
+
+import ast
+import contextlib
+import functools
+import hashlib
+import importlib.util
+import marshal
+import os
+import tempfile
+from pathlib import Path
+from types import CodeType
+
+from reflex_ui_shared.constants import DOCS_CODE_CACHE_DIR
+
+_code: dict[str, CodeType] = {}
+
+
+def _cache_path(key: str) -> Path | None:
+    if not DOCS_CODE_CACHE_DIR:
+        return None
+    # Code objects are only valid for the Python version that marshaled them.
+    return Path(DOCS_CODE_CACHE_DIR) / f"{key}-{importlib.util.MAGIC_NUMBER.hex()}"
+
+
+def compile_cached(source: str, filename: str, mode: str) -> CodeType:
+    """Compile source code, reusing the code object compiled for the same source.
+
+    Args:
+        source: The source code.
+        filename: Filename shown in tracebacks.
+        mode: `exec` or `eval`.
+
+    Returns:
+        The code object.
+    """
+    key = hashlib.sha256(f"{mode}\0{filename}\0{source}".encode()).hexdigest()
+    if (code := _code.get(key)) is not None:
+        return code
+    path = _cache_path(key)
+    if path is not None:
+        with contextlib.suppress(OSError, EOFError, ValueError, TypeError):
+            code = marshal.loads(path.read_bytes())
+    if not isinstance(code, CodeType):
+        code = compile(source, filename, mode)
+        if path is not None:
+            with contextlib.suppress(OSError):
+                path.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+                try:
+                    with os.fdopen(fd, "wb") as f:
+                        marshal.dump(code, f)
+                    Path(tmp).replace(path)
+                finally:
+                    Path(tmp).unlink(missing_ok=True)
+    _code[key] = code
+    return code
+
+
+@functools.lru_cache(maxsize=4096)
+def last_definition(source: str) -> str | None:
+    """Get the name bound last at the top level of some source code.
+
+    Args:
+        source: The source code.
+
+    Returns:
+        The name, or None if the code binds no name.
+    """
+    for node in reversed(ast.parse(source).body):
+        if isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef | ast.ClassDef):
+            return node.name
+        if isinstance(node, ast.Assign | ast.AnnAssign):
+            targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+            if isinstance(targets[-1], ast.Name):
+                return targets[-1].id
+    return None
@@ -1,8 +1,13 @@
 """Docpage utilities: TOC generation and sidebar highlight."""
 
+import dataclasses
+import hashlib
+
 import flexdown
 import mistletoe
 
+from reflex_ui_shared.utils.documents import document_cache
+
 
 def right_sidebar_item_highlight():
     return r"""
@@ -135,38 +140,94 @@ def get_headings(comp: mistletoe.block_token.BlockToken):
     return headings
 
 
-def get_toc(source: flexdown.Document, href: str, component_list: list | None = None):
+def slugify(text: str) -> str:
+    """Get the anchor id the heading components give a heading text."""
+    return text.lower().replace(" ", "-")
+
+
+@dataclasses.dataclass(frozen=True)
+class Heading:
+    """A heading of a document."""
+
+    # Level of the heading, 1 for `#`.
+    level: int
+
+    # Text of the heading.
+    text: str
+
+    # Anchor id of the heading.
+    slug: str
+
+
+@dataclasses.dataclass(frozen=True)
+class DocumentOutline:
+    """The blocks and headings of a document, from a single parse."""
+
+    # The flexdown blocks of the document, in order.
+    blocks: list[flexdown.blocks.Block]
+
+    # The headings of the document, in order.
+    headings: list[Heading]
+
+
+# Content hash and outline of the last parse, by filename.
+_outlines: dict[str, tuple[str, DocumentOutline]] = {}
+
+
+def get_outline(source: flexdown.Document, href: str) -> DocumentOutline:
+    """Parse a document into blocks and headings, again only when it changes.
+
+    The TOC and `render_document` both read this outline, so a page parses
+    its document once. Also adds the render environment to the metadata.
+
+    Args:
+        source: The document.
+        href: Filename of the document, as passed to the renderer.
+
+    Returns:
+        The outline of the document.
+    """
     from reflex_ui_shared.components.blocks.flexdown import xd
     from reflex_ui_shared.constants import REFLEX_ASSETS_CDN
 
-    component_list = component_list or []
-    component_list = component_list[1:]
-
     env = source.metadata
     env["__xd"] = xd
     env["REFLEX_ASSETS_CDN"] = REFLEX_ASSETS_CDN
 
-    doc_content = source.content
-    blocks = xd.get_blocks(doc_content, href)
+    digest = hashlib.sha256(source.content.encode()).hexdigest()
+    cached = _outlines.get(href)
+    if cached is not None and cached[0] == digest:
+        outline = cached[1]
+    else:
+        blocks = document_cache.get_blocks(source, xd, href)
+        content = "\n".join(
+            block.get_content(env)
+            for block in blocks
+            if isinstance(block, flexdown.blocks.MarkdownBlock)
+            and block.lines
+            and block.lines[0].startswith("#")
+        )
+        headings = [
+            Heading(level=level, text=text, slug=slugify(text))
+            for level, text in get_headings(mistletoe.Document(content))
+        ]
+        outline = DocumentOutline(blocks=blocks, headings=headings)
+        _outlines[href] = (digest, outline)
+    return outline
 
-    content_pieces = []
-    for block in blocks:
-        if (
-            not isinstance(block, flexdown.blocks.MarkdownBlock)
-            or len(block.lines) == 0
-            or not block.lines[0].startswith("#")
-        ):
-            continue
-        content = block.get_content(env)
-        content_pieces.append(content)
 
-    content = "\n".join(content_pieces)
-    doc = mistletoe.Document(content)
+def get_toc(source: flexdown.Document, href: str, component_list: list | None = None):
+    from reflex_ui_shared.components.blocks.flexdown import current_document
+
+    source = current_document(source, href)
+    component_list = component_list or []
+    component_list = component_list[1:]
 
-    headings = get_headings(doc)
+    headings = [
+        (heading.level, heading.text) for heading in get_outline(source, href).headings
+    ]
 
     if len(component_list):
         headings.append((1, "API Reference"))
-    for component_tuple in component_list:
-        headings.append((2, component_tuple[1]))
-    return headings, doc_content
+    headings.extend((2, component_tuple[1]) for component_tuple in component_list)
+    return headings, source.content
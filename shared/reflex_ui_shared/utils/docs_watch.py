@@ -0,0 +1,146 @@
+"""Incremental rebuild of the docs pages in dev mode.
+
+Editing a document used to restart the backend, which evaluates and compiles
+every page again. The watcher instead checks the files the rendered documents
+depend on, evaluates again only the pages showing a changed document, and
+writes their compiled files. The other pages keep their compiled output, and
+the frontend dev server reloads the rewritten pages only.
+
+Start it with `app.register_lifespan_task(docs_watch_lifespan)`. With Granian,
+add the docs folders to `REFLEX_HOT_RELOAD_EXCLUDE_PATHS`, so edits don't
+restart the backend first. Changes to Python files still need a restart.
+"""
+
+import asyncio
+import contextlib
+from collections.abc import AsyncIterator
+
+import reflex as rx
+from reflex.compiler import compiler
+from reflex.compiler import utils as compiler_utils
+from reflex.components.component import CUSTOM_COMPONENTS, StatefulComponent
+from reflex.utils import console, prerequisites
+
+from reflex_ui_shared.components.blocks.flexdown import (
+    docs_renderer,
+    incremental_build_enabled,
+)
+from reflex_ui_shared.constants import DOCS_WATCH_INTERVAL
+
+
+class DocsWatcher:
+    """Rebuilds the pages of the changed documents of an app."""
+
+    def __init__(self, app: rx.App):
+        """Create a watcher.
+
+        Args:
+            app: The app, compiled by this process.
+        """
+        self.app = app
+        # Libraries and app wraps of the compiled pages, known to the frontend.
+        self._libraries: set[str] | None = None
+        self._app_wraps: set[tuple[int, str]] = set()
+
+    def _known(self, component: rx.Component) -> bool:
+        if self._libraries is None:
+            self._libraries = set()
+            for page in self.app._pages.values():
+                self._libraries.update(page._get_all_imports())
+                self._app_wraps.update(page._get_all_app_wrap_components())
+        return (
+            component._get_all_imports().keys() <= self._libraries
+            and component._get_all_app_wrap_components().keys() <= self._app_wraps
+        )
+
+    def _write_page(self, route: str, component: rx.Component):
+        if self.app.overlay_component is not None:
+            component = self.app._add_overlay_to_component(
+                component, self.app._generate_component(self.app.overlay_component)
+            )
+        page = StatefulComponent.compile_from(component) or component
+        path, code = compiler.compile_page(route, page)
+        compiler_utils.write_file(compiler_utils.resolve_path_of_web_dir(path), code)
+        self.app._pages[route] = component
+
+    def rebuild(self) -> set[str]:
+        """Rebuild the pages of the documents changed since the last check.
+
+        Returns:
+            Routes of the rebuilt pages.
+        """
+        changed = docs_renderer.changed()
+        if not changed:
+            return set()
+        keys = docs_renderer.affected(changed)
+        # Code can't be reloaded in place, only the document files.
+        if code := sorted(changed - keys):
+            console.warn(
+                f"Restart the app to render the docs again with {', '.join(code)}."
+            )
+        routes = docs_renderer.routes(keys & changed)
+        if stateful := sorted(routes & self.app._stateful_pages.keys()):
+            console.warn(
+                f"Restart the app to rebuild {', '.join(stateful)}, their docs define states."
+            )
+
+        rebuilt = set()
+        for route in sorted(routes - set(stateful)):
+            try:
+                component = compiler.compile_unevaluated_page(
+                    route,
+                    self.app._unevaluated_pages[route],
+                    self.app.style,
+                    self.app.theme,
+                )
+            except Exception as e:
+                console.error(f"Error while rebuilding {route}: {e}")
+                continue
+            if not self._known(component):
+                console.warn(
+                    f"Restart the app to rebuild {route}, it uses new libraries."
+                )
+                continue
+            self._write_page(route, component)
+            rebuilt.add(route)
+        if rebuilt:
+            # Pages may use memo components that no page used before.
+            path, code, _ = compiler.compile_memo_components(
+                dict.fromkeys(CUSTOM_COMPONENTS.values())
+            )
+            compiler_utils.write_file(
+                compiler_utils.resolve_path_of_web_dir(path), code
+            )
+            console.info(f"Rebuilt {', '.join(sorted(rebuilt))}.")
+        return rebuilt
+
+    async def run(self, interval: float = DOCS_WATCH_INTERVAL):
+        """Rebuild the pages of changed documents until cancelled.
+
+        Args:
+            interval: Seconds between checks.
+        """
+        while True:
+            await asyncio.sleep(interval)
+            self.rebuild()
+
+
+@contextlib.asynccontextmanager
+async def docs_watch_lifespan() -> AsyncIterator[None]:
+    """Lifespan task rebuilding the pages of changed docs, in incremental mode.
+
+    Yields:
+        Nothing, while the app runs.
+    """
+    app = prerequisites.get_and_validate_app().app
+    # A backend that didn't compile the frontend has no pages to rebuild.
+    if not incremental_build_enabled() or not app._pages:
+        yield
+        return
+    task = asyncio.create_task(DocsWatcher(app).run())
+    try:
+        yield
+    finally:
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
@@ -0,0 +1,255 @@
+"""Persistent cache of parsed flexdown documents.
+
+Parsing the front matter of every markdown file dominates the cold start of
+the gallery. Parsed documents are stored in a single pickle file, keyed by
+path and validated by modification time, size and content hash, so warm
+starts skip parsing entirely. Large batches of changed files are parsed in a
+process pool. The block boundaries found when a document is first split are
+stored with it, so later runs rebuild its blocks without parsing the lines.
+"""
+
+import atexit
+import contextlib
+import dataclasses
+import hashlib
+import os
+import pickle
+import tempfile
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import flexdown
+from flexdown.flexdown import DEFAULT_BLOCKS
+
+from reflex_ui_shared.constants import (
+    DOCUMENT_CACHE_DIR,
+    DOCUMENT_PARSE_MIN_PARALLEL,
+    DOCUMENT_PARSE_WORKERS,
+)
+
+# Bump when the cached payload changes, to invalidate existing caches.
+DOCUMENT_CACHE_VERSION = 2
+
+
+@dataclasses.dataclass
+class CachedDocument:
+    mtime_ns: int
+    size: int
+    digest: str
+    # Pickled metadata and content, so every load returns fresh copies.
+    payload: bytes
+    # Block type, first line and end line of each block, by parser and content.
+    spans: dict[str, list[tuple[str, int, int]]] = dataclasses.field(
+        default_factory=dict
+    )
+
+
+def _type_name(block_type: type) -> str:
+    return f"{block_type.__module__}.{block_type.__qualname__}"
+
+
+def _parse_file(path: str) -> CachedDocument:
+    file = Path(path)
+    stat = file.stat()
+    data = file.read_bytes()
+    document = flexdown.Document.from_source(data.decode("utf-8"))
+    return CachedDocument(
+        mtime_ns=stat.st_mtime_ns,
+        size=stat.st_size,
+        digest=hashlib.sha256(data).hexdigest(),
+        payload=pickle.dumps(
+            (document.metadata, document.content), protocol=pickle.HIGHEST_PROTOCOL
+        ),
+    )
+
+
+class DocumentCache:
+    """Parsed documents stored on disk and shared by every load of a process."""
+
+    def __init__(self, directory: str | Path | None = None):
+        """Create a cache.
+
+        Args:
+            directory: Directory of the cache file. Memory only when None.
+        """
+        self.path = Path(directory) / "documents.pickle" if directory else None
+        self._entries: dict[str, CachedDocument] | None = None
+        self._dirty = False
+
+    def _load(self) -> dict[str, CachedDocument]:
+        if self._entries is None:
+            self._entries = {}
+            if self.path is not None:
+                with contextlib.suppress(Exception):
+                    version, entries = pickle.loads(self.path.read_bytes())
+                    if version == DOCUMENT_CACHE_VERSION:
+                        self._entries = entries
+        return self._entries
+
+    def _lookup(self, path: Path) -> CachedDocument | None:
+        entry = self._load().get(str(path.resolve()))
+        if entry is None:
+            return None
+        stat = path.stat()
+        if (entry.mtime_ns, entry.size) == (stat.st_mtime_ns, stat.st_size):
+            return entry
+        if entry.digest != hashlib.sha256(path.read_bytes()).hexdigest():
+            return None
+        # Touched but unchanged.
+        entry.mtime_ns = stat.st_mtime_ns
+        self._dirty = True
+        return entry
+
+    def get_many(
+        self, paths: Iterable[str | Path], workers: int | None = None
+    ) -> list[flexdown.Document]:
+        """Get parsed documents, parsing only the files that changed.
+
+        Args:
+            paths: Paths of the markdown files.
+            workers: Processes parsing the changed files. Defaults to DOCUMENT_PARSE_WORKERS.
+
+        Returns:
+            The documents, in the order of the paths.
+        """
+        paths = [Path(path) for path in paths]
+        entries = [self._lookup(path) for path in paths]
+        misses = [i for i, entry in enumerate(entries) if entry is None]
+        workers = workers or DOCUMENT_PARSE_WORKERS or os.cpu_count() or 1
+        files = [str(paths[i]) for i in misses]
+        if workers > 1 and len(misses) >= DOCUMENT_PARSE_MIN_PARALLEL:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                parsed = list(
+                    executor.map(
+                        _parse_file, files, chunksize=-(-len(files) // (workers * 4))
+                    )
+                )
+        else:
+            parsed = [_parse_file(file) for file in files]
+        for i, entry in zip(misses, parsed, strict=True):
+            entries[i] = self._load()[str(paths[i].resolve())] = entry
+            self._dirty = True
+        documents = []
+        for path, entry in zip(paths, entries, strict=True):
+            metadata, content = pickle.loads(entry.payload)  # pyright: ignore [reportOptionalMemberAccess]
+            documents.append(
+                flexdown.Document(
+                    metadata=metadata, content=content, filename=str(path)
+                )
+            )
+        return documents
+
+    def get(self, path: str | Path) -> flexdown.Document:
+        """Get a parsed document, parsing it only if the file changed.
+
+        Args:
+            path: Path of the markdown file.
+
+        Returns:
+            The document.
+        """
+        return self.get_many([path])[0]
+
+    def get_blocks(
+        self, document: flexdown.Document, parser: flexdown.Flexdown, filename: str
+    ) -> list[flexdown.blocks.Block]:
+        """Split a document into blocks, reusing the block spans of a cached file.
+
+        Equivalent to `parser.get_blocks(document.content, filename)`.
+
+        Args:
+            document: The document, loaded through the cache to reuse its spans.
+            parser: The flexdown parser.
+            filename: Filename of the blocks.
+
+        Returns:
+            The blocks of the document.
+        """
+        block_types = {
+            _type_name(block_type): block_type
+            for block_type in parser.block_types + DEFAULT_BLOCKS
+        }
+        # The blocks depend on the content and on the block types, in order.
+        key = hashlib.sha256(
+            "\0".join([document.content, *block_types]).encode()
+        ).hexdigest()
+        entry = (
+            self._load().get(str(Path(document.filename).resolve()))
+            if document.filename
+            else None
+        )
+        spans = entry.spans.get(key) if entry is not None else None
+        if spans is None:
+            blocks = list(parser.get_blocks(document.content, filename))
+            if entry is not None:
+                # Blocks are consecutive and skip leading empty lines only.
+                entry.spans = {
+                    key: [
+                        (
+                            _type_name(type(block)),
+                            block.start_line_number,
+                            block.start_line_number + len(block.lines),
+                        )
+                        for block in blocks
+                    ]
+                }
+                self._dirty = True
+            return blocks
+
+        lines = document.content.splitlines()
+        blocks = []
+        for name, start, end in spans:
+            block = block_types[name](
+                start_line_number=start,
+                component_map=parser.component_map,
+                filename=filename,
+                lines=lines[start:end],
+            )
+            if isinstance(block, flexdown.blocks.MarkdownBlock):
+                block.render_fn = parser.flexdown_memo
+            # Adds the ending indicator of a block closed by the end of the file.
+            block.finish()
+            blocks.append(block)
+        return blocks
+
+    def save(self):
+        """Write the cache file if documents were parsed since the last save."""
+        if self.path is None or not self._dirty or self._entries is None:
+            return
+        with contextlib.suppress(OSError, pickle.PicklingError):
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    pickle.dump(
+                        (DOCUMENT_CACHE_VERSION, self._entries),
+                        f,
+                        protocol=pickle.HIGHEST_PROTOCOL,
+                    )
+                Path(tmp).replace(self.path)
+                self._dirty = False
+            finally:
+                Path(tmp).unlink(missing_ok=True)
+
+
+document_cache = DocumentCache(DOCUMENT_CACHE_DIR or None)
+# Block spans are found while pages compile, after the documents are loaded.
+atexit.register(document_cache.save)
+
+
+def load_documents(
+    paths: Iterable[str | Path], workers: int | None = None
+) -> list[flexdown.Document]:
+    """Load flexdown documents through the document cache.
+
+    Args:
+        paths: Paths of the markdown files.
+        workers: Processes parsing the changed files. Defaults to DOCUMENT_PARSE_WORKERS.
+
+    Returns:
+        The documents, in the order of the paths.
+    """
+    documents = document_cache.get_many(paths, workers)
+    document_cache.save()
+    return documents
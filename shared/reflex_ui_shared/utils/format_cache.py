@@ -0,0 +1,185 @@
+"""Persistent cache of formatted docs snippets.
+
+Formatting a snippet always gives the same output for the same input and
+formatter version, so results are kept in an in-memory LRU backed by a SQLite
+store, keyed by a hash of the snippet and the formatter version.
+"""
+
+import collections
+import contextlib
+import hashlib
+import importlib.metadata
+import sqlite3
+import textwrap
+import threading
+import time
+from collections.abc import Iterable
+from pathlib import Path
+
+import ruff_format
+
+from reflex_ui_shared.constants import DOCS_FORMAT_CACHE_DIR
+
+# Maximum number of formatted snippets kept in memory.
+FORMAT_CACHE_SIZE = 4096
+
+# Seconds to wait before opening the SQLite store again after an error.
+FORMAT_CACHE_RETRY_INTERVAL = 30.0
+
+try:
+    _FORMATTER_VERSION = importlib.metadata.version("ruff-format")
+except importlib.metadata.PackageNotFoundError:
+    _FORMATTER_VERSION = "unknown"
+
+
+class FormatCache:
+    """Formatted snippets by content hash, in memory and on disk."""
+
+    def __init__(
+        self, directory: str | Path | None = None, max_size: int = FORMAT_CACHE_SIZE
+    ):
+        """Create a cache.
+
+        Args:
+            directory: Directory of the SQLite store. Memory only when None.
+            max_size: Maximum number of formatted snippets kept in memory.
+        """
+        self.path = Path(directory) / "formatted.db" if directory else None
+        self.max_size = max_size
+        self._memory: collections.OrderedDict[str, str] = collections.OrderedDict()
+        self._connection: sqlite3.Connection | None = None
+        self._retry_at = 0.0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(code: str) -> str:
+        return hashlib.sha256(f"{_FORMATTER_VERSION}\0{code}".encode()).hexdigest()
+
+    def _connect(self) -> sqlite3.Connection | None:
+        if (
+            self._connection is None
+            and self.path is not None
+            and time.monotonic() >= self._retry_at
+        ):
+            connection = None
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                connection = sqlite3.connect(self.path, check_same_thread=False)
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS formatted "
+                    "(key TEXT PRIMARY KEY, code TEXT NOT NULL)"
+                )
+            except (OSError, sqlite3.Error):
+                # Memory only until the next attempt, e.g. while the store is locked.
+                if connection is not None:
+                    connection.close()
+                self._retry_at = time.monotonic() + FORMAT_CACHE_RETRY_INTERVAL
+            else:
+                self._connection = connection
+        return self._connection
+
+    def _remember(self, key: str, formatted: str):
+        self._memory[key] = formatted
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_size:
+            self._memory.popitem(last=False)
+
+    def format_many(self, snippets: Iterable[str]) -> list[str]:
+        """Format Python snippets, formatting each distinct uncached one once.
+
+        Args:
+            snippets: The dedented snippets.
+
+        Returns:
+            The formatted snippets, in order.
+
+        Raises:
+            Exception: The error of the first invalid snippet, after the valid
+                ones are cached.
+        """
+        snippets = list(snippets)
+        keys = [self._key(code) for code in snippets]
+        with self._lock:
+            results: dict[str, str] = {}
+            for key in keys:
+                if key in self._memory:
+                    self._memory.move_to_end(key)
+                    results[key] = self._memory[key]
+            missing = [key for key in dict.fromkeys(keys) if key not in results]
+            connection = self._connect()
+            if missing and connection is not None:
+                with contextlib.suppress(sqlite3.Error):
+                    for start in range(0, len(missing), 500):
+                        chunk = missing[start : start + 500]
+                        results.update(
+                            connection.execute(
+                                "SELECT key, code FROM formatted WHERE key IN "
+                                f"({', '.join('?' * len(chunk))})",
+                                chunk,
+                            ).fetchall()
+                        )
+            uncached = {
+                key: code
+                for key, code in zip(keys, snippets, strict=True)
+                if key not in results
+            }
+            # Invalid snippets are left out, so the valid ones still get stored.
+            formatted: dict[str, str] = {}
+            error: Exception | None = None
+            for key, code in uncached.items():
+                try:
+                    formatted[key] = ruff_format.format_string(code)
+                except Exception as e:
+                    error = error or e
+            if formatted and connection is not None:
+                with contextlib.suppress(sqlite3.Error), connection:
+                    connection.executemany(
+                        "INSERT OR REPLACE INTO formatted (key, code) VALUES (?, ?)",
+                        formatted.items(),
+                    )
+            results.update(formatted)
+            for key in keys:
+                if key in results:
+                    self._remember(key, results[key])
+        if error is not None:
+            raise error
+        return [results[key] for key in keys]
+
+    def format(self, code: str) -> str:
+        """Format a Python snippet.
+
+        Args:
+            code: The dedented snippet.
+
+        Returns:
+            The formatted snippet.
+        """
+        return self.format_many([code])[0]
+
+
+format_cache = FormatCache(DOCS_FORMAT_CACHE_DIR or None)
+
+
+def format_python(code: str) -> str:
+    """Dedent and format a Python snippet through the format cache.
+
+    Args:
+        code: The snippet.
+
+    Returns:
+        The formatted snippet.
+    """
+    return format_cache.format(textwrap.dedent(code))
+
+
+def prefetch_formats(snippets: Iterable[str]):
+    """Format the Python snippets of a document in one batch.
+
+    Later `format_python` calls for these snippets are served from memory.
+    Invalid snippets are not cached, and raise when formatted on their own.
+
+    Args:
+        snippets: The snippets.
+    """
+    with contextlib.suppress(RuntimeError):
+        format_cache.format_many(textwrap.dedent(code) for code in snippets)
@@ -0,0 +1,107 @@
+"""Build-time syntax highlighting of docs snippets.
+
+Snippets known when the docs are built are tokenized once with Pygments and
+rendered to static HTML, one span per run of same-colored tokens. The spans
+are colored with the `--code-*` CSS variables, set to the One Light and One
+Dark Pro colors of the Shiki code block, so pages showing them need no
+highlighter in the browser.
+
+Pygments token types only approximate the TextMate scopes Shiki colors by.
+Function parameters and attributes after a dot stay in the foreground color,
+where Shiki colors them, and embedded languages are not highlighted.
+"""
+
+import functools
+import html
+
+from pygments.lexers import get_lexer_by_name
+from pygments.token import Comment, Keyword, Name, Number, Operator, String, Token
+from pygments.util import ClassNotFound
+
+# CSS variable coloring each token type, most specific types first.
+TOKEN_COLORS = [
+    (Comment, "--code-comment"),
+    (Keyword.Constant, "--code-constant"),
+    (Keyword, "--code-keyword"),
+    (Name.Builtin.Pseudo, "--code-variable"),
+    (Name.Builtin, "--code-builtin"),
+    (Name.Class, "--code-class"),
+    (Name.Decorator, "--code-function"),
+    (Name.Function, "--code-function"),
+    (Name.Exception, "--code-class"),
+    (Name.Tag, "--code-variable"),
+    (Name.Attribute, "--code-constant"),
+    (Name.Variable, "--code-variable"),
+    (String.Escape, "--code-builtin"),
+    # The f-string prefix and its placeholder braces and conversions.
+    (String.Affix, "--code-keyword"),
+    (String.Interpol, "--code-constant"),
+    (String, "--code-string"),
+    (Number, "--code-constant"),
+    (Operator.Word, "--code-keyword"),
+    (Operator, "--code-builtin"),
+]
+
+# Shiki language names that Pygments knows under another name.
+LANGUAGE_ALIASES = {"shellscript": "bash", "plain": "text", "log": "text"}
+
+
+def _color(token_type: tuple[str, ...]) -> str:
+    while token_type is not Token:
+        for parent, variable in TOKEN_COLORS:
+            if token_type is parent:
+                return variable
+        token_type = token_type.parent  # pyright: ignore [reportAttributeAccessIssue]
+    return "--code-foreground"
+
+
+def _style(variable: str) -> str:
+    # Comments are italic in both themes.
+    if variable == "--code-comment":
+        return f"color:var({variable});font-style:italic"
+    return f"color:var({variable})"
+
+
+@functools.lru_cache(maxsize=4096)
+def highlight(code: str, language: str) -> str:
+    """Highlight a snippet to static HTML.
+
+    Args:
+        code: The snippet.
+        language: The language of the snippet, as passed to the code block.
+
+    Returns:
+        A `pre` element with a `span.line` per line of the snippet.
+    """
+    try:
+        lexer = get_lexer_by_name(LANGUAGE_ALIASES.get(language, language))
+    except ClassNotFound:
+        lexer = get_lexer_by_name("text")
+    lexer.stripnl = False
+    lexer.ensurenl = False
+
+    # Runs of text per line, with the variable coloring them.
+    lines: list[list[tuple[str, str]]] = [[]]
+    for token_type, value in lexer.get_tokens(code):
+        # Member access dots are plain text in the Shiki themes.
+        variable = "--code-foreground" if value == "." else _color(token_type)
+        for i, part in enumerate(value.split("\n")):
+            if i:
+                lines.append([])
+            if not part:
+                continue
+            line = lines[-1]
+            if line and line[-1][0] == variable:
+                line[-1] = (variable, line[-1][1] + part)
+            else:
+                line.append((variable, part))
+    body = "\n".join(
+        '<span class="line">'
+        + "".join(
+            f'<span style="{_style(variable)}">{html.escape(text, quote=False)}</span>'
+            for variable, text in line
+        )
+        + "</span>"
+        for line in lines
+    )
+    return f'<pre class="shiki" tabindex="0"><code>{body}</code></pre>'
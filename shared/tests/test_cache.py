@@ -0,0 +1,94 @@
+import asyncio
+from pathlib import Path
+
+from reflex_ui_shared.backend.cache import StaleWhileRevalidateCache
+
+
+class Fetcher:
+    def __init__(self, *values: object, delay: float = 0):
+        self.values = list(values)
+        self.delay = delay
+        self.calls = 0
+
+    async def __call__(self) -> object:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        value = self.values.pop(0)
+        if isinstance(value, Exception):
+            raise value
+        return value
+
+
+async def _settle():
+    # Let the background refreshes finish.
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def test_fresh_entries_are_served_from_memory():
+    async def run():
+        cache = StaleWhileRevalidateCache(ttl=60)
+        fetch = Fetcher("a")
+        assert await cache.get("key", fetch) == "a"
+        assert await cache.get("key", fetch) == "a"
+        return fetch.calls
+
+    assert asyncio.run(run()) == 1
+
+
+def test_concurrent_misses_share_one_fetch():
+    async def run():
+        cache = StaleWhileRevalidateCache(ttl=60)
+        fetch = Fetcher("a", delay=0.01)
+        values = await asyncio.gather(*(cache.get("key", fetch) for _ in range(5)))
+        return values, fetch.calls
+
+    assert asyncio.run(run()) == (["a"] * 5, 1)
+
+
+def test_stale_entries_are_served_while_refreshing():
+    async def run():
+        cache = StaleWhileRevalidateCache(ttl=0)
+        fetch = Fetcher("a", "b")
+        first = await cache.get("key", fetch)
+        stale = await cache.get("key", fetch)
+        await _settle()
+        refreshed = await cache.get("key", Fetcher("c"))
+        return first, stale, refreshed
+
+    assert asyncio.run(run()) == ("a", "a", "b")
+
+
+def test_failed_refreshes_keep_the_stale_value():
+    async def run():
+        cache = StaleWhileRevalidateCache(ttl=0)
+        await cache.get("key", Fetcher("a"))
+        assert await cache.get("key", Fetcher(RuntimeError())) == "a"
+        await _settle()
+        return await cache.get("key", Fetcher(RuntimeError()))
+
+    assert asyncio.run(run()) == "a"
+
+
+def test_entries_past_max_stale_are_fetched_again():
+    async def run():
+        cache = StaleWhileRevalidateCache(ttl=0, max_stale=0)
+        await cache.get("key", Fetcher("a"))
+        return await cache.get("key", Fetcher("b"))
+
+    assert asyncio.run(run()) == "b"
+
+
+def test_entries_are_shared_through_the_directory(tmp_path: Path):
+    async def run():
+        await StaleWhileRevalidateCache(ttl=60, directory=tmp_path).get(
+            "key", Fetcher({"posts": [1]})
+        )
+        fetch = Fetcher({"posts": [2]})
+        value = await StaleWhileRevalidateCache(ttl=60, directory=tmp_path).get(
+            "key", fetch
+        )
+        return value, fetch.calls
+
+    assert asyncio.run(run()) == ({"posts": [1]}, 0)
+    assert (tmp_path / "key.json").exists()
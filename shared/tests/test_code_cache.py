@@ -0,0 +1,84 @@
+import builtins
+from pathlib import Path
+
+import pytest
+from reflex_ui_shared.utils import code_cache
+from reflex_ui_shared.utils.code_cache import compile_cached, last_definition
+
+
+@pytest.fixture
+def compiled(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    compiled = []
+
+    def compile_source(source: str, filename: str, mode: str):
+        compiled.append(source)
+        return builtins.compile(source, filename, mode)
+
+    monkeypatch.setattr(code_cache, "compile", compile_source, raising=False)
+    monkeypatch.setattr(code_cache, "_code", {})
+    monkeypatch.setattr(code_cache, "DOCS_CODE_CACHE_DIR", str(tmp_path))
+    return compiled
+
+
+def test_code_is_compiled_once(compiled: list[str]):
+    code = compile_cached("x = 1", "<demo>", "exec")
+    assert compile_cached("x = 1", "<demo>", "exec") is code
+    namespace = {}
+    exec(code, namespace)
+    assert namespace["x"] == 1
+    assert compiled == ["x = 1"]
+
+
+def test_code_is_keyed_by_filename_and_mode(compiled: list[str]):
+    compile_cached("1 + 1", "<a>", "exec")
+    compile_cached("1 + 1", "<b>", "exec")
+    assert eval(compile_cached("1 + 1", "<a>", "eval")) == 2
+    assert len(compiled) == 3
+
+
+def test_code_is_reused_from_disk(compiled: list[str], tmp_path: Path):
+    code = compile_cached("x = 1", "<demo>", "exec")
+    (path,) = tmp_path.iterdir()
+    # A new process has an empty memory cache.
+    code_cache._code.clear()
+    assert compile_cached("x = 1", "<demo>", "exec") == code
+    assert compiled == ["x = 1"]
+
+    path.write_bytes(b"corrupted")
+    code_cache._code.clear()
+    assert compile_cached("x = 1", "<demo>", "exec") == code
+    assert compiled == ["x = 1", "x = 1"]
+
+
+def test_code_is_cached_in_memory_only_without_directory(
+    compiled: list[str], tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(code_cache, "DOCS_CODE_CACHE_DIR", "")
+    compile_cached("x = 1", "<demo>", "exec")
+    compile_cached("x = 1", "<demo>", "exec")
+    assert compiled == ["x = 1"]
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_syntax_errors_are_not_cached(compiled: list[str]):
+    for _ in range(2):
+        with pytest.raises(SyntaxError):
+            compile_cached("x =", "<demo>", "exec")
+    assert compiled == ["x =", "x ="]
+
+
+@pytest.mark.parametrize(
+    ("source", "name"),
+    [
+        ("def demo():\n    pass", "demo"),
+        ("async def demo():\n    pass", "demo"),
+        ("class Demo:\n    pass\n\nx = 1", "x"),
+        ("x: int = 1\nclass Demo:\n    pass", "Demo"),
+        ("a = b = 1", "b"),
+        ("def demo():\n    pass\n\nitems[0] = 1", "demo"),
+        ("import reflex as rx\nrx.text('hi')", None),
+        ("", None),
+    ],
+)
+def test_last_definition(source: str, name: str | None):
+    assert last_definition(source) == name
@@ -0,0 +1,99 @@
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import dns.exception
+import dns.resolver
+import pytest
+from email_validator import EmailUndeliverableError
+from reflex_ui_shared.backend.deliverability import (
+    DeliverabilityChecker,
+    validate_email_address,
+)
+
+
+class Resolver:
+    """Fake DNS resolver with an MX record for the domains of `mx`."""
+
+    def __init__(self, mx: set[str], delay: float = 0, timeout: bool = False):
+        self.mx = mx
+        self.delay = delay
+        self.timeout = timeout
+        self.lookups: list[str] = []
+        self._lock = threading.Lock()
+
+    def resolve(self, domain: str, record: str):
+        if record == "MX":
+            with self._lock:
+                self.lookups.append(domain)
+            time.sleep(self.delay)
+        if self.timeout:
+            raise dns.exception.Timeout
+        if record == "MX" and domain in self.mx:
+            return [SimpleNamespace(preference=10, exchange=f"mx.{domain}.")]
+        if record == "MX" or domain in self.mx:
+            raise dns.resolver.NoAnswer
+        raise dns.resolver.NXDOMAIN
+
+
+def _check(checker: DeliverabilityChecker, *domains: str) -> list[str | None]:
+    async def run():
+        return await asyncio.gather(*(checker.check(domain) for domain in domains))
+
+    return asyncio.run(run())
+
+
+def test_deliverable_domains_are_cached():
+    resolver = Resolver({"example.com"})
+    checker = DeliverabilityChecker(dns_resolver=resolver)
+    assert _check(checker, "example.com") == [None]
+    assert _check(checker, "Example.COM") == [None]
+    assert resolver.lookups == ["example.com"]
+
+
+def test_undeliverable_domains_expire_sooner():
+    resolver = Resolver(set())
+    checker = DeliverabilityChecker(ttl=60, negative_ttl=0, dns_resolver=resolver)
+    (error,) = _check(checker, "missing.example")
+    assert error == "The domain name missing.example does not exist."
+    _check(checker, "missing.example")
+    assert resolver.lookups == ["missing.example", "missing.example"]
+
+
+def test_concurrent_checks_share_one_lookup():
+    resolver = Resolver({"example.com"}, delay=0.1)
+    checker = DeliverabilityChecker(dns_resolver=resolver)
+    assert _check(checker, "example.com", "example.com", "example.com") == [None] * 3
+    assert resolver.lookups == ["example.com"]
+
+
+@pytest.mark.parametrize(
+    ("resolver", "timeout"),
+    [(Resolver(set(), timeout=True), 5), (Resolver(set(), delay=0.2), 0.05)],
+    ids=["dns-timeout", "slow-lookup"],
+)
+def test_timeouts_let_the_email_through_uncached(resolver: Resolver, timeout: float):
+    checker = DeliverabilityChecker(timeout=timeout, dns_resolver=resolver)
+    assert _check(checker, "slow.example") == [None]
+    assert checker._cache == {}
+
+
+def test_cache_size_is_bounded():
+    resolver = Resolver({"a.com", "b.com", "c.com"})
+    checker = DeliverabilityChecker(max_size=2, dns_resolver=resolver)
+    _check(checker, "a.com")
+    _check(checker, "b.com")
+    _check(checker, "a.com")
+    _check(checker, "c.com")
+    assert list(checker._cache) == ["a.com", "c.com"]
+    checker.clear()
+    assert checker._cache == {}
+
+
+def test_validate_email_address():
+    checker = DeliverabilityChecker(dns_resolver=Resolver({"example.com"}))
+    validated = asyncio.run(validate_email_address("Ada@example.com", checker))
+    assert validated.normalized == "Ada@example.com"
+    with pytest.raises(EmailUndeliverableError, match="does not exist"):
+        asyncio.run(validate_email_address("ada@missing.example", checker))
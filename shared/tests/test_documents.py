@@ -0,0 +1,118 @@
+import os
+from pathlib import Path
+
+import flexdown
+import pytest
+from reflex_ui_shared.components.blocks.flexdown import xd
+from reflex_ui_shared.utils import documents
+from reflex_ui_shared.utils.documents import DocumentCache
+
+SOURCE = """---
+title: Hello
+---
+# Hello
+
+Some text
+more
+
+```python demo
+rx.text("hi")
+```
+
+```python exec
+x = 1
+```
+
+## Sub
+trailing"""
+
+
+@pytest.fixture
+def parsed(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    parsed = []
+
+    def parse_file(path: str):
+        parsed.append(Path(path).name)
+        return _parse_file(path)
+
+    _parse_file = documents._parse_file
+    monkeypatch.setattr(documents, "_parse_file", parse_file)
+    return parsed
+
+
+@pytest.fixture
+def doc(tmp_path: Path) -> Path:
+    path = tmp_path / "doc.md"
+    path.write_text(SOURCE)
+    return path
+
+
+def test_documents_are_parsed_once(tmp_path: Path, doc: Path, parsed: list[str]):
+    cache = DocumentCache(tmp_path / "cache")
+    document = cache.get(doc)
+    assert document.metadata == {"title": "Hello"}
+    assert document.filename == str(doc)
+    assert cache.get(doc).content == document.content
+    cache.save()
+
+    # Another process loads the documents from the cache file.
+    assert DocumentCache(tmp_path / "cache").get(doc).content == document.content
+    assert parsed == ["doc.md"]
+
+
+def test_touched_documents_are_not_parsed_again(doc: Path, parsed: list[str]):
+    cache = DocumentCache()
+    cache.get(doc)
+    stat = doc.stat()
+    os.utime(doc, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    cache.get(doc)
+    assert parsed == ["doc.md"]
+
+
+def test_changed_documents_are_parsed_again(doc: Path, parsed: list[str]):
+    cache = DocumentCache()
+    cache.get(doc)
+    doc.write_text(SOURCE.replace("Hello", "Changed"))
+    assert cache.get(doc).metadata == {"title": "Changed"}
+    assert parsed == ["doc.md", "doc.md"]
+
+
+def test_documents_keep_the_order_of_the_paths(tmp_path: Path):
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"{i}.md"
+        path.write_text(f"---\ntitle: {i}\n---\n# {i}")
+        paths.append(path)
+    cache = DocumentCache()
+    cache.get(paths[1])
+    loaded = cache.get_many(reversed(paths), workers=1)
+    assert [document.metadata["title"] for document in loaded] == [2, 1, 0]
+
+
+def _signature(blocks: list[flexdown.blocks.Block]) -> list[tuple]:
+    return [
+        (type(block), block.lines, block.start_line_number, block.filename)
+        for block in blocks
+    ]
+
+
+def test_blocks_are_rebuilt_from_the_cached_spans(tmp_path: Path, doc: Path):
+    cache = DocumentCache(tmp_path / "cache")
+    document = cache.get(doc)
+    expected = _signature(list(xd.get_blocks(document.content, "doc.md")))
+    assert _signature(cache.get_blocks(document, xd, "doc.md")) == expected
+    cache.save()
+
+    cache = DocumentCache(tmp_path / "cache")
+    document = cache.get(doc)
+    assert cache._load()[str(doc.resolve())].spans
+    assert _signature(cache.get_blocks(document, xd, "doc.md")) == expected
+
+
+def test_blocks_of_changed_documents_are_split_again(doc: Path):
+    cache = DocumentCache()
+    cache.get_blocks(cache.get(doc), xd, "doc.md")
+    doc.write_text(SOURCE.replace("## Sub\n", "```python exec\ny = 2\n```\n"))
+    document = cache.get(doc)
+    expected = _signature(list(xd.get_blocks(document.content, "doc.md")))
+    assert _signature(cache.get_blocks(document, xd, "doc.md")) == expected
@@ -0,0 +1,93 @@
+import sqlite3
+from pathlib import Path
+
+import pytest
+import ruff_format
+from reflex_ui_shared.utils import format_cache as fc
+from reflex_ui_shared.utils.format_cache import FormatCache
+
+
+@pytest.fixture
+def formatted(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    formatted = []
+
+    def format_string(code: str) -> str:
+        formatted.append(code)
+        return format_string_(code)
+
+    format_string_ = ruff_format.format_string
+    monkeypatch.setattr(ruff_format, "format_string", format_string)
+    return formatted
+
+
+def test_snippets_are_formatted_once(formatted: list[str]):
+    cache = FormatCache()
+    assert cache.format_many(["x=1", "y=2", "x=1"]) == ["x = 1\n", "y = 2\n", "x = 1\n"]
+    assert cache.format("y=2") == "y = 2\n"
+    assert formatted == ["x=1", "y=2"]
+
+
+def test_formatted_snippets_are_stored_on_disk(tmp_path: Path, formatted: list[str]):
+    FormatCache(tmp_path).format("x=1")
+    assert (tmp_path / "formatted.db").exists()
+    # Another process reads the store.
+    assert FormatCache(tmp_path).format("x=1") == "x = 1\n"
+    assert formatted == ["x=1"]
+
+
+def test_memory_is_bounded(formatted: list[str]):
+    cache = FormatCache(max_size=2)
+    for code in ["a=1", "b=1", "a=1", "c=1", "a=1", "b=1"]:
+        cache.format(code)
+    assert formatted == ["a=1", "b=1", "c=1", "b=1"]
+
+
+def test_valid_snippets_are_cached_with_invalid_ones(
+    tmp_path: Path, formatted: list[str]
+):
+    cache = FormatCache(tmp_path)
+    with pytest.raises(RuntimeError, match="Failed to format code"):
+        cache.format_many(["x=1", "x =", "y=2"])
+    assert cache.format_many(["x=1", "y=2"]) == ["x = 1\n", "y = 2\n"]
+    assert FormatCache(tmp_path).format("y=2") == "y = 2\n"
+    with pytest.raises(RuntimeError):
+        cache.format("x =")
+    assert formatted == ["x=1", "x =", "y=2", "x ="]
+
+
+def test_store_is_opened_again_after_an_error(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    attempts = []
+    connect = sqlite3.connect
+
+    def flaky_connect(*args, **kwargs):
+        attempts.append(args)
+        if len(attempts) == 1:
+            msg = "database is locked"
+            raise sqlite3.OperationalError(msg)
+        return connect(*args, **kwargs)
+
+    monkeypatch.setattr(fc.sqlite3, "connect", flaky_connect)
+    cache = FormatCache(tmp_path)
+    assert cache.format("x=1") == "x = 1\n"
+    # Memory only until the retry interval has passed.
+    assert cache.format("y=2") == "y = 2\n"
+    assert len(attempts) == 1
+    assert cache.path is not None
+
+    # The retry interval has passed.
+    cache._retry_at = 0.0
+    cache.format("z=3")
+    assert len(attempts) == 2
+    assert FormatCache(tmp_path).format_many(["z=3"]) == ["z = 3\n"]
+
+
+def test_format_python_and_prefetch(
+    monkeypatch: pytest.MonkeyPatch, formatted: list[str]
+):
+    monkeypatch.setattr(fc, "format_cache", FormatCache())
+    fc.prefetch_formats(["    x=1\n", "x =", "  y=2"])
+    assert fc.format_python("  y=2") == "y = 2\n"
+    assert fc.format_python("x=1\n") == "x = 1\n"
+    assert formatted == ["x=1\n", "x =", "y=2"]
@@ -0,0 +1,106 @@
+from pathlib import Path
+
+import flexdown
+import pytest
+from reflex_ui_shared.gallery.index import (
+    GalleryEntry,
+    GalleryIndex,
+    build_gallery_index,
+)
+from reflex_ui_shared.utils import documents
+
+
+def _entry(name: str, folder: str = "templates/", **metadata) -> GalleryEntry:
+    return GalleryEntry(
+        path=f"{folder}{name}/",
+        folder=folder,
+        document=flexdown.Document(metadata=metadata, content=""),
+        title=name.title(),
+        slug=name,
+        route=f"/{name}",
+        image=f"{name}.png",
+    )
+
+
+def _names(entries: list[GalleryEntry]) -> list[str]:
+    return [entry.slug for entry in entries]
+
+
+def test_views():
+    entries = [
+        _entry("a", tags=["ai", "data"]),
+        _entry("b", tags=["data"]),
+        _entry("c", "reflex_build_templates/"),
+        _entry("a", "reflex_build_templates/", tags=["ai"]),
+    ]
+    index = GalleryIndex(entries)
+    assert _names(index.by_folder["templates/"]) == ["a", "b"]
+    assert _names(index.by_folder["reflex_build_templates/"]) == ["c", "a"]
+    assert index.by_slug["a"] == [entries[0], entries[3]]
+    assert index.by_title["B"] == [entries[1]]
+    assert _names(index.by_tag["ai"]) == ["a", "a"]
+    assert _names(index.by_tag["data"]) == ["a", "b"]
+    assert entries[2].tags == []
+
+
+@pytest.mark.parametrize(
+    ("position", "related"),
+    [
+        (0, ["b", "c", "d"]),
+        (1, ["a", "c", "d"]),
+        (2, ["b", "d", "e"]),
+        (3, ["b", "c", "e"]),
+        (4, ["b", "c", "d"]),
+    ],
+)
+def test_related_entries_are_neighbors(position: int, related: list[str]):
+    entries = [_entry(name) for name in "abcde"]
+    index = GalleryIndex(entries)
+    entry = entries[position]
+    assert _names(index.related[entry.path, entry.folder]) == related
+
+
+def test_build_gallery_index(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(documents, "document_cache", documents.DocumentCache())
+    templates = tmp_path / "templates"
+    templates.mkdir()
+    (templates / "first.md").write_text(
+        "---\ntitle: First App\nimage: first.png\ntags: [ai]\n---\n# First"
+    )
+    (templates / "second.md").write_text("---\nimage: second.png\n---\n# Second")
+    builds = tmp_path / "reflex_build_templates"
+    builds.mkdir()
+    (builds / "build.md").write_text(
+        "---\ntitle: Build_It\nimage: build.png\nai_template: true\n---\n# Build"
+    )
+
+    index = build_gallery_index()
+    second, first, build = index.entries
+    assert (first.path, first.slug, first.route) == (
+        "templates/first/",
+        "first-app",
+        "/docs/getting-started/open-source-templates/first-app",
+    )
+    assert first.image.endswith("templates/first.png")
+    assert (second.title, second.slug) == ("Untitled", "untitled")
+    assert (build.slug, build.route) == ("build-it", "/templates/build-it")
+    assert build.image.endswith("build.png")
+    assert index.by_tag["ai"] == [first]
+
+
+def test_similar_entries_share_tags_and_integrations():
+    entries = [
+        _entry("a", tags=["ai", "data"]),
+        _entry("b", tags=["data"]),
+        _entry("c", tags=["ai"], integrations=["openai"]),
+        _entry("d"),
+        _entry("e", tags=["ai", "data"]),
+        _entry("f", "reflex_build_templates/", tags=["ai", "data"]),
+    ]
+    index = GalleryIndex(entries)
+    assert _names(index.similar(entries[0])) == ["e", "b", "c"]
+    assert _names(index.similar(entries[3])) == ["c", "e", "b"]
+    assert _names(index.similar(entries[5])) == []
+    # Computed once per entry.
+    assert index.similar(entries[0]) is index.similar(entries[0])
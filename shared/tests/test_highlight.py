@@ -0,0 +1,88 @@
+import html
+import re
+
+import pytest
+from reflex_ui_shared.utils.highlight import highlight
+
+PRE = '<pre class="shiki" tabindex="0"><code>'
+
+
+def _lines(code: str, language: str = "python") -> list[list[tuple[str, str]]]:
+    output = highlight(code, language)
+    assert output.startswith(PRE)
+    assert output.endswith("</code></pre>")
+    body = output.removeprefix(PRE).removesuffix("</code></pre>")
+    lines = []
+    for line in body.split("\n"):
+        assert line.startswith('<span class="line">')
+        lines.append(
+            [
+                (variable, html.unescape(text))
+                for variable, text in re.findall(
+                    r'<span style="color:var\((--code-[a-z]+)\)[^"]*">([^<]*)</span>',
+                    line,
+                )
+            ]
+        )
+    return lines
+
+
+def test_tokens_are_colored():
+    assert _lines("def demo(x):\n    return x") == [
+        [
+            ("--code-keyword", "def"),
+            ("--code-foreground", " "),
+            ("--code-function", "demo"),
+            ("--code-foreground", "(x):"),
+        ],
+        [
+            ("--code-foreground", "    "),
+            ("--code-keyword", "return"),
+            ("--code-foreground", " x"),
+        ],
+    ]
+
+
+def test_comments_are_italic():
+    assert (
+        '<span style="color:var(--code-comment);font-style:italic"># note</span>'
+        in highlight("# note", "python")
+    )
+
+
+def test_member_access_and_fstrings():
+    (line,) = _lines('rx.text(f"<{x!r}>")')
+    assert line == [
+        ("--code-foreground", "rx.text("),
+        ("--code-keyword", "f"),
+        ("--code-string", '"<'),
+        ("--code-constant", "{"),
+        ("--code-foreground", "x"),
+        ("--code-constant", "!r}"),
+        ("--code-string", '>"'),
+        ("--code-foreground", ")"),
+    ]
+
+
+def test_text_is_escaped():
+    assert "a &lt; b &amp;&amp; c" in highlight("a < b && c", "text")
+
+
+def test_every_line_is_kept():
+    assert _lines("a\n\nb\n", "text") == [
+        [("--code-foreground", "a")],
+        [],
+        [("--code-foreground", "b")],
+        [],
+    ]
+
+
+@pytest.mark.parametrize(
+    ("language", "line"),
+    [
+        ("shellscript", [("--code-builtin", "echo"), ("--code-foreground", " hi")]),
+        ("unknown", [("--code-foreground", "echo hi")]),
+    ],
+)
+def test_languages(language: str, line: list[tuple[str, str]]):
+    assert _lines("echo hi", language) == [line]
@@ -0,0 +1,179 @@
+import asyncio
+import logging
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import httpx
+import pytest
+from reflex_ui_shared.backend.outbox import (
+    Outbox,
+    PermanentDeliveryError,
+    raise_for_delivery,
+)
+
+
+async def _wait_until(predicate: Callable[[], object], limit: float = 5):
+    deadline = time.monotonic() + limit
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out"
+        await asyncio.sleep(0.01)
+
+
+@pytest.fixture
+def outbox(tmp_path: Path) -> Outbox:
+    return Outbox(tmp_path / "outbox.db", backoff=0.01, max_attempts=3)
+
+
+def test_emails_are_delivered_once_per_target(outbox: Outbox):
+    delivered = []
+
+    @outbox.target("crm")
+    async def crm(email: str):
+        delivered.append(("crm", email))
+
+    @outbox.target("newsletter")
+    async def newsletter(email: str):
+        delivered.append(("newsletter", email))
+
+    async def run():
+        added = await outbox.enqueue("a@example.com")
+        await _wait_until(lambda: len(delivered) == 2)
+        again = await outbox.enqueue("a@example.com")
+        await asyncio.sleep(0.05)
+        await outbox.stop()
+        return added, again
+
+    assert asyncio.run(run()) == (2, 0)
+    assert sorted(delivered) == [
+        ("crm", "a@example.com"),
+        ("newsletter", "a@example.com"),
+    ]
+
+
+def test_failures_are_retried(outbox: Outbox):
+    attempts = []
+
+    @outbox.target("crm")
+    async def crm(email: str):
+        attempts.append(email)
+        if len(attempts) < 3:
+            msg = "down"
+            raise httpx.ConnectError(msg)
+
+    async def run():
+        await outbox.enqueue("a@example.com")
+        await _wait_until(lambda: len(attempts) == 3)
+        await outbox.stop()
+
+    asyncio.run(run())
+    assert outbox.dead_letters() == []
+
+
+def test_permanent_failures_are_dead_lettered(
+    outbox: Outbox, caplog: pytest.LogCaptureFixture
+):
+    attempts = []
+
+    @outbox.target("crm")
+    async def crm(email: str):
+        attempts.append(email)
+        msg = "400 Bad Request"
+        raise PermanentDeliveryError(msg)
+
+    async def run():
+        await outbox.enqueue("a@example.com")
+        await _wait_until(outbox.dead_letters)
+        await outbox.stop()
+
+    with caplog.at_level(logging.ERROR, logger="reflex_ui_shared.outbox"):
+        asyncio.run(run())
+    (dead,) = outbox.dead_letters()
+    assert (dead["email"], dead["attempts"]) == ("a@example.com", 1)
+    assert dead["last_error"] == "PermanentDeliveryError: 400 Bad Request"
+    assert attempts == ["a@example.com"]
+    # Logs reference the delivery, not the email.
+    assert "dead_letter" in caplog.text
+    assert "a@example.com" not in caplog.text
+
+
+def test_deliveries_are_dead_lettered_after_max_attempts(outbox: Outbox):
+    @outbox.target("crm")
+    async def crm(email: str):
+        msg = "down"
+        raise httpx.ConnectError(msg)
+
+    async def run():
+        await outbox.enqueue("a@example.com")
+        await _wait_until(outbox.dead_letters)
+        await outbox.stop()
+
+    asyncio.run(run())
+    (dead,) = outbox.dead_letters()
+    assert dead["attempts"] == 3
+
+
+def test_dead_letters_can_be_retried(outbox: Outbox):
+    delivered = []
+
+    async def run():
+        await outbox.enqueue("a@example.com", "crm")
+        await _wait_until(outbox.dead_letters)
+
+        @outbox.target("crm")
+        async def crm(email: str):
+            delivered.append(email)
+
+        assert outbox.retry_dead_letters() == 1
+        outbox.start()
+        await _wait_until(lambda: delivered)
+        await outbox.stop()
+
+    asyncio.run(run())
+    assert delivered == ["a@example.com"]
+
+
+def test_pending_deliveries_survive_a_restart(tmp_path: Path):
+    delivered = []
+
+    async def enqueue():
+        first = Outbox(tmp_path / "outbox.db")
+        await first.enqueue("a@example.com", "crm")
+        await first.stop()
+
+    async def resume():
+        second = Outbox(tmp_path / "outbox.db")
+
+        @second.target("crm")
+        async def crm(email: str):
+            delivered.append(email)
+
+        second.start()
+        await _wait_until(lambda: delivered)
+        await second.stop()
+
+    asyncio.run(enqueue())
+    asyncio.run(resume())
+    assert delivered == ["a@example.com"]
+
+
+@pytest.mark.parametrize(
+    ("status_code", "error"),
+    [
+        (200, None),
+        (400, PermanentDeliveryError),
+        (404, PermanentDeliveryError),
+        (408, httpx.HTTPStatusError),
+        (429, httpx.HTTPStatusError),
+        (503, httpx.HTTPStatusError),
+    ],
+)
+def test_raise_for_delivery(status_code: int, error: type[Exception] | None):
+    response = httpx.Response(
+        status_code, request=httpx.Request("POST", "https://example.com")
+    )
+    if error is None:
+        raise_for_delivery(response)
+    else:
+        with pytest.raises(error):
+            raise_for_delivery(response)
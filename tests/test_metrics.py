@@ -0,0 +1,117 @@
+import asyncio
+
+import pytest
+from starlette.testclient import TestClient
+
+from reflex_ui.utils.metrics import MetricsRegistry, instrument, metrics_api
+
+
+@pytest.fixture
+def metrics() -> MetricsRegistry:
+    return MetricsRegistry(buckets=(0.1, 1.0))
+
+
+def test_finish_records_the_bucket_and_errors(metrics: MetricsRegistry):
+    metrics.start("handler")
+    metrics.start("handler")
+    metrics.finish("handler", 0.05)
+    metrics.finish("handler", 0.5, ValueError())
+
+    recorded = metrics.snapshot()["handler"]
+    assert recorded.buckets == [1, 1, 0]
+    assert recorded.count == 2
+    assert recorded.total == pytest.approx(0.55)
+    assert recorded.errors == 1
+    assert recorded.in_flight == 0
+
+
+def test_snapshot_is_a_copy(metrics: MetricsRegistry):
+    metrics.start("handler")
+    snapshot = metrics.snapshot()
+    metrics.finish("handler", 0.05)
+    assert snapshot["handler"].in_flight == 1
+    assert snapshot["handler"].buckets == [0, 0, 0]
+
+
+def test_instrument_plain_handler(metrics: MetricsRegistry):
+    @instrument(name="plain", metrics=metrics)
+    def handler(value: int) -> int:
+        return value * 2
+
+    assert handler(2) == 4
+    assert metrics.snapshot()["plain"].count == 1
+
+
+def test_instrument_records_errors(metrics: MetricsRegistry):
+    @instrument(name="failing", metrics=metrics)
+    def handler():
+        raise RuntimeError
+
+    with pytest.raises(RuntimeError):
+        handler()
+    recorded = metrics.snapshot()["failing"]
+    assert (recorded.count, recorded.errors, recorded.in_flight) == (1, 1, 0)
+
+
+def test_instrument_generator_until_exhausted(metrics: MetricsRegistry):
+    @instrument(name="generator", metrics=metrics)
+    def handler():
+        yield 1
+        yield 2
+
+    updates = handler()
+    assert next(updates) == 1
+    assert metrics.snapshot()["generator"].in_flight == 1
+    assert list(updates) == [2]
+    recorded = metrics.snapshot()["generator"]
+    assert (recorded.count, recorded.in_flight) == (1, 0)
+
+
+def test_instrument_async_handlers(metrics: MetricsRegistry):
+    @instrument(name="coroutine", metrics=metrics)
+    async def coroutine() -> str:
+        return "done"
+
+    @instrument(name="async_generator", metrics=metrics)
+    async def async_generator():
+        yield 1
+        yield 2
+
+    async def run() -> tuple[str, list[int]]:
+        return await coroutine(), [update async for update in async_generator()]
+
+    assert asyncio.run(run()) == ("done", [1, 2])
+    snapshot = metrics.snapshot()
+    assert snapshot["coroutine"].count == 1
+    assert snapshot["async_generator"].count == 1
+
+
+def test_instrument_defaults_to_the_qualified_name(metrics: MetricsRegistry):
+    @instrument(metrics=metrics)
+    def handler():
+        pass
+
+    handler()
+    assert list(metrics.snapshot()) == [handler.__qualname__]
+
+
+def test_render_prometheus(metrics: MetricsRegistry):
+    metrics.start('say "hi"')
+    metrics.finish('say "hi"', 0.5, ValueError())
+
+    text = metrics.render_prometheus()
+    label = 'handler="say \\"hi\\""'
+    assert f'reflex_ui_handler_duration_seconds_bucket{{{label},le="0.1"}} 0' in text
+    assert f'reflex_ui_handler_duration_seconds_bucket{{{label},le="1.0"}} 1' in text
+    assert f'reflex_ui_handler_duration_seconds_bucket{{{label},le="+Inf"}} 1' in text
+    assert f"reflex_ui_handler_duration_seconds_count{{{label}}} 1" in text
+    assert f"reflex_ui_handler_errors_total{{{label}}} 1" in text
+    assert f"reflex_ui_handler_in_flight{{{label}}} 0" in text
+
+
+def test_metrics_api(metrics: MetricsRegistry):
+    metrics.start("handler")
+    response = TestClient(metrics_api(metrics=metrics)).get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert 'reflex_ui_handler_in_flight{handler="handler"} 1' in response.text
@@ -0,0 +1,42 @@
+import pytest
+from starlette.testclient import TestClient
+
+from reflex_ui.blocks.telemetry.web_vitals import web_vitals_api
+
+
+@pytest.fixture
+def client() -> TestClient:
+    return TestClient(web_vitals_api())
+
+
+def test_collect_and_summarize(client: TestClient):
+    reports = [
+        {"metric": "LCP", "value": value, "slot": "hero", "path": "/"}
+        for value in (100, 200, 300, 400)
+    ]
+    response = client.post("/_web_vitals", json={"reports": reports})
+    assert response.status_code == 204
+
+    summary = client.get("/_web_vitals").json()
+    assert summary == [
+        {"path": "/", "metric": "LCP", "slot": "hero", "count": 4, "p75": 325.0}
+    ]
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        "not json",
+        "[]",
+        '{"reports": {}}',
+        '{"reports": [1]}',
+        '{"reports": [{"metric": "CLS"}]}',
+        '{"reports": [{"metric": "CLS", "value": "0.1"}]}',
+        '{"reports": [{"metric": "CLS", "value": true}]}',
+        '{"reports": [{"metric": "CLS", "value": NaN}]}',
+    ],
+)
+def test_malformed_batches_are_rejected(client: TestClient, body: str):
+    response = client.post("/_web_vitals", content=body)
+    assert response.status_code == 400
+    assert client.get("/_web_vitals").json() == []